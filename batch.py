@@ -0,0 +1,109 @@
+from time import perf_counter
+
+import numpy as np
+
+from board.board import Board
+from simulation import SimulationResult
+
+EMPTY, FIRST_PLAYER, SECOND_PLAYER = 0, 1, -1
+LINE_MASKS = np.array([[line >> cell & 1 for line in Board.LINES] for cell in range(9)], dtype=np.float32)
+
+
+class BatchGames:
+    """
+    Class that represents many tic-tac-toe games between two random players, played in lockstep.
+
+    The boards are held as an (N, 9) array, where every cell is EMPTY, FIRST_PLAYER or SECOND_PLAYER. Every step plays
+    one move in all the live games at once. Finished games are written back to the array and masked out of the
+    following steps.
+    """
+
+    def __init__(self, n_games, rng=None):
+        """
+        Instantiate a batch of empty games.
+
+        :param n_games: number of games in the batch
+        :type n_games: int
+        :param rng: random generator choosing the moves
+        :type rng: numpy.random.Generator
+        """
+        self.cells = np.zeros((n_games, 9), dtype=np.int8)
+        self.winners = np.zeros(n_games, dtype=np.int8)
+        self.lengths = np.zeros(n_games, dtype=np.int8)
+        self._live = np.arange(n_games)
+        self._live_cells = np.zeros((n_games, 9), dtype=np.int8)
+        self._moves = 0
+        self._rng = rng if rng is not None else np.random.default_rng()
+
+    def step(self, mark):
+        """
+        Play a random legal move of :mark: in every live game.
+
+        :param mark: FIRST_PLAYER or SECOND_PLAYER
+        :type mark: int
+        :return: whether there are live games left
+        :rtype: bool
+        """
+        live, cells = self._live, self._live_cells
+        keys = self._rng.random(cells.shape, dtype=np.float32)
+        keys += 1  # so an empty cell never ties with the zeroed filled ones
+        keys *= cells == EMPTY
+        cells[np.arange(len(live)), keys.argmax(axis=1)] = mark
+        self._moves += 1
+
+        won = ((cells.astype(np.float32) @ LINE_MASKS) == 3 * mark).any(axis=1)
+        if self._moves == 9:
+            finished = np.ones(len(live), dtype=bool)
+        else:
+            finished = won
+        if finished.any():
+            done = live[finished]
+            self.cells[done] = cells[finished]
+            self.winners[live[won]] = mark
+            self.lengths[done] = self._moves
+            self._live, self._live_cells = live[~finished], cells[~finished]
+        return len(self._live) > 0
+
+    def play(self):
+        """Play all the games until they are finished."""
+        for mark in (FIRST_PLAYER, SECOND_PLAYER) * 5:
+            if not self.step(mark):
+                return
+
+    def result(self):
+        """
+        :return: the aggregated results of the games
+        :rtype: SimulationResult
+        """
+        result = SimulationResult()
+        result.wins = int((self.winners == FIRST_PLAYER).sum())
+        result.losses = int((self.winners == SECOND_PLAYER).sum())
+        result.draws = len(self.winners) - result.wins - result.losses
+        for length, count in enumerate(np.bincount(self.lengths)):
+            if count:
+                result.game_lengths[length] = int(count)
+        return result
+
+
+def simulate_random(n_games, batch_size=100000, seed=None):
+    """
+    Play games between two random players in lockstep batches.
+
+    :param n_games: number of games to play
+    :type n_games: int
+    :param batch_size: number of games played at once
+    :type batch_size: int
+    :param seed: seed of the random generator
+    :type seed: int
+    :return: the aggregated results of the games
+    :rtype: SimulationResult
+    """
+    rng = np.random.default_rng(seed)
+    result = SimulationResult()
+    start = perf_counter()
+    for batch_start in range(0, n_games, batch_size):
+        games = BatchGames(min(batch_size, n_games - batch_start), rng)
+        games.play()
+        result.merge(games.result())
+    result.elapsed = perf_counter() - start
+    return result
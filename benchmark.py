@@ -0,0 +1,283 @@
+import json
+import platform
+import random
+import sys
+from argparse import ArgumentParser
+from array import array
+from collections import defaultdict
+from datetime import datetime, timezone
+from itertools import cycle
+from os import cpu_count
+from timeit import repeat
+
+from board.board import Board
+from game import Game
+from players import AI, RandomComputer
+from simulation import simulate
+
+PHASES = (('opening', range(0, 3)), ('middle', range(3, 6)), ('endgame', range(6, 9)))
+
+
+def main(arguments=None):
+    """
+    Run the benchmark suite, save its results and compare them against a baseline.
+
+    :param arguments: command line arguments, sys.argv by default
+    :type arguments: list[str]
+    :return: exit code, 1 if a benchmark regressed compared to the baseline
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Benchmark the board, the players and complete games.')
+    parser.add_argument('--output', help='path of the JSON file to save the results to')
+    parser.add_argument('--baseline', help='path of a JSON file of results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown that counts as a regression (default: 0.1, which is 10%%)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated positions')
+    parser.add_argument('--repeat', type=int, default=5, help='number of times every benchmark is timed')
+    arguments = parser.parse_args(arguments)
+
+    results = run(arguments.seed, arguments.repeat)
+    for name, result in results['benchmarks'].items():
+        print(f"{name:40} {result['seconds_per_call'] * 1e6:12.3f} us")
+    if arguments.output:
+        with open(arguments.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), arguments.threshold)
+        for name, ratio in regressions.items():
+            print(f'Regression: {name} is {ratio:.2f} times slower than the baseline')
+        return 1 if regressions else 0
+    return 0
+
+
+def run(seed=0, repeats=5):
+    """
+    Run all the benchmarks.
+
+    :param seed: seed of the generated positions
+    :type seed: int
+    :param repeats: number of times every benchmark is timed, the fastest time is kept
+    :type repeats: int
+    :return: the results and the metadata of the machine
+    :rtype: dict
+    """
+    random.seed(seed)
+    games = generate_games(300)
+    positions = [(_board_after(moves[:number]), moves[:number]) for moves in games for number in range(len(moves))]
+    benchmarks = dict()
+
+    benchmarks['board.move'] = _time(lambda: _replay(games), sum(map(len, games)), repeats)
+
+    for phase, numbers_of_moves in PHASES:
+        boards = [board for board, moves in positions if len(moves) in numbers_of_moves]
+        benchmarks[f'ai.turn[{phase}]'] = _time_turns(AI, boards, repeats)
+        benchmarks[f'random_computer.turn[{phase}]'] = _time_turns(RandomComputer, boards, repeats)
+
+    boards = [board for board, _ in positions]
+    benchmarks['ai.turn_many'] = _time_turn_many(AI, boards, repeats)
+    benchmarks['random_computer.turn_many'] = _time_turn_many(RandomComputer, boards, repeats)
+
+    for rule, boards in group_by_rule(positions).items():
+        benchmarks[f'ai.rule[{rule}]'] = _time_rule(rule, boards, repeats)
+
+    for player_x_type, player_o_type in ((AI, RandomComputer), (RandomComputer, AI),
+                                         (RandomComputer, RandomComputer)):
+        name = f'game[{player_x_type.__name__}-{player_o_type.__name__}]'
+        benchmarks[name] = _time(lambda: simulate(player_x_type, player_o_type, 100), 100, repeats)
+
+    return {'metadata': metadata(seed), 'benchmarks': benchmarks}
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Return the benchmarks that are slower than the baseline by more than the threshold.
+
+    :param results: results of the current run
+    :type results: dict
+    :param baseline: results to compare against
+    :type baseline: dict
+    :param threshold: relative slowdown that counts as a regression
+    :type threshold: float
+    :return: how many times slower every regressed benchmark is, by name
+    :rtype: dict
+    """
+    regressions = dict()
+    for name, result in results['benchmarks'].items():
+        if name in baseline['benchmarks']:
+            ratio = result['seconds_per_call'] / baseline['benchmarks'][name]['seconds_per_call']
+            if ratio > 1 + threshold:
+                regressions[name] = ratio
+    return regressions
+
+
+def metadata(seed):
+    """
+    :param seed: seed of the generated positions
+    :type seed: int
+    :return: description of the machine and the run
+    :rtype: dict
+    """
+    return {'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': cpu_count(),
+            'seed': seed}
+
+
+def generate_games(n_games):
+    """
+    Generate the moves of games between random players.
+
+    :param n_games: number of games to generate
+    :type n_games: int
+    :return: moves of every game, played alternately by the players, starting with player X
+    :rtype: list[tuple]
+    """
+    games = list()
+    game = Game(RandomComputer, RandomComputer)
+    for _ in range(n_games):
+        board, moves = Board(), list()
+        for player in cycle((game.player_x, game.player_o)):
+            row, column = player.turn(board)
+            moves.append((row, column))
+            if board.move(player.mark, row, column) or board.is_full():
+                break
+        games.append(tuple(moves))
+    return games
+
+
+def group_by_rule(positions):
+    """
+    Group positions by the first rule of the AI's rule list that answers them.
+
+    The perfect-play move table answers every position that can be reached in a game, so it is skipped.
+
+    :param positions: positions as boards and the moves that led to them
+    :type positions: list[tuple]
+    :return: boards of the positions, by name of the rule
+    :rtype: dict
+    """
+    groups = defaultdict(list)
+    for board, moves in positions:
+        ai = AI(_mark_to_move(moves))
+        representation = board.representation()
+        for rule in AI.moves[1:]:
+            if rule(ai, representation):
+                groups[rule.__name__].append(board)
+                break
+    return dict(groups)
+
+
+def _board_after(moves):
+    """
+    :param moves: moves played alternately by the players, starting with player X
+    :type moves: list[tuple]
+    :return: a board after the moves
+    :rtype: Board
+    """
+    board = Board()
+    for player, (row, column) in zip(cycle((Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK)), moves):
+        board.move(player, row, column)
+    return board
+
+
+def _mark_to_move(moves):
+    """
+    :param moves: moves played so far
+    :type moves: tuple
+    :return: mark of the player whose turn it is
+    :rtype: str
+    """
+    return Game.SECOND_PLAYER_MARK if len(moves) % 2 else Game.FIRST_PLAYER_MARK
+
+
+def _replay(games):
+    """
+    Play the moves of games on a reused board.
+
+    :param games: moves of every game, played alternately by the players, starting with player X
+    :type games: list[tuple]
+    """
+    board = Board()
+    marks = (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK)
+    for moves in games:
+        board.clear()
+        for number, (row, column) in enumerate(moves):
+            board.move(marks[number % 2], row, column)
+
+
+def _time_turns(player_type, boards, repeats):
+    """
+    :param player_type: type of the player making the turns
+    :type player_type: Player
+    :param boards: boards to make a turn on
+    :type boards: list[Board]
+    :param repeats: number of times the benchmark is timed
+    :type repeats: int
+    :return: result of the benchmark
+    :rtype: dict
+    """
+    turns = [(player_type(_mark_to_move(range(board.number_of_moves))).turn, board.representation())
+             for board in boards]
+    return _time(lambda: [turn(representation) for turn, representation in turns], len(turns), repeats)
+
+
+def _time_turn_many(player_type, boards, repeats):
+    """
+    :param player_type: type of the player making the turns
+    :type player_type: Player
+    :param boards: boards to make a turn on, in one batch for every player
+    :type boards: list[Board]
+    :param repeats: number of times the benchmark is timed
+    :type repeats: int
+    :return: result of the benchmark
+    :rtype: dict
+    """
+    batches = defaultdict(lambda: array('I'))
+    for board in boards:
+        batches[_mark_to_move(range(board.number_of_moves))].append(
+            board.bitboard(Game.FIRST_PLAYER_MARK) | board.bitboard(Game.SECOND_PLAYER_MARK) << 9)
+    turns = [(player_type(mark).turn_many, positions) for mark, positions in batches.items()]
+    for turn_many, positions in turns:  # build the tables before timing
+        turn_many(positions[:1])
+    return _time(lambda: [turn_many(positions) for turn_many, positions in turns], len(boards), repeats)
+
+
+def _time_rule(rule_name, boards, repeats):
+    """
+    :param rule_name: name of the AI rule
+    :type rule_name: str
+    :param boards: boards the rule answers
+    :type boards: list[Board]
+    :param repeats: number of times the benchmark is timed
+    :type repeats: int
+    :return: result of the benchmark
+    :rtype: dict
+    """
+    calls = [(getattr(AI(_mark_to_move(range(board.number_of_moves))), rule_name), board.representation())
+             for board in boards]
+    return _time(lambda: [rule(representation) for rule, representation in calls], len(calls), repeats)
+
+
+def _time(function, calls, repeats):
+    """
+    :param function: function to time
+    :type function: function
+    :param calls: number of calls measured by one run of :function:
+    :type calls: int
+    :param repeats: number of times the function is timed, the fastest time is kept
+    :type repeats: int
+    :return: result of the benchmark
+    :rtype: dict
+    """
+    best = min(repeat(function, number=1, repeat=repeats))
+    return {'seconds_per_call': best / max(calls, 1), 'calls': calls}
+
+
+if __name__ == '__main__':
+    sys.exit(main())
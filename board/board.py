@@ -1,17 +1,52 @@
-from itertools import product
+from functools import lru_cache
 
 from board.board_representation import BoardRepresentation
 
+LINES = (0b000000111, 0b000111000, 0b111000000,  # rows
+         0b001001001, 0b010010010, 0b100100100,  # columns
+         0b100010001, 0b001010100)  # main diagonal, secondary diagonal
+
 
 class Board:
-    """Class that represents a tic-tac-toe board."""
+    """
+    Class that represents an m,n,k board: m rows, n columns, and k marks in a row win.
+
+    The default board is the classic 3x3 tic-tac-toe board.
+    The marks of every player are stored as an integer (a bitboard), where bit number ``row * n + column`` is set if the
+    player has a mark in that cell.
+
+    The board also counts the marks of every player in every line of k cells. The counters are updated only for the
+    lines passing through the filled cell, and they keep track of the lines every player can still win with (open
+    lines), and of the lines that only miss one more mark (threats).
+    """
     EMPTY = ' '
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))  # row, column, main diagonal, secondary diagonal
+
+    # Lines of the classic 3x3 board, for players that only know the classic game.
+    LINES = LINES
+    CELL_LINES = tuple(tuple(line for line in LINES if line >> cell & 1) for cell in range(9))
+
+    def __init__(self, number_of_rows=3, number_of_columns=3, win_length=3):
+        """
+        Instantiate a board.
+
+        :param number_of_rows: number of rows of the board (m)
+        :type number_of_rows: int
+        :param number_of_columns: number of columns of the board (n)
+        :type number_of_columns: int
+        :param win_length: number of marks in a row needed to win (k)
+        :type win_length: int
+        """
+        if win_length > max(number_of_rows, number_of_columns):
+            raise ValueError(f'{win_length} in a row does not fit in a {number_of_rows}x{number_of_columns} board')
 
-    def __init__(self):
-        """Instantiate a tic-tac-toe board."""
-        self._rows = [[' ', ' ', ' '],
-                      [' ', ' ', ' '],
-                      [' ', ' ', ' ']]
+        self.number_of_rows = number_of_rows
+        self.number_of_columns = number_of_columns
+        self.win_length = win_length
+        self._number_of_cells = number_of_rows * number_of_columns
+        self._lines, self._cell_lines = _line_index(number_of_rows, number_of_columns, win_length)
+        self._version = 0
+        self.clear()
 
     def __str__(self):
         """
@@ -20,6 +55,19 @@ class Board:
         """
         return ''.join(' | '.join(row) + '\n' for row in self._rows)
 
+    @property
+    def _rows(self):
+        """
+        :return: the board as a list of rows, built from the bitboards
+        :rtype: list[list]
+        """
+        rows = [[self.EMPTY] * self.number_of_columns for _ in range(self.number_of_rows)]
+        for mark, bitboard in self._bitboards.items():
+            for cell in range(self._number_of_cells):
+                if bitboard >> cell & 1:
+                    rows[cell // self.number_of_columns][cell % self.number_of_columns] = mark
+        return rows
+
     @property
     def board(self):
         """
@@ -28,7 +76,50 @@ class Board:
         :return: the current board
         :rtype: list
         """
-        return self._rows[:]
+        return self._rows
+
+    @property
+    def occupied(self):
+        """
+        :return: bitboard of all the filled cells
+        :rtype: int
+        """
+        return self._occupied
+
+    @property
+    def version(self):
+        """
+        :return: number that changes whenever the board changes
+        :rtype: int
+        """
+        return self._version
+
+    @property
+    def number_of_moves(self):
+        """
+        :return: number of the filled cells
+        :rtype: int
+        """
+        return self._filled
+
+    @property
+    def moves(self):
+        """
+        :return: cells (``row * number_of_columns + column``) of the moves made since the board was cleared, in order
+        :rtype: tuple
+        """
+        return tuple(cell_number for _, cell_number, _ in self._moves)
+
+    def bitboard(self, mark):
+        """
+        Return the bitboard of a player.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: bitboard of the cells filled with :mark:
+        :rtype: int
+        """
+        return self._bitboards.get(mark, 0)
 
     def representation(self):
         """
@@ -38,7 +129,44 @@ class Board:
         :rtype: BoardRepresentation
         """
 
-        return BoardRepresentation(self._rows)
+        return BoardRepresentation(self)
+
+    @property
+    def winner(self):
+        """
+        :return: mark of the player who has completed a line, or None if no one has
+        :rtype: str
+        """
+        return self._winner
+
+    def set_position(self, rows):
+        """
+        Set up the board from a list of rows, without any moves to undo.
+
+        :param rows: the board as a list of rows, where empty cells are Board.EMPTY
+        :type rows: list[list]
+        """
+        self.clear()
+        for row_number, row in enumerate(rows):
+            for column_number, mark in enumerate(row):
+                if mark != self.EMPTY:
+                    self._insert(mark, row_number, column_number)
+
+    def copy(self):
+        """
+        :return: a board with the same position and the same moves to undo
+        :rtype: Board
+        """
+        board = type(self).__new__(type(self))
+        board.__dict__.update(self.__dict__)
+        board._bitboards = dict(self._bitboards)
+        board._line_counts = {mark: counts[:] for mark, counts in self._line_counts.items()}
+        board._line_filled = self._line_filled[:]
+        board._touched_lines = set(self._touched_lines)
+        board._pure_lines = {mark: set(lines) for mark, lines in self._pure_lines.items()}
+        board._threat_lines = {mark: set(lines) for mark, lines in self._threat_lines.items()}
+        board._moves = self._moves[:]
+        return board
 
     def move(self, player, row, column):
         """
@@ -52,8 +180,39 @@ class Board:
         :return: whether a win occurred
         :rtype: bool
         """
-        self._insert(player, row, column)
-        return self._has_win_occurred(row, column)
+        return self.make_move(player, row, column)
+
+    def make_move(self, player, row, column):
+        """
+        Make one move that can be undone with :meth:`unmake_move`, and return whether a win occurred.
+
+        :param player: current player
+        :type player: str
+        :param row: row to insert the mark into
+        :type row: int
+        :param column: column to insert the mark into
+        :type column: int
+        :return: whether a win occurred
+        :rtype: bool
+        """
+        self._moves.append((player, row * self.number_of_columns + column, self._winner))
+        return self._insert(player, row, column)
+
+    def unmake_move(self):
+        """
+        Undo the last move made, restoring the counters, the winner and the fullness of the board.
+
+        :return: the player, row and column of the undone move
+        :rtype: tuple
+        """
+        player, cell_number, self._winner = self._moves.pop()
+        cell = 1 << cell_number
+        self._bitboards[player] &= ~cell
+        self._occupied &= ~cell
+        self._filled -= 1
+        self._version += 1
+        self._uncount(player, cell_number)
+        return (player,) + divmod(cell_number, self.number_of_columns)
 
     def is_full(self):
         """
@@ -62,7 +221,7 @@ class Board:
         :return: whether the board is full
         :rtype: bool
         """
-        return all(not self.is_cell_empty(row, column) for row, column in product(range(3), range(3)))
+        return self._filled == self._number_of_cells
 
     def is_cell_empty(self, row, column):
         """
@@ -75,7 +234,56 @@ class Board:
         :return: whether a certain cell is empty
         :rtype: bool
         """
-        return self._rows[row][column] == self.EMPTY
+        return not self._occupied >> (row * self.number_of_columns + column) & 1
+
+    def legal_moves(self):
+        """
+        :return: the row and column of every empty cell
+        :rtype: list[tuple]
+        """
+        occupied, number_of_columns = self._occupied, self.number_of_columns
+        return [divmod(cell, number_of_columns) for cell in range(self._number_of_cells) if not occupied >> cell & 1]
+
+    def open_lines(self, mark):
+        """
+        Return the number of lines a player can still win with.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: number of lines without marks of other players
+        :rtype: int
+        """
+        return len(self._lines) - len(self._touched_lines) + len(self._pure_lines.get(mark, ()))
+
+    def threats(self, mark):
+        """
+        Return the cells that complete a line of a player.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: every empty cell that completes k in a row of :mark:, ordered by the lines they complete
+        :rtype: list[tuple]
+        """
+        cells = list()
+        for line in sorted(self._threat_lines.get(mark, ())):
+            cell = divmod((self._lines[line] & ~self._occupied).bit_length() - 1, self.number_of_columns)
+            if cell not in cells:
+                cells.append(cell)
+        return cells
+
+    def clear(self):
+        """Remove all the marks from the board."""
+        self._bitboards = dict()
+        self._occupied = 0
+        self._filled = 0
+        self._line_counts = dict()
+        self._line_filled = [0] * len(self._lines)
+        self._touched_lines = set()
+        self._pure_lines = dict()
+        self._threat_lines = dict()
+        self._winner = None
+        self._moves = list()
+        self._version += 1
 
     def _insert(self, player, row, column):
         """
@@ -87,32 +295,103 @@ class Board:
         :type row: int
         :param column: column the last mark has been inserted into
         :type column: int
+        :return: whether the mark has completed a line
+        :rtype: bool
         """
-        self._rows[row][column] = player
-
-    @classmethod
-    def _is_win_in_sequence(cls, sequence):
-        return cls.EMPTY not in sequence and len(set(sequence)) == 1
+        cell_number = row * self.number_of_columns + column
+        cell = 1 << cell_number
+        self._bitboards[player] = self._bitboards.get(player, 0) | cell
+        self._occupied |= cell
+        self._filled += 1
+        self._version += 1
+        won = self._count(player, cell_number)
+        if won and self._winner is None:
+            self._winner = player
+        return won
 
-    def _has_win_occurred(self, row_number, column_number):
+    def _count(self, player, cell_number):
         """
-        Return whether a win has occurred.
+        Update the counters of the lines passing through a cell that has just been filled.
 
-        :param row_number: row the last mark has been inserted into
-        :type row_number: int
-        :param column_number: column the last mark has been inserted into
-        :type column_number: int
-        :return: whether a win has occurred
+        :param player: mark that filled the cell
+        :type player: str
+        :param cell_number: number of the cell (``row * n + column``)
+        :type cell_number: int
+        :return: whether one of the lines is now full of the player's marks
         :rtype: bool
         """
-        sequences = list()
-        sequences.append(self._rows[row_number])  # row
-        sequences.append([i[column_number] for i in self._rows])  # column
-        if row_number == column_number:
-            sequences.append([self._rows[i][i]
-                              for i in range(3)])  # main diagonal
-        if row_number == 2 - column_number:
-            sequences.append([self._rows[i][2 - i]
-                              for i in range(3)])  # secondary diagonal
-
-        return any(self._is_win_in_sequence(sequence) for sequence in sequences)
+        if player not in self._line_counts:
+            self._line_counts[player] = [0] * len(self._lines)
+            self._pure_lines[player] = set()
+            self._threat_lines[player] = set()
+        counts, line_filled, threat_length = self._line_counts[player], self._line_filled, self.win_length - 1
+        pure_lines, threat_lines = self._pure_lines[player], self._threat_lines[player]
+        others = [(self._pure_lines[mark], self._threat_lines[mark]) for mark in self._pure_lines if mark != player]
+        won = False
+        for line in self._cell_lines[cell_number]:
+            counts[line] += 1
+            line_filled[line] += 1
+            self._touched_lines.add(line)
+            for other_pure_lines, other_threat_lines in others:
+                other_pure_lines.discard(line)
+                other_threat_lines.discard(line)
+            if counts[line] == line_filled[line]:
+                pure_lines.add(line)
+                if counts[line] == threat_length:
+                    threat_lines.add(line)
+                else:
+                    threat_lines.discard(line)
+                    won = won or counts[line] == self.win_length
+        return won
+
+    def _uncount(self, player, cell_number):
+        """
+        Update the counters of the lines passing through a cell that has just been emptied.
+
+        :param player: mark that has been removed from the cell
+        :type player: str
+        :param cell_number: number of the cell (``row * n + column``)
+        :type cell_number: int
+        """
+        counts, line_filled, threat_length = self._line_counts[player], self._line_filled, self.win_length - 1
+        for line in self._cell_lines[cell_number]:
+            counts[line] -= 1
+            line_filled[line] -= 1
+            if not line_filled[line]:
+                self._touched_lines.discard(line)
+            for mark, pure_lines in self._pure_lines.items():
+                mark_count = self._line_counts[mark][line]
+                if line_filled[line] and mark_count == line_filled[line]:
+                    pure_lines.add(line)
+                    if mark_count == threat_length:
+                        self._threat_lines[mark].add(line)
+                    else:
+                        self._threat_lines[mark].discard(line)
+                else:
+                    pure_lines.discard(line)
+                    self._threat_lines[mark].discard(line)
+
+
+@lru_cache(maxsize=None)
+def _line_index(number_of_rows, number_of_columns, win_length):
+    """
+    :param number_of_rows: number of rows of the board (m)
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board (n)
+    :type number_of_columns: int
+    :param win_length: number of marks in a row needed to win (k)
+    :type win_length: int
+    :return: bitmask of every line of k cells, and the indices of the lines passing through every cell
+    :rtype: tuple
+    """
+    lines = list()
+    for row_step, column_step in Board.DIRECTIONS:
+        for row in range(number_of_rows):
+            for column in range(number_of_columns):
+                last_row, last_column = row + (win_length - 1) * row_step, column + (win_length - 1) * column_step
+                if 0 <= last_row < number_of_rows and 0 <= last_column < number_of_columns:
+                    lines.append(sum(1 << ((row + i * row_step) * number_of_columns + column + i * column_step)
+                                     for i in range(win_length)))
+    cell_lines = tuple(tuple(index for index, line in enumerate(lines) if line >> cell & 1)
+                       for cell in range(number_of_rows * number_of_columns))
+    return tuple(lines), cell_lines
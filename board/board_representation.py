@@ -1,4 +1,4 @@
-from itertools import product
+from functools import lru_cache
 
 
 class BoardRepresentation:
@@ -7,22 +7,27 @@ class BoardRepresentation:
 
     This class is used for the players to get a view of the board
     without having the ability to change it on their own.
+
+    The line views (rows, columns and diagonals) are computed once per version of the board, and are thrown away when
+    the board changes. They are tuples, so they can be shared by all the callers.
     """
 
-    def __init__(self, rows):
-        """Instantiate a tic-tac-toe board representation.
+    def __init__(self, board):
+        """Instantiate a board representation.
 
-        :param rows: the current board
-        :type rows: list
+        :param board: the current board
+        :type board: Board
         """
-        self._rows = rows
+        self._board = board
+        self._version = None
+        self._views = dict()
 
     def __str__(self):
         """
         :return: a string describing the current board
         :rtype: str
         """
-        return ''.join(' | '.join(row) + '\n' for row in self._rows)
+        return str(self._board)
 
     def is_cell_empty(self, row, column):
         """
@@ -35,77 +40,243 @@ class BoardRepresentation:
         :return: whether a certain cell is empty
         :rtype: bool
         """
-        return self._rows[row][column] == ' '
+        return self._board.is_cell_empty(row, column)
+
+    @property
+    def occupied(self):
+        """
+        :return: bitboard of all the filled cells
+        :rtype: int
+        """
+        return self._board.occupied
+
+    def bitboard(self, mark):
+        """
+        Return the bitboard of a player.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: bitboard of the cells filled with :mark:
+        :rtype: int
+        """
+        return self._board.bitboard(mark)
+
+    def copy_board(self):
+        """
+        Return a copy of the board, which players may change, for example to search the game tree with
+        :meth:`Board.make_move` and :meth:`Board.unmake_move`.
+
+        :return: a copy of the current board
+        :rtype: Board
+        """
+        return self._board.copy()
+
+    def legal_moves(self):
+        """
+        :return: the row and column of every cell the player can fill
+        :rtype: list[tuple]
+        """
+        return self._board.legal_moves()
+
+    def open_lines(self, mark):
+        """
+        Return the number of lines a player can still win with.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: number of lines of k cells without marks of other players
+        :rtype: int
+        """
+        return self._board.open_lines(mark)
+
+    def threats(self, mark):
+        """
+        Return the cells that complete a line of a player.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: every empty cell that completes k in a row of :mark:, ordered by the lines they complete
+        :rtype: list[tuple]
+        """
+        return self._board.threats(mark)
+
+    @property
+    def number_of_rows(self):
+        """
+        :return: number of rows of the board (m)
+        :rtype: int
+        """
+        return self._board.number_of_rows
+
+    @property
+    def number_of_columns(self):
+        """
+        :return: number of columns of the board (n)
+        :rtype: int
+        """
+        return self._board.number_of_columns
+
+    @property
+    def win_length(self):
+        """
+        :return: number of marks in a row needed to win (k)
+        :rtype: int
+        """
+        return self._board.win_length
+
+    @property
+    def number_of_moves(self):
+        """
+        :return: number of the filled cells
+        :rtype: int
+        """
+        return self._board.number_of_moves
 
     @property
     def rows(self):
         """
         :return: rows of the board
-        :rtype: list[list]
+        :rtype: tuple[tuple]
         """
-        return self._rows
+        views = self._current_views()
+        if 'rows' not in views:
+            views['rows'] = tuple(map(tuple, self._board.board))
+        return views['rows']
 
     @property
     def columns(self):
         """
         :return: columns of the board
-        :rtype: list[list]
+        :rtype: tuple[tuple]
         """
-        columns = list()
-        for column in zip(*self._rows):
-            columns.append(list(column))
-        return columns
+        views = self._current_views()
+        if 'columns' not in views:
+            views['columns'] = tuple(zip(*self.rows))
+        return views['columns']
 
     @property
     def main_diagonal(self):
         """
         :return: main diagonal of the board.
-        :rtype: list
+        :rtype: tuple
         """
-        return [self._rows[row][row] for row in range(3)]
+        views = self._current_views()
+        if 'main_diagonal' not in views:
+            rows = self.rows
+            views['main_diagonal'] = tuple(rows[row][row]
+                                           for row in range(min(self.number_of_rows, self.number_of_columns)))
+        return views['main_diagonal']
 
     @property
     def secondary_diagonal(self):
         """
-        :return: main diagonal of the board.
-        :rtype: list
+        :return: secondary diagonal of the board.
+        :rtype: tuple
         """
-        return [self._rows[row][2 - row] for row in range(3)]
+        views = self._current_views()
+        if 'secondary_diagonal' not in views:
+            rows = self.rows
+            last_column = self.number_of_columns - 1
+            views['secondary_diagonal'] = tuple(rows[row][last_column - row]
+                                                for row in range(min(self.number_of_rows, self.number_of_columns)))
+        return views['secondary_diagonal']
 
-    @staticmethod
-    def all_sequences_coordinates():
+    def all_sequences_coordinates(self):
         """
+        Return the coordinates of all the sequences a player can win with.
+
+        Every sequence is k cells long, and they are ordered by direction: rows, columns, main diagonals and secondary
+        diagonals. The sequences only depend on the shape of the board, so they are computed once per shape.
+
         :return: all sequences coordinates in the board
-        :rtype: list[list]
+        :rtype: tuple[tuple]
         """
-        sequences = list()
-        for row_number in range(3):
-            sequences.append(list(product((row_number,), range(3))))
-        for column_number in range(3):
-            sequences.append(list(product(range(3), (column_number,))))
-        sequences.append([(row, row) for row in range(3)])
-        sequences.append([(row, 2 - row) for row in range(3)])
-        return sequences
+        return _sequences_coordinates(self.number_of_rows, self.number_of_columns, self.win_length)
 
     @property
     def corners(self):
         """
         :return: coordinates of the corners of the board
-        :rtype: list[tuple]
+        :rtype: tuple[tuple]
         """
-        return [(0, 0), (0, 2), (2, 0), (2, 2)]
+        return _corners(self.number_of_rows, self.number_of_columns)
 
     @property
     def edges(self):
         """
-        :return: coordinates of the edges of the board
-        :rtype: list[tuple]
+        :return: coordinates of the edges of the board, which are the cells on its sides that are not corners
+        :rtype: tuple[tuple]
         """
-        return [(0, 1), (1, 2), (1, 0), (2, 1)]
+        return _edges(self.number_of_rows, self.number_of_columns)
 
     def all_sequences(self):
         """
         :return: all sequences in the board
-        :rtype: list[list]
+        :rtype: tuple[tuple]
         """
-        return self.rows + self.columns + self.main_diagonal + self.secondary_diagonal
+        return self.rows + self.columns + (self.main_diagonal, self.secondary_diagonal)
+
+    def _current_views(self):
+        """
+        Return the line views of the current version of the board, dropping them if the board has changed.
+
+        :return: the line views computed so far, by name
+        :rtype: dict
+        """
+        version = self._board.version
+        if version != self._version:
+            self._version = version
+            self._views = dict()
+        return self._views
+
+
+@lru_cache(maxsize=None)
+def _sequences_coordinates(number_of_rows, number_of_columns, win_length):
+    """
+    :param number_of_rows: number of rows of the board (m)
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board (n)
+    :type number_of_columns: int
+    :param win_length: number of marks in a row needed to win (k)
+    :type win_length: int
+    :return: all sequences coordinates in a board of this shape
+    :rtype: tuple[tuple]
+    """
+    sequences = list()
+    for row_step, column_step in ((0, 1), (1, 0), (1, 1), (1, -1)):  # the same directions as Board.DIRECTIONS
+        for row in range(number_of_rows):
+            for column in range(number_of_columns):
+                last_row, last_column = row + (win_length - 1) * row_step, column + (win_length - 1) * column_step
+                if 0 <= last_row < number_of_rows and 0 <= last_column < number_of_columns:
+                    sequences.append(tuple((row + i * row_step, column + i * column_step) for i in range(win_length)))
+    return tuple(sequences)
+
+
+@lru_cache(maxsize=None)
+def _corners(number_of_rows, number_of_columns):
+    """
+    :param number_of_rows: number of rows of the board
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board
+    :type number_of_columns: int
+    :return: coordinates of the corners of a board of this shape
+    :rtype: tuple[tuple]
+    """
+    last_row, last_column = number_of_rows - 1, number_of_columns - 1
+    return (0, 0), (0, last_column), (last_row, 0), (last_row, last_column)
+
+
+@lru_cache(maxsize=None)
+def _edges(number_of_rows, number_of_columns):
+    """
+    :param number_of_rows: number of rows of the board
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board
+    :type number_of_columns: int
+    :return: coordinates of the edges of a board of this shape
+    :rtype: tuple[tuple]
+    """
+    last_row, last_column = number_of_rows - 1, number_of_columns - 1
+    return (tuple((0, column) for column in range(1, last_column)) +
+            tuple((row, column) for row in range(1, last_row) for column in (0, last_column)) +
+            tuple((last_row, column) for column in range(1, last_column)))
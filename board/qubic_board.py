@@ -0,0 +1,81 @@
+from itertools import product
+
+from board.board import Board
+from board.board_representation import BoardRepresentation
+
+SIZE = 4
+# The 13 directions of a cube, one of every pair of opposite directions, as (layer, row, column) steps.
+DIRECTIONS = tuple(direction for direction in product((-1, 0, 1), repeat=3) if direction > (0, 0, 0))
+
+
+def _lines():
+    """
+    :return: every line of 4 cells of the cube, as the (layer, row, column) of its cells
+    :rtype: tuple[tuple]
+    """
+    lines = list()
+    for direction in DIRECTIONS:
+        for start in product(range(SIZE), repeat=3):
+            cells = tuple(tuple(coordinate + i * step for coordinate, step in zip(start, direction))
+                          for i in range(SIZE))
+            if all(0 <= coordinate < SIZE for cell in cells for coordinate in cell):
+                lines.append(cells)
+    return tuple(lines)
+
+
+LINES_COORDINATES = _lines()
+LINES = tuple(sum(1 << (layer * SIZE * SIZE + row * SIZE + column) for layer, row, column in line)
+              for line in LINES_COORDINATES)
+CELL_LINES = tuple(tuple(index for index, line in enumerate(LINES) if line >> cell & 1) for cell in range(SIZE ** 3))
+# The lines in the rows and columns of the stacked layers.
+STACKED_LINES_COORDINATES = tuple(tuple((layer * SIZE + row, column) for layer, row, column in line)
+                                  for line in LINES_COORDINATES)
+
+
+class QubicBoard(Board):
+    """
+    Class that represents a 4x4x4 Qubic board: four layers of 4x4 boards, where any 4 in a row of the cube win.
+
+    The cube has 76 lines. They are listed once, with the lines passing through every cell (7 for the corners and the
+    center cells, 4 for the others), so a move only updates the counters of the lines through its cell.
+
+    The layers are stacked as a 16x4 board for the players: cell (layer, row, column) of the cube is row
+    ``layer * 4 + row`` and column ``column``, and its bit in the bitboards is ``layer * 16 + row * 4 + column``.
+    """
+
+    def __init__(self):
+        """Instantiate an empty Qubic board."""
+        super().__init__(SIZE * SIZE, SIZE, SIZE)
+        self._lines, self._cell_lines = LINES, CELL_LINES
+        self.clear()
+
+    def __str__(self):
+        """
+        :return: a string describing the current board, with the layers side by side
+        :rtype: str
+        """
+        rows = self._rows
+        return ''.join('   '.join(' | '.join(rows[layer * SIZE + row]) for layer in range(SIZE)) + '\n'
+                       for row in range(SIZE))
+
+    def representation(self):
+        """
+        Return representation of the board for a player.
+
+        :return: representation of the current board
+        :rtype: QubicBoardRepresentation
+        """
+        return QubicBoardRepresentation(self)
+
+
+class QubicBoardRepresentation(BoardRepresentation):
+    """Class that represents a read-only Qubic board for a player, with the lines of the cube."""
+
+    def all_sequences_coordinates(self):
+        """
+        Return the coordinates of every line of the cube, in the rows and columns of the stacked layers.
+
+        :return: all sequences coordinates in the board
+        :rtype: tuple[tuple]
+        """
+        return STACKED_LINES_COORDINATES
@@ -0,0 +1,90 @@
+# The classic 3x3 board has 8 symmetries: 4 rotations and 4 reflections. Every transform is a permutation of the cells
+# (``row * 3 + column``), and every bitboard of the board is transformed with a single table lookup.
+COORDINATES_TRANSFORMS = (lambda row, column: (row, column),  # identity
+                          lambda row, column: (column, 2 - row),  # rotation by 90 degrees
+                          lambda row, column: (2 - row, 2 - column),  # rotation by 180 degrees
+                          lambda row, column: (2 - column, row),  # rotation by 270 degrees
+                          lambda row, column: (row, 2 - column),  # reflection of the columns
+                          lambda row, column: (2 - row, column),  # reflection of the rows
+                          lambda row, column: (column, row),  # reflection on the main diagonal
+                          lambda row, column: (2 - column, 2 - row))  # reflection on the secondary diagonal
+
+
+def _permutation(coordinates_transform):
+    """
+    :param coordinates_transform: function transforming the row and column of a cell
+    :type coordinates_transform: function
+    :return: the image of every cell under the transform
+    :rtype: tuple
+    """
+    return tuple(row * 3 + column for row, column in (coordinates_transform(*divmod(cell, 3)) for cell in range(9)))
+
+
+def _table(permutation):
+    """
+    :param permutation: the image of every cell under a transform
+    :type permutation: tuple
+    :return: the image of every bitboard under the transform
+    :rtype: tuple
+    """
+    return tuple(sum(1 << permutation[cell] for cell in range(9) if bitboard >> cell & 1) for bitboard in range(512))
+
+
+TRANSFORMS = tuple(_permutation(coordinates_transform) for coordinates_transform in COORDINATES_TRANSFORMS)
+INVERSE_TRANSFORMS = tuple(tuple(transform.index(cell) for cell in range(9)) for transform in TRANSFORMS)
+TABLES = tuple(_table(transform) for transform in TRANSFORMS)
+
+
+def transform_bitboard(bitboard, transform):
+    """
+    :param bitboard: bitboard of the classic board
+    :type bitboard: int
+    :param transform: index of the transform in :data:`TRANSFORMS`
+    :type transform: int
+    :return: the transformed bitboard
+    :rtype: int
+    """
+    return TABLES[transform][bitboard]
+
+
+def canonical(own, other):
+    """
+    Return the canonical form of a position, which is the same for all the positions symmetrical to it.
+
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: canonical own bitboard, canonical other bitboard, and the transform from the position to them
+    :rtype: tuple
+    """
+    best_key, best_transform = None, 0
+    for transform, table in enumerate(TABLES):
+        key = table[own] | table[other] << 9
+        if best_key is None or key < best_key:
+            best_key, best_transform = key, transform
+    return best_key & 0b111111111, best_key >> 9, best_transform
+
+
+def transform_cell(cell, transform):
+    """
+    :param cell: cell (``row * 3 + column``) in the original orientation
+    :type cell: int
+    :param transform: index of the transform in :data:`TRANSFORMS`
+    :type transform: int
+    :return: the cell in the transformed orientation
+    :rtype: int
+    """
+    return TRANSFORMS[transform][cell]
+
+
+def restore_cell(cell, transform):
+    """
+    :param cell: cell (``row * 3 + column``) in the transformed orientation
+    :type cell: int
+    :param transform: index of the transform in :data:`TRANSFORMS`
+    :type transform: int
+    :return: the cell in the original orientation
+    :rtype: int
+    """
+    return INVERSE_TRANSFORMS[transform][cell]
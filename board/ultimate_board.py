@@ -0,0 +1,252 @@
+from board.board import LINES, Board
+from board.ultimate_board_representation import UltimateBoardRepresentation
+
+SIZE = 3
+ALL_BOARDS = (1 << SIZE * SIZE) - 1
+EMPTY_CELLS = tuple(tuple(cell for cell in range(SIZE * SIZE) if not occupied >> cell & 1)
+                    for occupied in range(1 << SIZE * SIZE))
+# Row and column of the ultimate board of every cell of every small board.
+COORDINATES = tuple(tuple((index // SIZE * SIZE + cell // SIZE, index % SIZE * SIZE + cell % SIZE)
+                          for cell in range(SIZE * SIZE)) for index in range(SIZE * SIZE))
+
+
+class UltimateBoard:
+    """
+    Class that represents an ultimate tic-tac-toe board: nine small boards, arranged in a macro board.
+
+    A move in a small board sends the next player to the small board at the same position in the macro board, unless
+    that board is finished, in which case the next player can play in any unfinished board. A small board is finished
+    when it is won or full. A player who wins a small board takes its cell of the macro board, and a player who
+    completes a line of the macro board wins the game.
+
+    Rows and columns run over the whole 9x9 board. The result of every small board is cached in a bitmask of the
+    finished boards, and the macro board is only updated when a small board is finished, so the legal moves are one
+    table lookup per small board.
+    """
+    EMPTY = Board.EMPTY
+    number_of_rows = number_of_columns = SIZE * SIZE
+
+    def __init__(self):
+        """Instantiate an empty ultimate board."""
+        self.boards = tuple(Board() for _ in range(SIZE * SIZE))
+        self.macro_board = Board()
+        self._version = 0
+        self.clear()
+
+    def __str__(self):
+        """
+        :return: a string describing the current board
+        :rtype: str
+        """
+        rows = self._rows
+        separator = '+'.join(['-' * (4 * SIZE - 1)] * SIZE) + '\n'
+        lines = [' ' + ' || '.join(' | '.join(row[start:start + SIZE]) for start in range(0, len(row), SIZE)) + '\n'
+                 for row in rows]
+        return separator.join(''.join(lines[start:start + SIZE]) for start in range(0, len(lines), SIZE))
+
+    @property
+    def _rows(self):
+        """
+        :return: the board as a list of rows
+        :rtype: list[list]
+        """
+        rows = [[self.EMPTY] * self.number_of_columns for _ in range(self.number_of_rows)]
+        for index, board in enumerate(self.boards):
+            for cell, mark in enumerate(mark for row in board.board for mark in row):
+                row, column = COORDINATES[index][cell]
+                rows[row][column] = mark
+        return rows
+
+    @property
+    def board(self):
+        """
+        Return a read-only property of the board.
+
+        :return: the current board
+        :rtype: list
+        """
+        return self._rows
+
+    @property
+    def version(self):
+        """
+        :return: number that changes whenever the board changes
+        :rtype: int
+        """
+        return self._version
+
+    @property
+    def number_of_moves(self):
+        """
+        :return: number of the filled cells
+        :rtype: int
+        """
+        return len(self._moves)
+
+    @property
+    def target(self):
+        """
+        :return: index (``row * 3 + column`` in the macro board) of the small board the next move has to be made in,
+                 or None if it can be made in any unfinished board
+        :rtype: int
+        """
+        return self._target
+
+    @property
+    def finished(self):
+        """
+        :return: bitmask of the finished small boards, by index
+        :rtype: int
+        """
+        return self._finished
+
+    @property
+    def winner(self):
+        """
+        :return: mark of the player who has completed a line of the macro board, or None if no one has
+        :rtype: str
+        """
+        return self.macro_board.winner
+
+    def representation(self):
+        """
+        Return representation of the board for a player.
+
+        :return: representation of the current board
+        :rtype: UltimateBoardRepresentation
+        """
+        return UltimateBoardRepresentation(self)
+
+    def copy(self):
+        """
+        :return: a board with the same position and the same moves to undo
+        :rtype: UltimateBoard
+        """
+        board = type(self).__new__(type(self))
+        board.__dict__.update(self.__dict__)
+        board.boards = tuple(small_board.copy() for small_board in self.boards)
+        board.macro_board = self.macro_board.copy()
+        board._moves = self._moves[:]
+        return board
+
+    def clear(self):
+        """Remove all the marks from the board."""
+        for board in self.boards:
+            board.clear()
+        self.macro_board.clear()
+        self._finished = 0
+        self._target = None
+        self._moves = list()
+        self._version += 1
+
+    def is_cell_empty(self, row, column):
+        """
+        Return whether a certain cell is empty.
+
+        :param row: row number of the checked cell
+        :type row: int
+        :param column: column number of the checked cell
+        :type column: int
+        :return: whether a certain cell is empty
+        :rtype: bool
+        """
+        return self.boards[row // SIZE * SIZE + column // SIZE].is_cell_empty(row % SIZE, column % SIZE)
+
+    def is_full(self):
+        """
+        Return whether the game can not go on, either because every small board is finished or because a player has
+        won.
+
+        :return: whether there are no legal moves
+        :rtype: bool
+        """
+        return self._finished == ALL_BOARDS or self.macro_board.winner is not None
+
+    def open_lines(self, mark):
+        """
+        Return the number of lines of the macro board a player can still win with.
+
+        :param mark: mark of the player
+        :type mark: str
+        :return: number of lines of the macro board without small boards won by other players or drawn
+        :rtype: int
+        """
+        won = self.macro_board.occupied
+        blocked = won & ~self.macro_board.bitboard(mark) | self._finished & ~won
+        return sum(not line & blocked for line in LINES)
+
+    def legal_moves(self):
+        """
+        :return: the row and column of every cell the next player can fill
+        :rtype: list[tuple]
+        """
+        if self.macro_board.winner is not None:
+            return list()
+        if self._target is not None:
+            indices = (self._target,)
+        else:
+            indices = [index for index in range(SIZE * SIZE) if not self._finished >> index & 1]
+        return [COORDINATES[index][cell] for index in indices for cell in EMPTY_CELLS[self.boards[index].occupied]]
+
+    def move(self, player, row, column):
+        """
+        Make one move in the game and return whether a win occurred.
+
+        :param player: current player
+        :type player: str
+        :param row: row of the ultimate board to insert the mark into
+        :type row: int
+        :param column: column of the ultimate board to insert the mark into
+        :type column: int
+        :return: whether the player has won the game
+        :rtype: bool
+        """
+        return self.make_move(player, row, column)
+
+    def make_move(self, player, row, column):
+        """
+        Make one move that can be undone with :meth:`unmake_move`, and return whether the player has won the game.
+
+        :param player: current player
+        :type player: str
+        :param row: row of the ultimate board to insert the mark into
+        :type row: int
+        :param column: column of the ultimate board to insert the mark into
+        :type column: int
+        :return: whether the player has won the game
+        :rtype: bool
+        :raise ValueError: if the move is not legal
+        """
+        index, cell = row // SIZE * SIZE + column // SIZE, row % SIZE * SIZE + column % SIZE
+        board = self.boards[index]
+        if (self._target is not None and index != self._target or self._finished >> index & 1
+                or board.occupied >> cell & 1 or self.macro_board.winner is not None):
+            raise ValueError(f'the move ({row}, {column}) is not legal')
+
+        won = board.move(player, row % SIZE, column % SIZE)
+        finished = won or board.is_full()
+        game_won = False
+        if finished:
+            self._finished |= 1 << index
+            if won:
+                game_won = self.macro_board.make_move(player, index // SIZE, index % SIZE)
+        self._moves.append((index, self._target, finished, won))
+        self._target = None if self._finished >> cell & 1 else cell
+        self._version += 1
+        return game_won
+
+    def unmake_move(self):
+        """
+        Undo the last move made, restoring the small board, the macro board and the target.
+
+        :return: the player, row and column of the undone move
+        :rtype: tuple
+        """
+        index, self._target, finished, won = self._moves.pop()
+        player, row, column = self.boards[index].unmake_move()
+        if finished:
+            self._finished &= ~(1 << index)
+            if won:
+                self.macro_board.unmake_move()
+        self._version += 1
+        return (player,) + COORDINATES[index][row * SIZE + column]
@@ -0,0 +1,118 @@
+class UltimateBoardRepresentation:
+    """
+    Class that represents a read-only ultimate board for a player.
+
+    Like :class:`board.board_representation.BoardRepresentation`, it gives players a view of the board without the
+    ability to change it on their own.
+    """
+
+    def __init__(self, board):
+        """Instantiate a board representation.
+
+        :param board: the current board
+        :type board: UltimateBoard
+        """
+        self._board = board
+
+    def __str__(self):
+        """
+        :return: a string describing the current board
+        :rtype: str
+        """
+        return str(self._board)
+
+    @property
+    def number_of_rows(self):
+        """
+        :return: number of rows of the whole board
+        :rtype: int
+        """
+        return self._board.number_of_rows
+
+    @property
+    def number_of_columns(self):
+        """
+        :return: number of columns of the whole board
+        :rtype: int
+        """
+        return self._board.number_of_columns
+
+    @property
+    def number_of_moves(self):
+        """
+        :return: number of the filled cells
+        :rtype: int
+        """
+        return self._board.number_of_moves
+
+    @property
+    def rows(self):
+        """
+        :return: the whole board as a list of rows
+        :rtype: list[list]
+        """
+        return self._board.board
+
+    @property
+    def target(self):
+        """
+        :return: index of the small board the next move has to be made in, or None if it can be made in any unfinished
+                 board
+        :rtype: int
+        """
+        return self._board.target
+
+    @property
+    def finished(self):
+        """
+        :return: bitmask of the finished small boards, by index
+        :rtype: int
+        """
+        return self._board.finished
+
+    @property
+    def macro_board(self):
+        """
+        :return: representation of the macro board, where every cell is taken by the winner of its small board
+        :rtype: BoardRepresentation
+        """
+        return self._board.macro_board.representation()
+
+    def small_board(self, index):
+        """
+        :param index: index (``row * 3 + column`` in the macro board) of a small board
+        :type index: int
+        :return: representation of the small board
+        :rtype: BoardRepresentation
+        """
+        return self._board.boards[index].representation()
+
+    def is_cell_empty(self, row, column):
+        """
+        Return whether a certain cell is empty.
+
+        :param row: row number of the checked cell
+        :type row: int
+        :param column: column number of the checked cell
+        :type column: int
+        :return: whether a certain cell is empty
+        :rtype: bool
+        """
+        return self._board.is_cell_empty(row, column)
+
+    def legal_moves(self):
+        """
+        :return: the row and column of every cell the player can fill
+        :rtype: list[tuple]
+        """
+        return self._board.legal_moves()
+
+    def copy_board(self):
+        """
+        Return a copy of the board, which players may change, for example to search the game tree with
+        :meth:`UltimateBoard.make_move` and :meth:`UltimateBoard.unmake_move`.
+
+        :return: a copy of the current board
+        :rtype: UltimateBoard
+        """
+        return self._board.copy()
@@ -0,0 +1,301 @@
+"""
+A read-only database of played games, over a file of records (see :mod:`records`) and two indexes built from it.
+
+The opening index sorts the games by their moves, so the games of any opening are a contiguous range of it. The
+position index groups the games by the canonical form of their final position (see :func:`board.symmetry.canonical`).
+Both indexes keep the number of games won by every player up to every group, so the outcomes of a query are a
+difference of two of them. An index file starts with :data:`INDEX_MAGIC`, the number of groups and the number of
+games, followed by arrays of 4 bytes unsigned integers:
+
+* the sorted keys of the groups,
+* the offsets of the groups in the games array, and the total at the end,
+* the number of games won by player X before every group, and the total at the end,
+* the number of games won by player O before every group, and the total at the end,
+* the numbers of the games in the records file, group after group, in ascending order within a group.
+
+All the files are memory-mapped and read in place, which needs a little-endian machine.
+"""
+import mmap
+import sys
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import cycle
+
+from board.symmetry import canonical
+from game import Game
+from records import MAGIC, NUMBER_OF_CELLS, OUTCOMES, RECORD_SIZE, TYPECODE, decode, read_records
+
+INDEX_MAGIC = b'TTI1'
+OPENINGS_SUFFIX = '.openings'
+POSITIONS_SUFFIX = '.positions'
+_HEADER_SIZE = len(INDEX_MAGIC) + 8
+
+
+class Outcomes(namedtuple('Outcomes', ('x_wins', 'o_wins', 'draws'))):
+    """Class that represents the outcomes of a group of games."""
+    __slots__ = ()
+
+    @property
+    def games(self):
+        """
+        :return: number of the games
+        :rtype: int
+        """
+        return self.x_wins + self.o_wins + self.draws
+
+
+def build_indexes(path):
+    """
+    Build the opening and the position indexes of a file of records, next to it.
+
+    The records are read twice as a stream, so the archive never has to fit in memory. Only the groups are kept in
+    memory, and there are at most as many of them as there are different games.
+
+    :param path: path of the file of records
+    :type path: str
+    """
+    _build_index(path, str(path) + OPENINGS_SUFFIX, _opening_key)
+    _build_index(path, str(path) + POSITIONS_SUFFIX, _position_key)
+
+
+class GameDatabase:
+    """Class that answers queries on a file of records and its indexes, see :func:`build_indexes`."""
+
+    def __init__(self, path):
+        """
+        Open the memory-mapped files of a database.
+
+        :param path: path of the file of records
+        :type path: str
+        """
+        if sys.byteorder != 'little':
+            raise NotImplementedError('the database is read in place, which needs a little-endian machine')
+        self._files, self._maps = list(), list()
+        self._records = self._open(path)[len(MAGIC):].cast(TYPECODE)
+        self._openings = _Index(self._open(str(path) + OPENINGS_SUFFIX))
+        self._positions = _Index(self._open(str(path) + POSITIONS_SUFFIX))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        """
+        :return: number of the games
+        :rtype: int
+        """
+        return len(self._records)
+
+    def game(self, number):
+        """
+        :param number: number of the game in the file of records
+        :type number: int
+        :return: cells (``row * 3 + column``) of the moves of the game in order, and the mark of the winner, or None
+                 if the game ended in a tie
+        :rtype: tuple
+        """
+        return decode(self._records[number])
+
+    def opening(self, moves):
+        """
+        :param moves: cells (``row * 3 + column``) of the first moves of the games, in order
+        :type moves: tuple
+        :return: outcomes of the games that start with the moves
+        :rtype: Outcomes
+        """
+        return self._openings.outcomes(*_opening_range(moves))
+
+    def opening_games(self, moves):
+        """
+        :param moves: cells (``row * 3 + column``) of the first moves of the games, in order
+        :type moves: tuple
+        :return: numbers of the games that start with the moves, grouped by their moves, copied out of the file
+        :rtype: array
+        """
+        return self._openings.games(*_opening_range(moves))
+
+    def final_position(self, board):
+        """
+        :param board: final position of the games, or one symmetrical to it
+        :type board: Board
+        :return: outcomes of the games that ended in the position or in one symmetrical to it
+        :rtype: Outcomes
+        """
+        key = _canonical_key(board.bitboard(Game.FIRST_PLAYER_MARK), board.bitboard(Game.SECOND_PLAYER_MARK))
+        return self._positions.outcomes(key, key + 1)
+
+    def final_position_games(self, board):
+        """
+        :param board: final position of the games, or one symmetrical to it
+        :type board: Board
+        :return: numbers of the games that ended in the position or in one symmetrical to it, in ascending order,
+                 copied out of the file
+        :rtype: array
+        """
+        key = _canonical_key(board.bitboard(Game.FIRST_PLAYER_MARK), board.bitboard(Game.SECOND_PLAYER_MARK))
+        return self._positions.games(key, key + 1)
+
+    def close(self):
+        """Close the memory-mapped files."""
+        self._openings = self._positions = self._records = None
+        for memory_map, file in zip(self._maps, self._files):
+            memory_map.close()
+            file.close()
+        self._maps, self._files = list(), list()
+
+    def _open(self, path):
+        """
+        :param path: path of a file of the database
+        :type path: str
+        :return: the memory-mapped file
+        :rtype: memoryview
+        """
+        file = open(path, 'rb')
+        self._files.append(file)
+        self._maps.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return memoryview(self._maps[-1])
+
+
+class _Index:
+    """Class that reads the arrays of an index file in place."""
+
+    def __init__(self, view):
+        """
+        :param view: the memory-mapped index file
+        :type view: memoryview
+        """
+        if view[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError('the file is not an index of games')
+        number_of_keys, number_of_games = view[len(INDEX_MAGIC):_HEADER_SIZE].cast(TYPECODE)
+        arrays = view[_HEADER_SIZE:].cast(TYPECODE)
+        self.keys = arrays[:number_of_keys]
+        groups_end = 4 * number_of_keys + 3
+        self.starts = arrays[number_of_keys:2 * number_of_keys + 1]
+        self.x_wins = arrays[2 * number_of_keys + 1:3 * number_of_keys + 2]
+        self.o_wins = arrays[3 * number_of_keys + 2:groups_end]
+        self.numbers = arrays[groups_end:groups_end + number_of_games]
+
+    def outcomes(self, low, high):
+        """
+        :param low: lowest key of the groups
+        :type low: int
+        :param high: key above the highest key of the groups
+        :type high: int
+        :return: outcomes of the games of the groups
+        :rtype: Outcomes
+        """
+        first, last = bisect_left(self.keys, low), bisect_left(self.keys, high)
+        x_wins = self.x_wins[last] - self.x_wins[first]
+        o_wins = self.o_wins[last] - self.o_wins[first]
+        return Outcomes(x_wins, o_wins, self.starts[last] - self.starts[first] - x_wins - o_wins)
+
+    def games(self, low, high):
+        """
+        :param low: lowest key of the groups
+        :type low: int
+        :param high: key above the highest key of the groups
+        :type high: int
+        :return: numbers of the games of the groups, copied, so they outlive the memory-mapped file
+        :rtype: array
+        """
+        return array(TYPECODE, self.numbers[self.starts[bisect_left(self.keys, low)]:
+                                            self.starts[bisect_left(self.keys, high)]])
+
+
+def _build_index(records_path, path, key_function):
+    """
+    :param records_path: path of the file of records
+    :type records_path: str
+    :param path: path of the index file
+    :type path: str
+    :param key_function: function computing the key of the group of a game from its moves
+    :type key_function: function
+    """
+    groups_of_records, groups, number_of_games = dict(), dict(), 0
+    for record in read_records(records_path):
+        group = groups_of_records.get(record)
+        if group is None:
+            moves, winner = decode(record)
+            group = groups_of_records[record] = key_function(moves), OUTCOMES.index(winner)
+        counts = groups.setdefault(group[0], [0, 0, 0])
+        counts[group[1]] += 1
+        number_of_games += 1
+
+    keys = sorted(groups)
+    starts, x_wins, o_wins = [0], [0], [0]
+    for key in keys:
+        draws, x, o = groups[key]
+        starts.append(starts[-1] + draws + x + o)
+        x_wins.append(x_wins[-1] + x)
+        o_wins.append(o_wins[-1] + o)
+    offsets = dict(zip(keys, starts))
+
+    with open(path, 'wb') as file:
+        file.write(INDEX_MAGIC)
+        for values in ((len(keys), number_of_games), keys, starts, x_wins, o_wins):
+            file.write(array(TYPECODE, values).tobytes())
+        file.truncate(file.tell() + RECORD_SIZE * number_of_games)
+    if not number_of_games:
+        return
+
+    with open(path, 'r+b') as file, mmap.mmap(file.fileno(), 0) as memory_map:
+        numbers = memoryview(memory_map)[-RECORD_SIZE * number_of_games:].cast(TYPECODE)
+        for number, record in enumerate(read_records(records_path)):
+            key = groups_of_records[record][0]
+            numbers[offsets[key]] = number
+            offsets[key] += 1
+        numbers.release()
+
+
+def _opening_key(moves):
+    """
+    :param moves: cells (``row * 3 + column``) of moves, in order
+    :type moves: tuple
+    :return: the moves as the digits of a decimal number, from 1 for the first cell, padded with zeros to 9 digits,
+             so the keys sort like the moves
+    :rtype: int
+    """
+    key = 0
+    for cell in moves:
+        key = key * 10 + cell + 1
+    return key * 10 ** (NUMBER_OF_CELLS - len(moves))
+
+
+def _opening_range(moves):
+    """
+    :param moves: cells (``row * 3 + column``) of the first moves of games, in order
+    :type moves: tuple
+    :return: the lowest key of the games that start with the moves, and the key above the highest one
+    :rtype: tuple
+    """
+    low = _opening_key(moves)
+    return low, low + 10 ** (NUMBER_OF_CELLS - len(moves))
+
+
+def _position_key(moves):
+    """
+    :param moves: cells (``row * 3 + column``) of the moves of a game, in order
+    :type moves: tuple
+    :return: key of the canonical final position of the game
+    :rtype: int
+    """
+    bitboards = [0, 0]
+    for player, cell in zip(cycle((0, 1)), moves):
+        bitboards[player] |= 1 << cell
+    return _canonical_key(*bitboards)
+
+
+def _canonical_key(bitboard_x, bitboard_o):
+    """
+    :param bitboard_x: bitboard of player X
+    :type bitboard_x: int
+    :param bitboard_o: bitboard of player O
+    :type bitboard_o: int
+    :return: key of the canonical form of the position
+    :rtype: int
+    """
+    bitboard_x, bitboard_o, _ = canonical(bitboard_x, bitboard_o)
+    return bitboard_x | bitboard_o << NUMBER_OF_CELLS
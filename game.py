@@ -1,5 +1,4 @@
 from itertools import cycle
-from random import randint
 
 from board.board import Board
 
@@ -9,42 +8,57 @@ class Game:
     FIRST_PLAYER_MARK = 'X'
     SECOND_PLAYER_MARK = 'O'
 
-    def __init__(self, player_x_type, player_o_type):
+    def __init__(self, player_x_type, player_o_type, board=None):
         """Instantiate a tic-tac-toe game.
 
         :param player_x_type: type of the first player (player x)
         :type player_x_type: Player
         :param player_o_type: type of the second player (player o)
         :type player_o_type: Player
+        :param board: the board to play on, a classic 3x3 board by default
+        :type board: Board
         """
-        self.board = Board()
+        self.board = board if board is not None else Board()
         self.player_x = player_x_type(self.FIRST_PLAYER_MARK)
         self.player_o = player_o_type(self.SECOND_PLAYER_MARK)
 
     def play(self):
         """Main method running the game."""
+        winner = self.run()
+        print(self.board)
+        if winner:
+            print(f'Player {winner} has won! :-)')
+        else:
+            print('Board is full, tie.')
+
+    def run(self):
+        """
+        Run the game without any output and return its winner.
+
+        :return: mark of the winner, or None if the game ended in a tie
+        :rtype: str
+        """
+        representation = self.board.representation()
         for player in cycle((self.player_x, self.player_o)):
-            if self._turn(player):
-                return
+            if self._turn(player, representation):
+                return player.mark
+            if self.board.is_full():
+                return None
+
+    def reset(self):
+        """Clear the board, so the same game and players can be played again."""
+        self.board.clear()
 
-    def _turn(self, player):
+    def _turn(self, player, representation):
         """
-        Method running every turn and returns whether the game has ended.
+        Method running every turn and returns whether the current player has won.
 
         :param player: the current player
         :type player: Player
-        :return: whether the game has ended
+        :param representation: representation of the game's board
+        :type representation: BoardRepresentation
+        :return: whether the current player has won
         :rtype: bool
         """
-        row, column = player.turn(self.board.representation())
-        if self.board.move(player.mark, row, column):
-            print(self.board)
-            print(f'Player {player.mark} has won! :-)')
-            return True
-
-        if self.board.is_full():
-            print(self.board)
-            print('Board is full, tie.')
-            return True
-
-        return False
+        row, column = player.turn(representation)
+        return self.board.move(player.mark, row, column)
@@ -0,0 +1,169 @@
+"""
+A move oracle that answers a stream of positions of the classic board, for pipelines.
+
+Positions are read from stdin and their moves are written to stdout, in the same order, as soon as every chunk of the
+input is read. The player whose turn it is follows from the number of marks of each player.
+
+Text mode (the default): every line is a position of 9 cells row by row, ``X``, ``O`` or ``.`` for an empty cell, and
+every answer is a line with the number of the chosen cell, from 1 like the cells a human player enters, or 0 if the
+line is not a position with a move to make: a line that is not a position, a position that can not be reached in a
+game, or a finished game.
+
+Binary mode: every frame is a 4 bytes little-endian position ``bitboard_x | bitboard_o << 9``, the form of
+:meth:`players.Player.turn_many`, and every answer is one byte with the chosen cell (``row * 3 + column``), or
+:data:`INVALID` if the frame is not a position with a move to make. A truncated frame at the end of the input is
+answered with :data:`INVALID` too.
+"""
+import sys
+from argparse import ArgumentParser
+from array import array
+
+from board.board import LINES
+from game import Game
+from players import AI, RandomComputer
+from records import RECORD_SIZE, TYPECODE
+
+PLAYER_TYPES = {'ai': AI, 'random': RandomComputer}
+INVALID = 255
+FULL = (1 << 9) - 1
+CHUNK_SIZE = 1 << 16
+# Whether every bitboard has a line of marks.
+WON = tuple(any(bitboard & line == line for line in LINES) for bitboard in range(1 << 9))
+_TO_X = bytes.maketrans(b'XO.', b'100')
+_TO_O = bytes.maketrans(b'XO.', b'010')
+
+
+def main(arguments=None):
+    """
+    Answer the positions of stdin on stdout until the end of the input.
+
+    :param arguments: command line arguments, sys.argv by default
+    :type arguments: list[str]
+    :return: exit code
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Answer a stream of positions from stdin with moves on stdout.')
+    parser.add_argument('--player', choices=tuple(PLAYER_TYPES), default='ai', help='player choosing the moves')
+    parser.add_argument('--binary', action='store_true', help='read and write binary frames instead of lines')
+    arguments = parser.parse_args(arguments)
+    run(sys.stdin.buffer, sys.stdout.buffer, PLAYER_TYPES[arguments.player], arguments.binary)
+    return 0
+
+
+def run(input_stream, output_stream, player_type, binary=False):
+    """
+    Answer the positions of a stream.
+
+    The input is read a chunk at a time, without waiting for a full chunk, and the answers of every chunk are written
+    at once. Both players answer their positions of a chunk in one batch.
+
+    :param input_stream: stream of the positions
+    :type input_stream: io.BufferedReader
+    :param output_stream: stream of the answers
+    :type output_stream: io.BufferedWriter
+    :param player_type: type of the player choosing the moves
+    :type player_type: Player
+    :param binary: whether the streams hold binary frames instead of lines
+    :type binary: bool
+    """
+    players = (player_type(Game.FIRST_PLAYER_MARK), player_type(Game.SECOND_PLAYER_MARK))
+    parse, write = (_parse_frames, _write_bytes) if binary else (_parse_lines, _write_lines)
+    pending = b''
+    while True:
+        data = input_stream.read1(CHUNK_SIZE)
+        if not data:
+            break
+        data = pending + data
+        end = len(data) - len(data) % RECORD_SIZE if binary else data.rfind(b'\n') + 1
+        if end:
+            output_stream.write(write(answer(players, parse(data[:end]))))
+            output_stream.flush()
+        pending = data[end:]
+    if binary and pending:  # a truncated frame
+        output_stream.write(write([None]))
+        output_stream.flush()
+    elif not binary and pending.strip():
+        output_stream.write(write(answer(players, parse(pending))))
+        output_stream.flush()
+
+
+def answer(players, positions):
+    """
+    :param players: the first player and the second player
+    :type players: tuple
+    :param positions: positions as integers ``bitboard_x | bitboard_o << 9``, or None for invalid positions
+    :type positions: list
+    :return: cell (``row * 3 + column``) of the move of every position, or None for positions without a move to make,
+             including finished games
+    :rtype: list
+    """
+    batches = (list(), list())
+    for index, position in enumerate(positions):
+        if position is None:
+            continue
+        bitboard_x, bitboard_o = position & FULL, position >> 9
+        difference = bin(bitboard_x).count('1') - bin(bitboard_o).count('1')
+        if (not bitboard_x & bitboard_o and difference in (0, 1) and bitboard_x | bitboard_o != FULL
+                and not WON[bitboard_x] and not WON[bitboard_o]):
+            batches[difference].append(index)
+
+    cells = [None] * len(positions)
+    for player, indices in zip(players, batches):
+        if indices:
+            for index, cell in zip(indices, player.turn_many([positions[index] for index in indices])):
+                cells[index] = cell
+    return cells
+
+
+def _parse_lines(data):
+    """
+    :param data: complete lines of positions
+    :type data: bytes
+    :return: the positions, or None for the lines that are not positions
+    :rtype: list
+    """
+    positions = list()
+    for line in data.splitlines():
+        line = line.strip()
+        if len(line) == 9 and not line.translate(None, b'XO.'):
+            positions.append(int(line.translate(_TO_X)[::-1], 2) | int(line.translate(_TO_O)[::-1], 2) << 9)
+        else:
+            positions.append(None)
+    return positions
+
+
+def _parse_frames(data):
+    """
+    :param data: complete frames of positions
+    :type data: bytes
+    :return: the positions, or None for the frames that are not positions
+    :rtype: list
+    """
+    frames = array(TYPECODE, data)
+    if sys.byteorder == 'big':
+        frames.byteswap()
+    return [frame if frame < 1 << 18 else None for frame in frames]
+
+
+def _write_lines(cells):
+    """
+    :param cells: cell of every answer, or None
+    :type cells: list
+    :return: the answers as lines
+    :rtype: bytes
+    """
+    return ''.join(f'{cell + 1 if cell is not None else 0}\n' for cell in cells).encode()
+
+
+def _write_bytes(cells):
+    """
+    :param cells: cell of every answer, or None
+    :type cells: list
+    :return: the answers as bytes
+    :rtype: bytes
+    """
+    return bytes(cell if cell is not None else INVALID for cell in cells)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
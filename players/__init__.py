@@ -1,4 +1,7 @@
 from .ai import AI
+from .alpha_beta import AlphaBeta
 from .human import Human
+from .mcts import MCTS
 from .player import Player
 from .random_computer import RandomComputer
+from .tablebase_player import TablebasePlayer
@@ -1,20 +1,34 @@
+from array import array
 from itertools import product
-from random import choice
 
-from board.board import Board
 from board.board_representation import BoardRepresentation
 from game import Game
+from .move_table import best_moves, best_moves_table
 from .player import Player
+from .rule_tables import block_fork_cells, fork_cell
 
 
 class AI(Player):
-    """Class that represents an AI player."""
+    """
+    Class that represents an AI player.
+
+    Setting :attr:`stats` (on the class or on one player) to a :class:`players.rule_stats.RuleStats` records how many
+    times every rule was evaluated and fired, and the time spent in it. When it is None, nothing is recorded.
+    """
+    stats = None
 
     def turn(self, board):
         """
         Make a turn.
 
         The strategy is taken from here: https://en.wikipedia.org/wiki/Tic-tac-toe#Strategy.
+        Every position that can be reached in a game is answered from the perfect-play move table (see
+        :func:`players.move_table.best_moves`). Any other position falls back to the rule list below.
+
+        Boards other than the classic 3x3 board are played with the shorter :attr:`generic_moves` list, and boards that
+        are not m,n,k boards, such as :class:`board.ultimate_board.UltimateBoard`, with the :attr:`copy_moves` list,
+        whose rules try the legal moves on a copy of the board.
+
         Every turn this method runs on the list of available moves. The player should always pick the first possible
         option. So for example, the player should always try to win (duh 😜), but if this is not possible, and the
         opponent can win in the next turn, player should block, and so on.
@@ -29,11 +43,56 @@ class AI(Player):
         :return: choice of player
         :rtype: tuple
         """
-        for move in self.moves:
+        if not isinstance(board, BoardRepresentation):
+            moves = self.copy_moves
+        else:
+            moves = self.moves if self._is_classic(board) else self.generic_moves
+        if self.stats is not None:
+            return self.stats.run(moves, self, board)
+
+        for move in moves:
             result = move(self, board)
             if result:
                 return result
 
+    def turn_many(self, positions):
+        """
+        Make a turn in each of many positions of the classic board, see :meth:`Player.turn_many`.
+
+        Every position that can be reached in a game is answered with one lookup in the perfect-play table of all the
+        positions (see :func:`players.move_table.best_moves_table`), with no board and no rule list. Any other position,
+        and every position while :attr:`stats` is set, falls back to :meth:`turn`.
+
+        :param positions: the positions, as integers ``bitboard_x | bitboard_o << 9``
+        :type positions: iterable
+        :return: cell (``row * 3 + column``) of the choice of player in every position
+        :rtype: array
+        """
+        if self.stats is not None:
+            return super().turn_many(positions)
+
+        table, cells = best_moves_table(), array('b')
+        for position in self._own_positions(positions):
+            moves = table.get(position)
+            if moves:
+                cells.append(self.rng.choice(moves))
+            else:  # swapping the bitboards back gives the original position
+                cells.extend(super().turn_many(self._own_positions((position,))))
+        return cells
+
+    def _perfect_play(self, board):
+        """
+        Return the choice according to the perfect-play move table.
+
+        :param board: current board
+        :type board: BoardRepresentation
+        :return: one of the best moves if the position can be reached in a game
+        :rtype: tuple
+        """
+        moves = best_moves(board.bitboard(self.mark), board.bitboard(self._other_mark()))
+        if moves:
+            return divmod(self.rng.choice(moves), 3)
+
     def _win(self, board):
         """
         Method for handling Rule 1: Win.
@@ -60,25 +119,21 @@ class AI(Player):
         """
         return self._win_and_block(board, self._other_mark())
 
-    @classmethod
-    def _win_and_block(cls, board, mark):
-        for row_number, row in enumerate(board.rows):
-            if cls._is_almost_full(row, mark, Board.EMPTY):
-                return row_number, row.index(Board.EMPTY)
-
-        for column_number, column in enumerate(board.columns):
-            if cls._is_almost_full(column, mark, Board.EMPTY):
-                return column.index(Board.EMPTY), column_number
-
-        main_diagonal = board.main_diagonal
-        if cls._is_almost_full(main_diagonal, mark, Board.EMPTY):
-            empty = main_diagonal.index(Board.EMPTY)
-            return empty, empty
+    @staticmethod
+    def _win_and_block(board, mark):
+        """
+        Return the empty cell of a sequence that is filled with :mark: except for that cell.
 
-        secondary_diagonal = board.secondary_diagonal
-        if cls._is_almost_full(secondary_diagonal, mark, Board.EMPTY):
-            empty = secondary_diagonal.index(Board.EMPTY)
-            return empty, 2 - empty
+        :param board: current board
+        :type board: BoardRepresentation
+        :param mark: mark that fills the sequence
+        :type mark: str
+        :return: the empty cell if there is such a sequence
+        :rtype: tuple
+        """
+        threats = board.threats(mark)
+        if threats:
+            return threats[0]
 
     def _fork(self, board):
         """
@@ -86,55 +141,16 @@ class AI(Player):
 
         Fork: Create an opportunity where the player has two threats to win (two non-blocked lines of 2).
 
+        The rule is compiled into a table of all the positions (see :func:`players.rule_tables.fork_cell`).
+
         :param board: current board
         :type board: BoardRepresentation
         :return: choice according to Rule 3 if possible
         :rtype: tuple
         """
-        sequences = set()
-        for sequence in board.all_sequences_coordinates():
-            for row, column in sequence:
-                if board.rows[row][column] == self.mark:
-                    sequences.add(tuple(sequence))
-                    continue
-
-        for sequence in sequences:
-            for sequence1 in sequences:
-                if sequence != sequence1:
-                    intersection = set(sequence) & set(sequence1)
-                    for row, column in intersection:
-                        if board.is_cell_empty(row, column):
-                            return row, column
-
-    def _available_winning_combos(self, board):
-        """
-        :param board: current board
-        :type board: BoardRepresentation
-        :return: all the cells that if they will be filled, a row of two will be created
-        :rtype: list
-        """
-        available = list()
-        for row_number, row in enumerate(board.rows):
-            if self._is_almost_full(row, Board.EMPTY, self.mark):
-                full = row.index(self.mark)
-                available.extend([(row_number, column_number) for column_number in range(3) if column_number != full])
-
-        for column_number, column in enumerate(board.columns):
-            if self._is_almost_full(column, Board.EMPTY, self.mark):
-                full = column.index(self.mark)
-                available.extend([(row_number, column_number) for row_number in range(3) if row_number != full])
-
-        main_diagonal = board.main_diagonal
-        if self._is_almost_full(main_diagonal, Board.EMPTY, self.mark):
-            full = main_diagonal.index(self.mark)
-            available.extend([(cell, cell) for cell in range(3) if cell != full])
-
-        secondary_diagonal = board.secondary_diagonal
-        if self._is_almost_full(secondary_diagonal, Board.EMPTY, self.mark):
-            full = secondary_diagonal.index(self.mark)
-            available.extend([(cell, 2 - cell) for cell in range(3) if cell != full])
-
-        return available
+        cell = fork_cell(board.bitboard(self.mark), board.bitboard(self._other_mark()))
+        if cell is not None:
+            return divmod(cell, 3)
 
     def _block_fork(self, board):
         """
@@ -146,39 +162,18 @@ class AI(Player):
         doesn't result in them creating a fork. For example, if "X" has two opposite corners and "O" has the center,
         "O" must not play a corner in order to win. (Playing a corner in this scenario creates a fork for "X" to win.)
 
+        The rule is compiled into a table of all the positions (see :func:`players.rule_tables.block_fork_cells`).
+
         :param board: current board
         :type board: BoardRepresentation
         :return: choice according to Rule 4 if possible
         :rtype: tuple
         """
-        other_mark = self._other_mark()
-        sequences = set()
-        for sequence in board.all_sequences_coordinates():
-            for row, column in sequence:
-                if board.rows[row][column] == other_mark:
-                    sequences.add(tuple(sequence))
-                    continue
-
-        combos = self._available_winning_combos(board)
-        best = list()
-        better = list()
-        for sequence, sequence1 in product(sequences, sequences):
-            if sequence != sequence1:
-                intersection = set(sequence) & set(sequence1)
-                for row, column in intersection:
-                    if board.is_cell_empty(row, column):
-                        if (row, column) in combos:
-                            best.append((row, column))
-                        else:
-                            better.append((row, column))
-        if len(best) > 0:
-            return choice(best)
-        if len(better) > 0:
-            return choice(better)
-        return choice(combos)
+        for cells in block_fork_cells(board.bitboard(self.mark), board.bitboard(self._other_mark())):
+            if cells:
+                return divmod(self.rng.choice(cells), 3)
 
-    @staticmethod
-    def _center(board):
+    def _center(self, board):
         """
         Return the choice according to Rule 5: Center.
 
@@ -191,8 +186,9 @@ class AI(Player):
         :return: choice according to Rule 5 if possible
         :rtype: tuple
         """
-        if board.is_cell_empty(1, 1):
-            return 1, 1
+        center = board.number_of_rows // 2, board.number_of_columns // 2
+        if board.is_cell_empty(*center):
+            return center
 
     def _opposite_corner(self, board):
         """
@@ -229,8 +225,7 @@ class AI(Player):
         if empty_opposite_full(2, 0, 0, 2):
             return 0, 2
 
-    @staticmethod
-    def _empty_corner(board):
+    def _empty_corner(self, board):
         """
         Return the choice according to Rule 7: Empty corner.
 
@@ -247,10 +242,9 @@ class AI(Player):
                 empty_corners.append(corner)
 
         if empty_corners:
-            return choice(empty_corners)
+            return self.rng.choice(empty_corners)
 
-    @staticmethod
-    def _empty_edge(board):
+    def _empty_edge(self, board):
         """
         Return the choice according to Rule 8: Empty side.
 
@@ -267,7 +261,22 @@ class AI(Player):
                 empty_edges.append(edge)
 
         if empty_edges:
-            return choice(empty_edges)
+            return self.rng.choice(empty_edges)
+
+    def _empty_cell(self, board):
+        """
+        Return a random empty cell.
+
+        :param board: current board
+        :type board: BoardRepresentation
+        :return: an empty cell if there is one
+        :rtype: tuple
+        """
+        empty_cells = [(row, column) for row, column in product(range(board.number_of_rows),
+                                                                range(board.number_of_columns))
+                       if board.is_cell_empty(row, column)]
+        if empty_cells:
+            return self.rng.choice(empty_cells)
 
     def _first_turn(self, board):
         """
@@ -281,7 +290,7 @@ class AI(Player):
         :rtype: tuple
         """
         if self._number_of_empty_cells(board) == 9:
-            return choice((0, 2)), choice((0, 2))
+            return self.rng.choice((0, 2)), self.rng.choice((0, 2))
 
     def _second_turn(self, board):
         """
@@ -317,7 +326,7 @@ class AI(Player):
                         product((0, 2), (0, 2)))):
                 return 1, 1  # fill the center
             if not board.is_cell_empty(1, 1):  # if a center opening occurred,
-                return choice((0, 2)), choice((0, 2))  # fill one of the corners
+                return self.rng.choice((0, 2)), self.rng.choice((0, 2))  # fill one of the corners
 
             for row_number, row in enumerate(board.rows):  # if an edge opening occurred, find location of inserted mark
                 if Game.FIRST_PLAYER_MARK in row:
@@ -329,50 +338,81 @@ class AI(Player):
                     choices.append((dimension + 1, 1))
                     choices.append((dimension - 1, 1))
 
-            return choice(choices)
+            return self.rng.choice(choices)
 
-    moves = (_first_turn, _second_turn, _win, _block, _fork, _block_fork,
-             _center, _opposite_corner, _empty_corner, _empty_edge)
+    def _win_game(self, board):
+        """
+        Return a legal move that wins the game, on a board that is not an m,n,k board.
 
-    @staticmethod
-    def _number_of_empty_cells(board):
+        :param board: current board
+        :type board: UltimateBoardRepresentation
+        :return: a winning move if there is one
+        :rtype: tuple
         """
-        Return the number of the empty cells in the board.
+        return self._winning_move(board.copy_board(), self.mark)
+
+    def _safe_move(self, board):
+        """
+        Return a random legal move after which the opponent cannot win the game in the next turn, on a board that is
+        not an m,n,k board, or any legal move if there is no such move.
 
         :param board: current board
-        :type board: BoardRepresentation
-        :return: number of empty cells in board
-        :rtype: int
+        :type board: UltimateBoardRepresentation
+        :return: a legal move
+        :rtype: tuple
         """
-        return sum(1 for row, column in product(range(3), range(3)) if board.rows[row][column] == Board.EMPTY)
+        board, other_mark = board.copy_board(), self._other_mark()
+        legal_moves, safe_moves = board.legal_moves(), list()
+        for move in legal_moves:
+            board.make_move(self.mark, *move)
+            if board.is_full() or self._winning_move(board, other_mark) is None:
+                safe_moves.append(move)
+            board.unmake_move()
+        return self.rng.choice(safe_moves or legal_moves)
+
+    @staticmethod
+    def _winning_move(board, mark):
+        """
+        Return a legal move of :mark: that wins the game.
+
+        :param board: copy of the current board, where the moves are made and undone
+        :type board: UltimateBoard
+        :param mark: mark of the player to move
+        :type mark: str
+        :return: a winning move if there is one
+        :rtype: tuple
+        """
+        for move in board.legal_moves():
+            won = board.make_move(mark, *move)
+            board.unmake_move()
+            if won:
+                return move
+
+    moves = (_perfect_play, _first_turn, _second_turn, _win, _block, _fork, _block_fork,
+             _center, _opposite_corner, _empty_corner, _empty_edge)
+    generic_moves = (_win, _block, _center, _empty_cell)
+    copy_moves = (_win_game, _safe_move)
 
     @staticmethod
-    def _is_almost_full(sequence, main_char, secondary_char, main_times=2, secondary_times=1):
+    def _is_classic(board):
         """
-        Return whether :sequence: is "almost-full".
+        Return whether the board is the classic 3x3 tic-tac-toe board.
 
-        An "almost-full" sequence is a sequence that includes :main_times: cell(s) with the :main_char: and other
-        :secondary_times: cell(s) with :secondary_char:.
-        :main_char
-        :param sequence: sequence to be checked
-        :type sequence: list
-        :param main_char: character that should appear twice
-        :type main_char: str
-        :param secondary_char: character that should appear once
-        :type secondary_char: str
-        :param main_times: amount of times :main_char: should appear
-        :type main_times: int
-        :param secondary_times: amount of times :secondary_char: should appear
-        :type secondary_times: int
-        :return: whether :sequence: is "almost-full"
+        :param board: current board
+        :type board: BoardRepresentation
+        :return: whether the board is the classic board
+        :rtype: bool
         """
-        return sequence.count(main_char) == main_times and sequence.count(secondary_char) == secondary_times
+        return board.number_of_rows == board.number_of_columns == board.win_length == 3
 
-    def _other_mark(self):
+    @staticmethod
+    def _number_of_empty_cells(board):
         """
-        Return the other player's mark.
+        Return the number of the empty cells in the board.
 
-        :return: mark of the other player
-        :rtype: str
+        :param board: current board
+        :type board: BoardRepresentation
+        :return: number of empty cells in board
+        :rtype: int
         """
-        return Game.FIRST_PLAYER_MARK if self.mark == Game.SECOND_PLAYER_MARK else Game.SECOND_PLAYER_MARK
+        return board.number_of_rows * board.number_of_columns - board.number_of_moves
@@ -0,0 +1,364 @@
+from time import perf_counter
+
+from board.board_representation import BoardRepresentation
+from .player import Player
+
+WIN = 1 << 20
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """Exception raised when a search runs out of time."""
+
+
+class TranspositionTable:
+    """
+    Class that represents a fixed-size transposition table.
+
+    Every position is stored in the slot its Zobrist key points to. A stored entry is replaced by an entry searched to
+    at least the same depth, or by any entry of a newer search.
+    """
+
+    def __init__(self, size_bits=16):
+        """
+        Instantiate an empty transposition table.
+
+        :param size_bits: the table holds 2 ** :size_bits: entries
+        :type size_bits: int
+        """
+        self._mask = (1 << size_bits) - 1
+        self._entries = [None] * (1 << size_bits)
+        self.generation = 0
+
+    def get(self, key):
+        """
+        Return the entry of a position.
+
+        :param key: Zobrist key of the position
+        :type key: int
+        :return: the entry (key, generation, depth, value, flag, best cell), or None if the position is not stored
+        :rtype: tuple
+        """
+        entry = self._entries[key & self._mask]
+        if entry is not None and entry[0] == key:
+            return entry
+
+    def put(self, key, depth, value, flag, best_cell):
+        """
+        Store the result of a search of a position.
+
+        :param key: Zobrist key of the position
+        :type key: int
+        :param depth: depth the position was searched to
+        :type depth: int
+        :param value: value of the position
+        :type value: int
+        :param flag: whether the value is EXACT, a LOWER_BOUND or an UPPER_BOUND
+        :type flag: int
+        :param best_cell: best move of the position
+        :type best_cell: int
+        """
+        index = key & self._mask
+        entry = self._entries[index]
+        if entry is None or entry[1] != self.generation or entry[2] <= depth:
+            self._entries[index] = (key, self.generation, depth, value, flag, best_cell)
+
+    def clear(self):
+        """Remove all the entries, for example those of positions of another board."""
+        self._entries = [None] * len(self._entries)
+        self.generation = 0
+
+
+class AlphaBeta(Player):
+    """
+    Class that represents a computer player searching the game tree.
+
+    The player runs an iterative-deepening negamax search with alpha-beta pruning on bitboards, and keeps the
+    positions it has searched in a transposition table keyed by incremental Zobrist hashes. It plays on any m,n,k
+    board.
+
+    Other boards, such as :class:`board.ultimate_board.UltimateBoard`, are searched on a copy of the board with its
+    ``legal_moves``, ``make_move`` and ``unmake_move``, so the search follows their rules, without a transposition
+    table. The search stops at :attr:`copy_depth` moves when :attr:`max_depth` is None, and its positions are valued by
+    the ``open_lines`` of the board.
+    """
+    copy_depth = 3
+
+    def __init__(self, mark, max_depth=None, time_limit=None, table_size_bits=16, rng=None):
+        """
+        Instantiate a search player.
+
+        :param mark: the mark of the player (X, O)
+        :type mark: str
+        :param max_depth: maximal depth of the search in moves, until the end of the game by default
+        :type max_depth: int
+        :param time_limit: maximal time of a turn in seconds, unlimited by default
+        :type time_limit: float
+        :param table_size_bits: the transposition table holds 2 ** :table_size_bits: entries
+        :type table_size_bits: int
+        :param rng: random generator of the Zobrist keys, the global one of the :mod:`random` module by default
+        :type rng: random.Random
+        """
+        super().__init__(mark, rng)
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.table = TranspositionTable(table_size_bits)
+        self.nodes = 0
+        self.depth = 0
+        self._shape = None
+        self._deadline = None
+
+    def turn(self, board):
+        """
+        Make a turn.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        :return: choice of player
+        :rtype: tuple
+        """
+        if not isinstance(board, BoardRepresentation):
+            return self._turn_on_copy(board)
+
+        self._prepare(board)
+        own, other = board.bitboard(self.mark), board.bitboard(self._other_mark())
+        key = self._key(own, 0) ^ self._key(other, 1)
+        empty_cells = self._number_of_cells - board.number_of_moves
+        max_depth = min(self.max_depth or empty_cells, empty_cells)
+
+        self.nodes = self.depth = 0
+        self.table.generation += 1
+        self._deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        best_cell = None
+        for depth in range(1, max_depth + 1):
+            try:
+                value = self._negamax(own, other, key, 0, depth, -WIN - 1, WIN + 1)
+            except SearchTimeout:
+                break
+            best_cell, self.depth = self.table.get(key)[5], depth
+            if abs(value) > WIN // 2:  # the game is solved
+                break
+
+        if best_cell is None:  # not even the first iteration has finished
+            best_cell = next(cell for cell in self._ordered_cells if not (own | other) >> cell & 1)
+        return divmod(best_cell, board.number_of_columns)
+
+    def _turn_on_copy(self, representation):
+        """
+        Make a turn on a copy of a board that is not an m,n,k board.
+
+        :param representation: the current game's board
+        :type representation: UltimateBoardRepresentation
+        :return: choice of player
+        :rtype: tuple
+        """
+        board, marks = representation.copy_board(), (self.mark, self._other_mark())
+        max_depth = self.max_depth or self.copy_depth
+        self.nodes = self.depth = 0
+        self._deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        best_move = None
+        for depth in range(1, max_depth + 1):
+            try:
+                value, move = self._negamax_on_copy(board, marks, 0, depth, -WIN - 1, WIN + 1)
+            except SearchTimeout:  # the copy is left in the middle of the search, and thrown away
+                break
+            best_move, self.depth = move, depth
+            if abs(value) > WIN // 2:  # the game is solved
+                break
+
+        if best_move is None:  # not even the first iteration has finished
+            best_move = representation.legal_moves()[0]
+        return best_move
+
+    def _negamax_on_copy(self, board, marks, side, depth, alpha, beta):
+        """
+        Return the value of a position of a copy of the board for the player whose turn it is, like :meth:`_negamax`,
+        and its best move.
+
+        :param board: copy of the board, where the moves are made and undone
+        :type board: UltimateBoard
+        :param marks: mark of this player and mark of the other player
+        :type marks: tuple
+        :param side: 0 if it is this player's turn, 1 otherwise
+        :type side: int
+        :param depth: remaining depth of the search
+        :type depth: int
+        :param alpha: lower bound of the value
+        :type alpha: int
+        :param beta: upper bound of the value
+        :type beta: int
+        :return: value of the position, and the row and column of its best move, or None at the end of the search
+        :rtype: tuple
+        """
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 255 and perf_counter() > self._deadline:
+            raise SearchTimeout
+        if depth == 0:
+            return board.open_lines(marks[side]) - board.open_lines(marks[1 - side]), None
+
+        best_value, best_move = -WIN - 1, None
+        for move in board.legal_moves():
+            if board.make_move(marks[side], *move):
+                value = WIN
+            elif board.is_full():
+                value = 0
+            else:
+                value = -self._negamax_on_copy(board, marks, 1 - side, depth - 1, -beta, -alpha)[0]
+                if value > WIN // 2:
+                    value -= 1
+                elif value < -WIN // 2:
+                    value += 1
+            board.unmake_move()
+
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        return best_value, best_move
+
+    def _negamax(self, own, other, key, side, depth, alpha, beta):
+        """
+        Return the value of a position for the player whose turn it is.
+
+        Values above WIN / 2 are wins and values below -WIN / 2 are losses; the closer they are to WIN, the sooner the
+        game ends.
+
+        :param own: bitboard of the player whose turn it is
+        :type own: int
+        :param other: bitboard of the other player
+        :type other: int
+        :param key: Zobrist key of the position
+        :type key: int
+        :param side: 0 if it is this player's turn, 1 otherwise
+        :type side: int
+        :param depth: remaining depth of the search
+        :type depth: int
+        :param alpha: lower bound of the value
+        :type alpha: int
+        :param beta: upper bound of the value
+        :type beta: int
+        :return: value of the position
+        :rtype: int
+        """
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & 255 and perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        original_alpha, original_beta = alpha, beta
+        entry = self.table.get(key)
+        best_cell = None
+        if entry is not None:
+            best_cell = entry[5]
+            if entry[2] >= depth:
+                value, flag = entry[3], entry[4]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if depth == 0:
+            return self._evaluate(own, other)
+
+        occupied = own | other
+        cells = self._ordered_cells
+        if best_cell is not None:
+            cells = (best_cell,) + tuple(cell for cell in cells if cell != best_cell)
+
+        best_value = -WIN - 1
+        for cell in cells:
+            if occupied >> cell & 1:
+                continue
+            new_own = own | 1 << cell
+            if any(new_own & line == line for line in self._cell_lines[cell]):
+                value = WIN
+            elif occupied | 1 << cell == self._full:
+                value = 0
+            else:
+                value = -self._negamax(other, new_own, key ^ self._zobrist[side][cell], 1 - side, depth - 1,
+                                       -beta, -alpha)
+                if value > WIN // 2:
+                    value -= 1
+                elif value < -WIN // 2:
+                    value += 1
+
+            if value > best_value:
+                best_value, best_cell = value, cell
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.put(key, depth, best_value, flag, best_cell)
+        return best_value
+
+    def _evaluate(self, own, other):
+        """
+        Return a heuristic value of a position: the number of lines still open for the player whose turn it is, minus
+        the number of lines still open for the other player.
+
+        :param own: bitboard of the player whose turn it is
+        :type own: int
+        :param other: bitboard of the other player
+        :type other: int
+        :return: heuristic value of the position
+        :rtype: int
+        """
+        value = 0
+        for line in self._lines:
+            if not line & other and line & own:
+                value += 1
+            elif not line & own and line & other:
+                value -= 1
+        return value
+
+    def _key(self, bitboard, side):
+        """
+        :param bitboard: bitboard of one of the players
+        :type bitboard: int
+        :param side: 0 for this player, 1 for the other player
+        :type side: int
+        :return: Zobrist key of the player's marks
+        :rtype: int
+        """
+        key = 0
+        for cell in range(self._number_of_cells):
+            if bitboard >> cell & 1:
+                key ^= self._zobrist[side][cell]
+        return key
+
+    def _prepare(self, board):
+        """
+        Build the tables of the board's shape and lines, if they are not built already.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        """
+        # The lines tell boards of the same size apart, such as QubicBoard and a 16x4 board; they are cached, so the
+        # comparison is usually one of identity.
+        sequences = board.all_sequences_coordinates()
+        shape = board.number_of_rows, board.number_of_columns, sequences
+        if shape == self._shape:
+            return
+
+        number_of_rows, number_of_columns, _ = self._shape = shape
+        self._number_of_cells = number_of_rows * number_of_columns
+        self._full = (1 << self._number_of_cells) - 1
+        self._lines = tuple(sum(1 << (row * number_of_columns + column) for row, column in sequence)
+                            for sequence in sequences)
+        self._cell_lines = tuple(tuple(line for line in self._lines if line >> cell & 1)
+                                 for cell in range(self._number_of_cells))
+        self._zobrist = tuple(tuple(self.rng.getrandbits(64) for _ in range(self._number_of_cells)) for _ in range(2))
+        center_row, center_column = (number_of_rows - 1) / 2, (number_of_columns - 1) / 2
+        self._ordered_cells = tuple(sorted(range(self._number_of_cells), key=lambda cell: (
+            abs(cell // number_of_columns - center_row) + abs(cell % number_of_columns - center_column))))
+        self.table.clear()
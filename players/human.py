@@ -22,7 +22,7 @@ class Human(Player):
             cell = self._get_user_input(board)
             row, column = cell[0], cell[1]
             if not board.is_cell_empty(row, column):
-                print(f'cell number {row * 3 + column + 1} is not empty')
+                print(f'cell number {row * board.number_of_columns + column + 1} is not empty')
                 continue
 
             return row, column
@@ -37,8 +37,9 @@ class Human(Player):
         :rtype: tuple
         """
         new_board = self._new_board(board)
+        number_of_cells = board.number_of_rows * board.number_of_columns
         while True:
-            number = input(f'Player {self.mark}, enter a cell number between 1 and 9: ')
+            number = input(f'Player {self.mark}, enter a cell number between 1 and {number_of_cells}: ')
             try:
                 number = int(number)
             except ValueError:
@@ -46,12 +47,12 @@ class Human(Player):
                 print(new_board)
                 continue
 
-            if not 0 < number <= 9:
+            if not 0 < number <= number_of_cells:
                 print(f'Cell {number} is out of bounds')
                 print(new_board)
                 continue
 
-            return divmod(number - 1, 3)
+            return divmod(number - 1, board.number_of_columns)
 
     @staticmethod
     def _new_board(board):
@@ -61,12 +62,10 @@ class Human(Player):
         :return: a more convenient board representation for a human
         :rtype: list[list]
         """
-        new_board = [['', '', ''],
-                     ['', '', ''],
-                     ['', '', '']]
-        for row, column in product(range(3), range(3)):
+        new_board = [[''] * board.number_of_columns for _ in range(board.number_of_rows)]
+        for row, column in product(range(board.number_of_rows), range(board.number_of_columns)):
             if board.is_cell_empty(row, column):
-                to_insert = str(row * 3 + column + 1)
+                to_insert = str(row * board.number_of_columns + column + 1)
             else:
                 to_insert = board.rows[row][column]
             new_board[row][column] = to_insert
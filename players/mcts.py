@@ -0,0 +1,354 @@
+from math import log, sqrt
+from time import perf_counter
+
+from board.board_representation import BoardRepresentation
+from .player import Player
+
+WIN, DRAW, LOSS = 1.0, 0.5, 0.0
+
+
+class Node:
+    """Class that represents a position of the search tree of :class:`MCTS`."""
+    __slots__ = ('own', 'other', 'parent', 'children', 'untried', 'visits', 'reward', 'result')
+
+    def __init__(self, own, other, parent=None, result=None, empty_cells=()):
+        """
+        Instantiate a node that has not been visited.
+
+        :param own: bitboard of the player whose turn it is, or None on a board searched on a copy
+        :type own: int
+        :param other: bitboard of the player who has made the last move, or None on a board searched on a copy
+        :type other: int
+        :param parent: node of the previous position, or None for the root
+        :type parent: Node
+        :param result: reward of the finished game for the player who has made the last move, or None if the game
+                       goes on
+        :type result: float
+        :param empty_cells: cells, or rows and columns on a board searched on a copy, of the moves that have not been
+                            expanded yet, in the order they will be
+        :type empty_cells: list
+        """
+        self.own = own
+        self.other = other
+        self.parent = parent
+        self.children = dict()
+        self.untried = empty_cells
+        self.visits = 0
+        self.reward = 0.0
+        self.result = result
+
+
+class MCTS(Player):
+    """
+    Class that represents a computer player running a Monte Carlo tree search.
+
+    Every iteration selects a path of the tree with UCT, expands one new position, plays the game from it to the end
+    with random moves, like :class:`RandomComputer`, and backpropagates the result along the path. The subtree of the
+    position reached after the opponent's answer is kept for the next turn. The player plays on any m,n,k board.
+
+    Other boards, such as :class:`board.ultimate_board.UltimateBoard`, are searched on a copy of the board with its
+    ``legal_moves``, ``make_move`` and ``unmake_move``, so the search follows their rules. It starts a new tree every
+    turn.
+    """
+
+    def __init__(self, mark, iterations=1000, time_limit=None, exploration=sqrt(2), rng=None):
+        """
+        Instantiate a tree search player.
+
+        :param mark: the mark of the player (X, O)
+        :type mark: str
+        :param iterations: number of iterations of a turn, unlimited if there is a time limit and it is None
+        :type iterations: int
+        :param time_limit: maximal time of a turn in seconds, unlimited by default
+        :type time_limit: float
+        :param exploration: exploration constant of UCT
+        :type exploration: float
+        :param rng: random generator of the order of the moves, the global one of the :mod:`random` module by default
+        :type rng: random.Random
+        """
+        super().__init__(mark, rng)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.playouts = 0
+        self.expansions = 0
+        self.backpropagations = 0
+        self.reused_visits = 0
+        self._root = None
+        self._shape = None
+
+    def turn(self, board):
+        """
+        Make a turn.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        :return: choice of player
+        :rtype: tuple
+        """
+        if not isinstance(board, BoardRepresentation):
+            return self._turn_on_copy(board)
+
+        self._prepare(board)
+        root = self._find_root(board.bitboard(self.mark), board.bitboard(self._other_mark()))
+        self.reused_visits = root.visits
+        self._search(root, self._iterate)
+
+        if not root.children:  # not even one iteration has finished
+            self._expand(root)
+        cell, self._root = max(root.children.items(), key=lambda item: item[1].visits)
+        return divmod(cell, board.number_of_columns)
+
+    def _turn_on_copy(self, representation):
+        """
+        Make a turn on a copy of a board that is not an m,n,k board.
+
+        :param representation: the current game's board
+        :type representation: UltimateBoardRepresentation
+        :return: choice of player
+        :rtype: tuple
+        """
+        board, marks = representation.copy_board(), (self.mark, self._other_mark())
+        root = Node(None, None, empty_cells=self._shuffled(board.legal_moves()))
+        self._root = self._shape = None
+        self.reused_visits = 0
+        self._search(root, lambda node: self._iterate_on_copy(node, board, marks))
+
+        if not root.children:  # not even one iteration has finished
+            self._expand_on_copy(root, board, self.mark)
+            board.unmake_move()
+        return max(root.children.items(), key=lambda item: item[1].visits)[0]
+
+    def _search(self, root, iterate):
+        """
+        Run the iterations of a turn, until there are :attr:`iterations` of them or the time limit is reached.
+
+        :param root: root of the search
+        :type root: Node
+        :param iterate: function running one iteration from the root
+        :type iterate: function
+        """
+        self.playouts = self.expansions = self.backpropagations = 0
+        deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        iteration = 0
+        while self.iterations is None or iteration < self.iterations:
+            if deadline is not None and not iteration & 63 and perf_counter() > deadline:
+                break
+            iterate(root)
+            iteration += 1
+
+    def _find_root(self, own, other):
+        """
+        Return the node of the position, from the subtree kept since the last turn if it is there.
+
+        :param own: bitboard of this player
+        :type own: int
+        :param other: bitboard of the other player
+        :type other: int
+        :return: root of the search
+        :rtype: Node
+        """
+        if self._root is not None:
+            for child in self._root.children.values():
+                if child.own == own and child.other == other:
+                    child.parent = None
+                    return child
+        return Node(own, other, empty_cells=self._empty_cells(own | other))
+
+    def _iterate(self, root):
+        """
+        Run one iteration of the search: selection, expansion, playout and backpropagation.
+
+        :param root: root of the search
+        :type root: Node
+        """
+        node = root
+        while node.result is None and not node.untried:
+            _, node = self._select(node)
+        if node.result is None:
+            node = self._expand(node)
+        reward = node.result if node.result is not None else self._playout(node.own, node.other)
+        self._backpropagate(node, reward)
+
+    def _iterate_on_copy(self, root, board, marks):
+        """
+        Run one iteration of the search on a copy of the board, making the moves of the path and undoing them after.
+
+        :param root: root of the search
+        :type root: Node
+        :param board: copy of the board, in the position of the root
+        :type board: UltimateBoard
+        :param marks: mark of this player and mark of the other player
+        :type marks: tuple
+        """
+        node, side, made = root, 0, 0
+        while node.result is None and not node.untried:
+            move, node = self._select(node)
+            board.make_move(marks[side], *move)
+            side, made = 1 - side, made + 1
+        if node.result is None:
+            node = self._expand_on_copy(node, board, marks[side])
+            side, made = 1 - side, made + 1
+        reward = node.result if node.result is not None else self._playout_on_copy(board, marks, side)
+        for _ in range(made):
+            board.unmake_move()
+        self._backpropagate(node, reward)
+
+    def _backpropagate(self, node, reward):
+        """
+        Add the result of a playout to the nodes of a path, from its last node up to the root.
+
+        :param node: last node of the path
+        :type node: Node
+        :param reward: reward of the playout for the player who has made the last move of the path
+        :type reward: float
+        """
+        while node is not None:
+            node.visits += 1
+            node.reward += reward
+            reward = 1.0 - reward
+            node = node.parent
+            self.backpropagations += 1
+
+    def _select(self, node):
+        """
+        :param node: fully expanded node
+        :type node: Node
+        :return: the move and the child with the highest upper confidence bound
+        :rtype: tuple
+        """
+        exploration = self.exploration * sqrt(log(node.visits))
+        return max(node.children.items(),
+                   key=lambda item: item[1].reward / item[1].visits + exploration / sqrt(item[1].visits))
+
+    def _expand(self, node):
+        """
+        :param node: node that has moves that have not been expanded yet
+        :type node: Node
+        :return: the node of the next of these moves
+        :rtype: Node
+        """
+        cell = node.untried.pop()
+        new_own = node.own | 1 << cell
+        occupied = new_own | node.other
+        if any(new_own & line == line for line in self._cell_lines[cell]):
+            child = Node(node.other, new_own, node, WIN)
+        elif occupied == self._full:
+            child = Node(node.other, new_own, node, DRAW)
+        else:
+            child = Node(node.other, new_own, node, empty_cells=self._empty_cells(occupied))
+        node.children[cell] = child
+        self.expansions += 1
+        return child
+
+    def _expand_on_copy(self, node, board, mark):
+        """
+        :param node: node that has moves that have not been expanded yet
+        :type node: Node
+        :param board: copy of the board, in the position of the node, where the move is made
+        :type board: UltimateBoard
+        :param mark: mark of the player whose turn it is
+        :type mark: str
+        :return: the node of the next of these moves
+        :rtype: Node
+        """
+        move = node.untried.pop()
+        if board.make_move(mark, *move):
+            child = Node(None, None, node, WIN)
+        elif board.is_full():
+            child = Node(None, None, node, DRAW)
+        else:
+            child = Node(None, None, node, empty_cells=self._shuffled(board.legal_moves()))
+        node.children[move] = child
+        self.expansions += 1
+        return child
+
+    def _playout(self, own, other):
+        """
+        Play a game to its end with random moves.
+
+        :param own: bitboard of the player whose turn it is
+        :type own: int
+        :param other: bitboard of the player who has made the last move
+        :type other: int
+        :return: reward of the game for the player who has made the last move
+        :rtype: float
+        """
+        self.playouts += 1
+        cells = self._empty_cells(own | other)
+        bitboards, side = [own, other], 0
+        for cell in cells:
+            bitboard = bitboards[side] = bitboards[side] | 1 << cell
+            if any(bitboard & line == line for line in self._cell_lines[cell]):
+                return LOSS if side == 0 else WIN
+            side = 1 - side
+        return DRAW
+
+    def _playout_on_copy(self, board, marks, side):
+        """
+        Play a game to its end with random moves on a copy of the board, and undo them.
+
+        :param board: copy of the board
+        :type board: UltimateBoard
+        :param marks: mark of this player and mark of the other player
+        :type marks: tuple
+        :param side: 0 if it is this player's turn, 1 otherwise
+        :type side: int
+        :return: reward of the game for the player who has made the last move
+        :rtype: float
+        """
+        self.playouts += 1
+        made, reward = 0, DRAW
+        while not board.is_full():
+            made += 1
+            if board.make_move(marks[side], *self.rng.choice(board.legal_moves())):
+                reward = LOSS if made % 2 else WIN
+                break
+            side = 1 - side
+        for _ in range(made):
+            board.unmake_move()
+        return reward
+
+    def _shuffled(self, moves):
+        """
+        :param moves: the moves
+        :type moves: list
+        :return: the moves, in random order
+        :rtype: list
+        """
+        self.rng.shuffle(moves)
+        return moves
+
+    def _empty_cells(self, occupied):
+        """
+        :param occupied: bitboard of the filled cells
+        :type occupied: int
+        :return: the empty cells, in random order
+        :rtype: list
+        """
+        cells = [cell for cell in range(self._number_of_cells) if not occupied >> cell & 1]
+        self.rng.shuffle(cells)
+        return cells
+
+    def _prepare(self, board):
+        """
+        Build the tables of the board's shape and lines, and forget the tree of another shape.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        """
+        # The lines tell boards of the same size apart, such as QubicBoard and a 16x4 board; they are cached, so the
+        # comparison is usually one of identity.
+        sequences = board.all_sequences_coordinates()
+        shape = board.number_of_rows, board.number_of_columns, sequences
+        if shape == self._shape:
+            return
+
+        number_of_rows, number_of_columns, _ = self._shape = shape
+        self._number_of_cells = number_of_rows * number_of_columns
+        self._full = (1 << self._number_of_cells) - 1
+        lines = tuple(sum(1 << (row * number_of_columns + column) for row, column in sequence)
+                      for sequence in sequences)
+        self._cell_lines = tuple(tuple(line for line in lines if line >> cell & 1)
+                                 for cell in range(self._number_of_cells))
+        self._root = None
@@ -0,0 +1,106 @@
+from itertools import product
+
+from board.board import Board
+from board.symmetry import canonical, restore_cell
+
+_table = None
+_positions_table = None
+
+
+def best_moves(own, other):
+    """
+    Return the perfect-play moves of a position.
+
+    The table is built on the first call and kept for the lifetime of the process. It only holds the canonical form of
+    every position (see :func:`board.symmetry.canonical`), and the moves are mapped back to the orientation of the
+    given position.
+
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: cells (``row * 3 + column``) of the best moves, or None if the position can not be reached in a game
+    :rtype: tuple
+    """
+    global _table
+    if _table is None:
+        _table = _build_table()
+    own, other, transform = canonical(own, other)
+    moves = _table.get(own | other << 9)
+    if moves is not None:
+        return tuple(sorted(restore_cell(cell, transform) for cell in moves))
+
+
+def best_moves_table():
+    """
+    Return the perfect-play moves of every position that can be reached in a game, in their own orientation.
+
+    The table is built from :func:`best_moves` on the first call and kept for the lifetime of the process. Its
+    lookups skip the canonical form, for callers that answer many positions at once.
+
+    :return: mapping of position key (``own | other << 9``) to the cells of its best moves, in ascending order
+    :rtype: dict
+    """
+    global _positions_table
+    if _positions_table is None:
+        _positions_table = dict()
+        for cells in product((0, 1, 2), repeat=9):
+            own = sum(1 << cell for cell, content in enumerate(cells) if content == 1)
+            other = sum(1 << cell for cell, content in enumerate(cells) if content == 2)
+            moves = best_moves(own, other)
+            if moves:
+                _positions_table[own | other << 9] = moves
+    return _positions_table
+
+
+def _build_table():
+    """
+    Solve every reachable position and return the best moves of each canonical one.
+
+    Positions are reached by a depth-first walk from the empty board, and values are propagated back from the
+    finished positions. A win is worth more the sooner it happens, and a loss is worth more the later it happens, so
+    the stored moves win as fast as possible and lose as slowly as possible.
+
+    :return: mapping of canonical position key (``own | other << 9``) to the cells of its best moves
+    :rtype: dict
+    """
+    table = dict()
+    scores = dict()
+
+    def solve(own, other):
+        """
+        :param own: bitboard of the player whose turn it is
+        :type own: int
+        :param other: bitboard of the other player
+        :type other: int
+        :return: score of the position for the player whose turn it is
+        :rtype: int
+        """
+        own, other, _ = canonical(own, other)
+        key = own | other << 9
+        if key in scores:
+            return scores[key]
+
+        occupied = own | other
+        empty_cells = [cell for cell in range(9) if not occupied >> cell & 1]
+        best_score, best = None, list()
+        for cell in empty_cells:
+            new_own = own | 1 << cell
+            if any(new_own & line == line for line in Board.CELL_LINES[cell]):
+                score = len(empty_cells)
+            elif len(empty_cells) == 1:
+                score = 0
+            else:
+                score = -solve(other, new_own)
+
+            if best_score is None or score > best_score:
+                best_score, best = score, [cell]
+            elif score == best_score:
+                best.append(cell)
+
+        scores[key] = best_score
+        table[key] = tuple(best)
+        return best_score
+
+    solve(0, 0)
+    return table
@@ -1,17 +1,51 @@
+import random
 from abc import ABC, abstractmethod
+from array import array
+
+from board.board import Board
+from game import Game
+
+POSITION_BITS = 9
+
+
+def random_stream(seed, *keys):
+    """
+    Return a random generator of its own stream, derived from a seed and keys such as the number of a game and the mark
+    of a player.
+
+    The seed and the keys are joined into one string, which :class:`random.Random` hashes, so the same seed and keys
+    give the same stream in any process, and different keys give independent streams.
+
+    :param seed: the seed
+    :type seed: int or str
+    :param keys: the keys of the stream
+    :type keys: int or str
+    :return: the random generator of the stream
+    :rtype: random.Random
+    """
+    return random.Random(':'.join(str(part) for part in (seed,) + keys))
 
 
 class Player(ABC):
-    """Abstract class that represents a player."""
+    """
+    Abstract class that represents a player.
+
+    Every random choice of a player is made with its :attr:`rng`. It is the global generator of the :mod:`random`
+    module by default, and can be replaced with a generator of the player's own, for example one from
+    :func:`random_stream`, to replay the player's choices exactly.
+    """
 
-    def __init__(self, mark):
+    def __init__(self, mark, rng=None):
         """
         Instantiate a player.
 
         :param mark: the mark of the player (X, O)
         :type mark: str
+        :param rng: random generator of the player's choices, the global one of the :mod:`random` module by default
+        :type rng: random.Random
         """
         self.mark = mark
+        self.rng = rng if rng is not None else random
 
     @abstractmethod
     def turn(self, board):
@@ -24,3 +58,49 @@ class Player(ABC):
         :rtype: tuple
         """
         pass
+
+    def turn_many(self, positions):
+        """
+        Make a turn in each of many positions of the classic board.
+
+        Every position is an integer ``bitboard_x | bitboard_o << 9``, for example an item of an ``array('I')``. This
+        default makes one :meth:`turn` per position; players override it with a cheaper batched evaluation.
+
+        :param positions: the positions, in which it is this player's turn
+        :type positions: iterable
+        :return: cell (``row * 3 + column``) of the choice of player in every position
+        :rtype: array
+        """
+        board, cells = Board(), array('b')
+        representation = board.representation()
+        for position in positions:
+            board.clear()
+            for cell in range(POSITION_BITS):
+                if position >> cell & 1:
+                    board.move(Game.FIRST_PLAYER_MARK, *divmod(cell, 3))
+                elif position >> cell + POSITION_BITS & 1:
+                    board.move(Game.SECOND_PLAYER_MARK, *divmod(cell, 3))
+            row, column = self.turn(representation)
+            cells.append(row * 3 + column)
+        return cells
+
+    def _own_positions(self, positions):
+        """
+        :param positions: positions as integers ``bitboard_x | bitboard_o << 9``
+        :type positions: iterable
+        :return: generator of the positions as integers ``own | other << 9``, where own is this player's bitboard
+        :rtype: generator
+        """
+        if self.mark == Game.FIRST_PLAYER_MARK:
+            return iter(positions)
+        mask = (1 << POSITION_BITS) - 1
+        return (position >> POSITION_BITS | (position & mask) << POSITION_BITS for position in positions)
+
+    def _other_mark(self):
+        """
+        Return the other player's mark.
+
+        :return: mark of the other player
+        :rtype: str
+        """
+        return Game.FIRST_PLAYER_MARK if self.mark == Game.SECOND_PLAYER_MARK else Game.SECOND_PLAYER_MARK
@@ -1,7 +1,9 @@
-from itertools import product
-from random import choice
+from array import array
 
-from .player import Player
+from .player import POSITION_BITS, Player
+
+EMPTY_CELLS = tuple(tuple(cell for cell in range(POSITION_BITS) if not occupied >> cell & 1)
+                    for occupied in range(1 << POSITION_BITS))
 
 
 class RandomComputer(Player):
@@ -16,5 +18,19 @@ class RandomComputer(Player):
         :return: choice of player
         :rtype: tuple
         """
-        return choice([(row, column) for row, column in product(
-            range(3), range(3)) if board.is_cell_empty(row, column)])
+        return self.rng.choice(board.legal_moves())
+
+    def turn_many(self, positions):
+        """
+        Make a turn in each of many positions of the classic board, see :meth:`Player.turn_many`.
+
+        The empty cells of every position are looked up in :data:`EMPTY_CELLS`.
+
+        :param positions: the positions, as integers ``bitboard_x | bitboard_o << 9``
+        :type positions: iterable
+        :return: cell (``row * 3 + column``) of the choice of player in every position
+        :rtype: array
+        """
+        mask, choice = (1 << POSITION_BITS) - 1, self.rng.choice
+        return array('b', [choice(EMPTY_CELLS[(position | position >> POSITION_BITS) & mask])
+                           for position in positions])
@@ -0,0 +1,53 @@
+from time import perf_counter_ns
+
+
+class RuleStats:
+    """
+    Class that represents statistics of the rules of a rule-based player.
+
+    For every rule, the statistics count how many times it was evaluated, how many times it fired (answered with a
+    move), and the total time spent in it in nanoseconds.
+    """
+
+    def __init__(self):
+        """Instantiate empty statistics."""
+        self._rules = dict()
+
+    def run(self, rules, player, board):
+        """
+        Run the rules in order and record them, until one of them fires.
+
+        :param rules: the rules, called with the player and the board
+        :type rules: tuple
+        :param player: the player whose rules are run
+        :type player: Player
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        :return: the move of the first rule that fired
+        :rtype: tuple
+        """
+        for rule in rules:
+            start = perf_counter_ns()
+            result = rule(player, board)
+            elapsed = perf_counter_ns() - start
+
+            record = self._rules.get(rule.__name__)
+            if record is None:
+                record = self._rules[rule.__name__] = [0, 0, 0]
+            record[0] += 1
+            record[2] += elapsed
+            if result:
+                record[1] += 1
+                return result
+
+    def snapshot(self):
+        """
+        :return: a copy of the statistics, by rule name
+        :rtype: dict
+        """
+        return {name: {'evaluated': evaluated, 'fired': fired, 'nanoseconds': nanoseconds}
+                for name, (evaluated, fired, nanoseconds) in self._rules.items()}
+
+    def reset(self):
+        """Forget all the statistics."""
+        self._rules = dict()
@@ -0,0 +1,142 @@
+from itertools import product
+
+from board.board import Board
+
+_fork_table = None
+_block_fork_table = None
+
+
+def fork_cell(own, other):
+    """
+    Return the cell of Rule 3 (Fork) in a position of the classic board.
+
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: cell (``row * 3 + column``) of the fork, or None if there is none
+    :rtype: int
+    """
+    global _fork_table
+    if _fork_table is None:
+        _fork_table = _build_table(_fork)
+    return _fork_table[own | other << 9]
+
+
+def block_fork_cells(own, other):
+    """
+    Return the candidate cells of Rule 4 (Blocking an opponent's fork) in a position of the classic board.
+
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: cells (``row * 3 + column``) that block a fork and create two in a row, cells that only block a fork, and
+             cells that only create two in a row; a cell appears once for every way it is found
+    :rtype: tuple[tuple]
+    """
+    global _block_fork_table
+    if _block_fork_table is None:
+        _block_fork_table = _build_table(_block_fork)
+    return _block_fork_table[own | other << 9]
+
+
+def _build_table(rule):
+    """
+    :param rule: function computing the rule from the own and the other bitboards
+    :type rule: function
+    :return: the rule's answer for every position of the classic board, by ``own | other << 9``
+    :rtype: dict
+    """
+    table = dict()
+    for cells in product((0, 1, 2), repeat=9):
+        own = sum(1 << cell for cell, content in enumerate(cells) if content == 1)
+        other = sum(1 << cell for cell, content in enumerate(cells) if content == 2)
+        table[own | other << 9] = rule(own, other)
+    return table
+
+
+def _sequences_order():
+    """
+    Return the order in which every subset of the lines is iterated by the rules.
+
+    The rules have always collected the lines as a set of coordinates, and paired them in the set's iteration order.
+    The tables keep that order, so they answer exactly as the rules have.
+
+    :return: indices of the lines in their iteration order, by the bitmask of the subset
+    :rtype: tuple[tuple]
+    """
+    coordinates = [tuple(divmod(cell, 3) for cell in range(9) if line >> cell & 1) for line in Board.LINES]
+    orders = list()
+    for subset in range(1 << len(Board.LINES)):
+        sequences = set()
+        for index, sequence in enumerate(coordinates):
+            if subset >> index & 1:
+                sequences.add(sequence)
+        orders.append(tuple(coordinates.index(sequence) for sequence in sequences))
+    return tuple(orders)
+
+
+_ORDERS = _sequences_order()
+
+
+def _lines_with(bitboard):
+    """
+    :param bitboard: bitboard of a player
+    :type bitboard: int
+    :return: indices of the lines that have a mark of the player, in their iteration order
+    :rtype: tuple
+    """
+    return _ORDERS[sum(1 << index for index, line in enumerate(Board.LINES) if line & bitboard)]
+
+
+def _intersections(lines, occupied):
+    """
+    :param lines: indices of lines, in their iteration order
+    :type lines: tuple
+    :param occupied: bitboard of the filled cells
+    :type occupied: int
+    :return: the empty cell shared by every ordered pair of different lines that shares one
+    :rtype: list
+    """
+    cells = list()
+    for first, second in product(lines, lines):
+        intersection = Board.LINES[first] & Board.LINES[second]
+        if first != second and intersection and not intersection & occupied:
+            cells.append(intersection.bit_length() - 1)
+    return cells
+
+
+def _fork(own, other):
+    """
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: the first empty intersection of two lines that have a mark of the player
+    :rtype: int
+    """
+    cells = _intersections(_lines_with(own), own | other)
+    return cells[0] if cells else None
+
+
+def _block_fork(own, other):
+    """
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :return: cells that block a fork and create two in a row, cells that only block a fork, and cells that only
+             create two in a row
+    :rtype: tuple[tuple]
+    """
+    occupied = own | other
+    combos = list()
+    for line in Board.LINES:
+        if line & own and not line & other and bin(line & own).count('1') == 1:
+            combos.extend(cell for cell in range(9) if line >> cell & 1 and not occupied >> cell & 1)
+
+    best, better = list(), list()
+    for cell in _intersections(_lines_with(other), occupied):
+        (best if cell in combos else better).append(cell)
+    return tuple(best), tuple(better), tuple(combos)
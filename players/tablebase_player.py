@@ -0,0 +1,157 @@
+import mmap
+
+from game import Game
+from .player import Player
+
+MAGIC = b'TTB1'
+HEADER_SIZE = 8
+WIN = 32
+UNKNOWN = -128
+
+
+class Tablebase:
+    """
+    Class that reads a tablebase file in place, see :func:`tablebase.build_tablebase`.
+
+    The file starts with :data:`MAGIC`, the number of rows, the number of columns and the win length, padded to
+    :data:`HEADER_SIZE` bytes. It is followed by one signed byte for every position, at index
+    ``sum(content * 3 ** cell)`` where the content of a cell is 0 when it is empty, 1 for player X and 2 for player O.
+    The byte is the score of the position for the player whose turn it is: ``WIN - d`` if the player wins in ``d``
+    moves, ``d - WIN`` if the player loses in ``d`` moves, 0 for a draw, and :data:`UNKNOWN` for a position that can
+    not be reached in a game.
+
+    The file is memory-mapped read only, so every process that opens it shares the same pages.
+    """
+
+    def __init__(self, path):
+        """
+        Open a tablebase file.
+
+        :param path: path of the file
+        :type path: str
+        """
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f'{path} is not a tablebase file')
+        self.number_of_rows, self.number_of_columns, self.win_length = self._map[len(MAGIC):len(MAGIC) + 3]
+        self._powers = tuple(3 ** cell for cell in range(self.number_of_rows * self.number_of_columns))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the memory-mapped file."""
+        self._map.close()
+
+    def index(self, bitboard_x, bitboard_o):
+        """
+        :param bitboard_x: bitboard of player X
+        :type bitboard_x: int
+        :param bitboard_o: bitboard of player O
+        :type bitboard_o: int
+        :return: index of the position in the table
+        :rtype: int
+        """
+        return sum(power * ((bitboard_x >> cell & 1) + 2 * (bitboard_o >> cell & 1))
+                   for cell, power in enumerate(self._powers))
+
+    def score(self, bitboard_x, bitboard_o):
+        """
+        :param bitboard_x: bitboard of player X
+        :type bitboard_x: int
+        :param bitboard_o: bitboard of player O
+        :type bitboard_o: int
+        :return: score of the position for the player whose turn it is, see :class:`Tablebase`
+        :rtype: int
+        """
+        return self._score(self.index(bitboard_x, bitboard_o))
+
+    def best_moves(self, bitboard_x, bitboard_o):
+        """
+        Return the moves that win as fast as possible, draw, or lose as slowly as possible.
+
+        :param bitboard_x: bitboard of player X
+        :type bitboard_x: int
+        :param bitboard_o: bitboard of player O
+        :type bitboard_o: int
+        :return: cells (``row * number_of_columns + column``) of the best moves in ascending order, none if the game
+                 has ended, or None if the position can not be reached in a game
+        :rtype: tuple
+        """
+        index = self.index(bitboard_x, bitboard_o)
+        score = self._score(index)
+        if score == UNKNOWN:
+            return None
+        if score == -WIN:
+            return ()
+        occupied = bitboard_x | bitboard_o
+        content = 1 if bin(bitboard_x).count('1') == bin(bitboard_o).count('1') else 2
+        best_score, best = None, list()
+        for cell, power in enumerate(self._powers):
+            if occupied >> cell & 1:
+                continue
+            score = parent_score(self._score(index + content * power))
+            if best_score is None or score > best_score:
+                best_score, best = score, [cell]
+            elif score == best_score:
+                best.append(cell)
+        return tuple(best)
+
+    def _score(self, index):
+        """
+        :param index: index of a position in the table
+        :type index: int
+        :return: score of the position
+        :rtype: int
+        """
+        score = self._map[HEADER_SIZE + index]
+        return score - 256 if score > 127 else score
+
+
+def parent_score(score):
+    """
+    :param score: score of a position for the player whose turn it is
+    :type score: int
+    :return: score of the move leading to the position, for the player who makes it
+    :rtype: int
+    """
+    if score > 0:
+        return 1 - score
+    if score < 0:
+        return -1 - score
+    return 0
+
+
+class TablebasePlayer(Player):
+    """
+    Class that represents a player making the best moves of a tablebase.
+
+    The tablebase is shared by all the players and has to be set before they play, for example
+    ``TablebasePlayer.tablebase = Tablebase('4x4.ttb')``.
+    """
+    tablebase = None
+
+    def turn(self, board):
+        """
+        Make a turn.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        :return: choice of player
+        :rtype: tuple
+        """
+        tablebase = self.tablebase
+        if tablebase is None:
+            raise ValueError('TablebasePlayer.tablebase has not been set')
+        if (board.number_of_rows, board.number_of_columns, board.win_length) != (
+                tablebase.number_of_rows, tablebase.number_of_columns, tablebase.win_length):
+            raise ValueError('the tablebase was built for another board')
+        moves = tablebase.best_moves(board.bitboard(Game.FIRST_PLAYER_MARK), board.bitboard(Game.SECOND_PLAYER_MARK))
+        if moves is None:
+            raise ValueError('the position can not be reached in a game')
+        return divmod(moves[0], board.number_of_columns)
@@ -0,0 +1,168 @@
+"""
+A compact binary format for the records of finished games on the classic board.
+
+A file starts with :data:`MAGIC`, followed by one 4 bytes little-endian record per game:
+
+* bits 0-18 hold the moves, as the rank of every move among the cells still empty (in ascending order), in a mixed
+  radix of 9, 8, 7, ... so every game of up to 9 moves fits in 19 bits,
+* bits 19-22 hold the number of moves,
+* bits 23-24 hold the outcome: 0 for a tie, 1 if player X has won and 2 if player O has won.
+
+Every record has the same size, so the n-th game of a file starts at byte ``len(MAGIC) + 4 * n``.
+"""
+import sys
+from array import array
+
+from game import Game
+
+MAGIC = b'TTR1'
+RECORD_SIZE = 4
+OUTCOMES = (None, Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK)
+NUMBER_OF_CELLS = 9
+_MOVES_BITS = 19
+_LENGTH_BITS = 4
+TYPECODE = next(typecode for typecode in 'IL' if array(typecode).itemsize == RECORD_SIZE)
+
+
+def encode(moves, winner):
+    """
+    :param moves: cells (``row * 3 + column``) of the moves of a game, in order
+    :type moves: tuple
+    :param winner: mark of the winner, or None if the game ended in a tie
+    :type winner: str
+    :return: record of the game
+    :rtype: int
+    """
+    record, radix, empty_cells = 0, 1, list(range(NUMBER_OF_CELLS))
+    for cell in moves:
+        try:
+            record += empty_cells.index(cell) * radix
+        except ValueError:
+            raise ValueError(f'cell {cell} is not an empty cell of the classic board') from None
+        radix *= len(empty_cells)
+        empty_cells.remove(cell)
+    return record | len(moves) << _MOVES_BITS | OUTCOMES.index(winner) << _MOVES_BITS + _LENGTH_BITS
+
+
+def decode(record):
+    """
+    :param record: record of a game
+    :type record: int
+    :return: cells (``row * 3 + column``) of the moves of the game in order, and the mark of the winner, or None if the
+             game ended in a tie
+    :rtype: tuple
+    """
+    moves, empty_cells, ranks = list(), list(range(NUMBER_OF_CELLS)), record & (1 << _MOVES_BITS) - 1
+    for _ in range(record >> _MOVES_BITS & (1 << _LENGTH_BITS) - 1):
+        ranks, rank = divmod(ranks, len(empty_cells))
+        moves.append(empty_cells.pop(rank))
+    return tuple(moves), OUTCOMES[record >> _MOVES_BITS + _LENGTH_BITS]
+
+
+class RecordWriter:
+    """Class that appends records of games to a file, in bulk."""
+
+    def __init__(self, path, buffer_size=1 << 16):
+        """
+        Open a file of records for appending, and start it if it is empty.
+
+        :param path: path of the file
+        :type path: str
+        :param buffer_size: number of records kept in memory before they are written to the file
+        :type buffer_size: int
+        """
+        self._file = open(path, 'ab')
+        if self._file.tell():
+            try:
+                with open(path, 'rb') as file:
+                    _check_magic(file)
+            except ValueError:
+                self._file.close()
+                raise
+        else:
+            self._file.write(MAGIC)
+        self._buffer = array(TYPECODE)
+        self._buffer_size = buffer_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, moves, winner):
+        """
+        Append the record of a finished game.
+
+        :param moves: cells (``row * 3 + column``) of the moves of the game, in order
+        :type moves: tuple
+        :param winner: mark of the winner, or None if the game ended in a tie
+        :type winner: str
+        """
+        self._buffer.append(encode(moves, winner))
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records to the file."""
+        if sys.byteorder == 'big':
+            self._buffer.byteswap()
+        self._file.write(self._buffer.tobytes())
+        self._file.flush()
+        del self._buffer[:]
+
+    def close(self):
+        """Write the buffered records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def read_records(path, chunk_size=1 << 16):
+    """
+    Read the records of a file one after another, a chunk of them at a time.
+
+    :param path: path of the file
+    :type path: str
+    :param chunk_size: number of records read from the file at once
+    :type chunk_size: int
+    :return: generator of the records, see :func:`decode`
+    :rtype: generator
+    """
+    with open(path, 'rb') as file:
+        _check_magic(file)
+        while True:
+            chunk = file.read(chunk_size * RECORD_SIZE)
+            if not chunk:
+                return
+            if len(chunk) % RECORD_SIZE:
+                raise ValueError(f'{path} ends with a truncated record')
+            records = array(TYPECODE, chunk)
+            if sys.byteorder == 'big':
+                records.byteswap()
+            yield from records
+
+
+def read_games(path, chunk_size=1 << 16):
+    """
+    Read the games of a file one after another, a chunk of them at a time.
+
+    :param path: path of the file
+    :type path: str
+    :param chunk_size: number of records read from the file at once
+    :type chunk_size: int
+    :return: generator of the moves and the winner of every game, see :func:`decode`
+    :rtype: generator
+    """
+    for record in read_records(path, chunk_size):
+        yield decode(record)
+
+
+def _check_magic(file):
+    """
+    :param file: file of records, at its start
+    :type file: io.BufferedReader
+    :raise ValueError: if the file is not a file of records
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f'{file.name} is not a file of game records')
@@ -0,0 +1,391 @@
+"""
+A game server that hosts many concurrent games on one event loop.
+
+Clients talk to the server with a line protocol. Every line is a command followed by its arguments, separated by
+spaces. Cells are numbered from 1, row by row, like the cells a human player enters.
+
+Client to server:
+
+* ``NEW <player x> <player o>`` starts a game. A player is ``remote`` (a client), ``ai`` or ``random``. The client takes
+  the first remote seat, or watches the game if there is none.
+* ``JOIN <game>`` takes the open remote seat of a game.
+* ``MOVE <cell>`` plays a move when it is the client's turn.
+* ``QUIT`` closes the connection.
+
+Server to client:
+
+* ``GAME <game> <mark>`` answers ``NEW`` and ``JOIN``, with the client's mark, or ``-`` for a client that watches.
+* ``TURN <position>`` asks for a move. The position lists the cells row by row, with ``.`` for an empty cell.
+* ``MOVE <mark> <cell>`` reports every move of the game.
+* ``END <mark>`` reports the winner, or ``END TIE``.
+* ``ABORT`` reports that a client playing the game has disconnected.
+* ``ERROR <message>`` reports an invalid command.
+"""
+import asyncio
+import sys
+from argparse import ArgumentParser
+from itertools import count, cycle
+
+from game import Game
+from players import AI, Player, RandomComputer
+from players.move_table import best_moves
+from players.rule_tables import block_fork_cells, fork_cell
+
+EMPTY_CELL = '.'
+
+
+def main(arguments=None):
+    """
+    Run the game server until it is interrupted.
+
+    :param arguments: command line arguments, sys.argv by default
+    :type arguments: list[str]
+    :return: exit code
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Host tic-tac-toe games for clients of a line protocol.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='port to listen on (default: 8765)')
+    arguments = parser.parse_args(arguments)
+
+    async def serve_forever():
+        server = await serve(arguments.host, arguments.port)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+async def serve(host='127.0.0.1', port=8765):
+    """
+    Start a game server.
+
+    The engines' tables are built before the server starts, so no move of an engine has to wait for them.
+
+    :param host: address to listen on
+    :type host: str
+    :param port: port to listen on, 0 for any free port
+    :type port: int
+    :return: the started server
+    :rtype: asyncio.Server
+    """
+    best_moves(0, 0)
+    fork_cell(0, 0)
+    block_fork_cells(0, 0)
+    return await asyncio.start_server(GameServer().handle, host, port)
+
+
+def position(board):
+    """
+    :param board: board of a game
+    :type board: BoardRepresentation
+    :return: the cells of the board row by row, with :data:`EMPTY_CELL` for an empty cell
+    :rtype: str
+    """
+    return ''.join(cell if cell != ' ' else EMPTY_CELL for row in board.rows for cell in row)
+
+
+def _number(text):
+    """
+    :param text: a number sent by a client
+    :type text: str
+    :return: the number, or None if the text is not a number written with the digits 0 to 9
+    :rtype: int
+    """
+    return int(text) if text.isascii() and text.isdecimal() else None
+
+
+class Remote(Player):
+    """Class that represents a player whose moves are sent by a client of the server."""
+
+    def __init__(self, mark):
+        """
+        Instantiate a remote player, which has no client until one takes its seat.
+
+        :param mark: the mark of the player (X, O)
+        :type mark: str
+        """
+        super().__init__(mark)
+        self.connection = None
+        self._move = None
+        self._choice = None
+
+    def turn(self, board):
+        """
+        Make a turn.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        :return: the legal move the client has sent last, see :meth:`wait`
+        :rtype: tuple
+        """
+        return self._choice
+
+    async def wait(self, board):
+        """
+        Ask the client for a move until it sends a legal one.
+
+        :param board: the current game's board
+        :type board: BoardRepresentation
+        """
+        number_of_cells = board.number_of_rows * board.number_of_columns
+        while True:
+            self._move = asyncio.get_running_loop().create_future()
+            await self.connection.send(f'TURN {position(board)}')
+            number = await self._move
+            row, column = divmod(number - 1, board.number_of_columns)
+            if not 0 < number <= number_of_cells:
+                await self.connection.send(f'ERROR cell {number} is out of bounds')
+            elif not board.is_cell_empty(row, column):
+                await self.connection.send(f'ERROR cell {number} is not empty')
+            else:
+                self._choice = row, column
+                return
+
+    def receive(self, number):
+        """
+        Pass a move sent by the client.
+
+        :param number: number of the cell, from 1
+        :type number: int
+        :return: whether the player was waiting for a move
+        :rtype: bool
+        """
+        if self._move is None or self._move.done():
+            return False
+        self._move.set_result(number)
+        return True
+
+
+class Connection:
+    """Class that represents a client connected to the server."""
+    __slots__ = ('writer', 'session', 'player')
+
+    def __init__(self, writer):
+        """
+        Instantiate a connection.
+
+        :param writer: stream of the connection
+        :type writer: asyncio.StreamWriter
+        """
+        self.writer = writer
+        self.session = None
+        self.player = None
+
+    async def send(self, line):
+        """
+        Send a line, and wait until the client has read enough of the lines before it, so a client that does not read
+        can not grow the buffer of the server without limit.
+
+        :param line: line to send to the client, without the line ending
+        :type line: str
+        """
+        self.writer.write(line.encode() + b'\n')
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass  # the handler of the connection removes it from its session
+
+
+class Session:
+    """Class that represents a game hosted by the server."""
+    __slots__ = ('id', 'game', 'connections', 'task')
+
+    def __init__(self, session_id, game):
+        """
+        Instantiate a session, which waits for clients until it is started.
+
+        :param session_id: identifier of the session
+        :type session_id: int
+        :param game: the hosted game
+        :type game: Game
+        """
+        self.id = session_id
+        self.game = game
+        self.connections = list()
+        self.task = None
+
+    def open_seat(self):
+        """
+        :return: the first remote player without a client, or None if there is none
+        :rtype: Remote
+        """
+        for player in (self.game.player_x, self.game.player_o):
+            if isinstance(player, Remote) and player.connection is None:
+                return player
+
+    async def broadcast(self, line):
+        """
+        :param line: line to send to every client of the session, without the line ending
+        :type line: str
+        """
+        for connection in self.connections[:]:  # clients may leave while others are read
+            await connection.send(line)
+
+    async def run(self):
+        """
+        Play the game to its end.
+
+        The engines move without waiting, so the session gives way to the other sessions after each of their moves.
+        """
+        board = self.game.board
+        representation = board.representation()
+        try:
+            for player in cycle((self.game.player_x, self.game.player_o)):
+                if isinstance(player, Remote):
+                    await player.wait(representation)
+                row, column = player.turn(representation)
+                won = board.move(player.mark, row, column)
+                await self.broadcast(f'MOVE {player.mark} {row * board.number_of_columns + column + 1}')
+                if won or board.is_full():
+                    await self.broadcast(f'END {player.mark if won else "TIE"}')
+                    return
+                if not isinstance(player, Remote):
+                    await asyncio.sleep(0)
+        finally:
+            for connection in self.connections:
+                connection.session = connection.player = None
+
+
+class GameServer:
+    """Class that serves the games of the clients connected to a server."""
+    PLAYER_TYPES = {'remote': Remote, 'ai': AI, 'random': RandomComputer}
+
+    def __init__(self):
+        """Instantiate a game server without sessions."""
+        self.sessions = dict()
+        self._ids = count(1)
+
+    async def handle(self, reader, writer):
+        """
+        Serve the commands of a client until it disconnects.
+
+        :param reader: stream of the client's commands
+        :type reader: asyncio.StreamReader
+        :param writer: stream of the server's answers
+        :type writer: asyncio.StreamWriter
+        """
+        connection = Connection(writer)
+        try:
+            async for line in reader:
+                command, *arguments = line.decode(errors='replace').split() or ('',)
+                command = command.upper()
+                if command == 'QUIT':
+                    break
+                if command == 'NEW' and len(arguments) == 2:
+                    await self._new(connection, *arguments)
+                elif command == 'JOIN' and len(arguments) == 1:
+                    await self._join(connection, arguments[0])
+                elif command == 'MOVE' and len(arguments) == 1:
+                    await self._move(connection, arguments[0])
+                else:
+                    await connection.send(f'ERROR invalid command {line.decode(errors="replace").strip()!r}')
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            await self._leave(connection)
+            writer.close()
+
+    async def _new(self, connection, player_x_name, player_o_name):
+        """
+        :param connection: client starting the game
+        :type connection: Connection
+        :param player_x_name: name of the type of the first player
+        :type player_x_name: str
+        :param player_o_name: name of the type of the second player
+        :type player_o_name: str
+        """
+        if connection.session is not None:
+            await connection.send('ERROR already in a game')
+            return
+        player_x_type = self.PLAYER_TYPES.get(player_x_name.lower())
+        player_o_type = self.PLAYER_TYPES.get(player_o_name.lower())
+        if player_x_type is None or player_o_type is None:
+            await connection.send(f'ERROR the players are one of {", ".join(self.PLAYER_TYPES)}')
+            return
+
+        session = Session(next(self._ids), Game(player_x_type, player_o_type))
+        self.sessions[session.id] = session
+        await self._seat(connection, session, session.open_seat())
+
+    async def _join(self, connection, session_id):
+        """
+        :param connection: client joining the game
+        :type connection: Connection
+        :param session_id: identifier of the game, as sent by the client
+        :type session_id: str
+        """
+        session = self.sessions.get(_number(session_id))
+        player = session.open_seat() if session is not None else None
+        if connection.session is not None:
+            await connection.send('ERROR already in a game')
+        elif player is None:
+            await connection.send(f'ERROR game {session_id} has no open seat')
+        else:
+            await self._seat(connection, session, player)
+
+    async def _seat(self, connection, session, player):
+        """
+        Add a client to a session, and start the session once all of its remote players have a client.
+
+        :param connection: client added to the session
+        :type connection: Connection
+        :param session: the session
+        :type session: Session
+        :param player: remote player the client plays, or None if the client watches
+        :type player: Remote
+        """
+        connection.session, connection.player = session, player
+        session.connections.append(connection)
+        if player is not None:
+            player.connection = connection
+        if session.open_seat() is None:
+            session.task = asyncio.get_running_loop().create_task(session.run())
+            session.task.add_done_callback(lambda _: self.sessions.pop(session.id, None))
+        await connection.send(f'GAME {session.id} {player.mark if player is not None else "-"}')
+
+    @staticmethod
+    async def _move(connection, number):
+        """
+        :param connection: client sending the move
+        :type connection: Connection
+        :param number: number of the cell, as sent by the client
+        :type number: str
+        """
+        cell = _number(number)
+        if cell is None:
+            await connection.send(f'ERROR {number!r} is not a cell number')
+        elif connection.player is None or not connection.player.receive(cell):
+            await connection.send('ERROR not your turn')
+
+    async def _leave(self, connection):
+        """
+        Remove a disconnected client from its session. A game that loses one of its remote players is aborted.
+
+        :param connection: the disconnected client
+        :type connection: Connection
+        """
+        session = connection.session
+        if session is None:
+            return
+        session.connections.remove(connection)
+        if connection.player is None:
+            connection.session = None
+            return
+
+        if session.task is None:
+            self.sessions.pop(session.id, None)
+        else:
+            session.task.cancel()
+        for other in session.connections:
+            other.session = other.player = None
+        connection.session = connection.player = None
+        await session.broadcast('ABORT')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
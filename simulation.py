@@ -0,0 +1,111 @@
+from collections import Counter
+from time import perf_counter
+
+from game import Game
+from players.player import random_stream
+
+
+class SimulationResult:
+    """Class that represents the aggregated results of simulated games, from the first player's point of view."""
+
+    def __init__(self):
+        """Instantiate empty simulation results."""
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.game_lengths = Counter()
+        self.elapsed = 0.0
+
+    def __str__(self):
+        """
+        :return: a string describing the results
+        :rtype: str
+        """
+        return (f'{self.games} games: {self.wins} wins, {self.draws} draws, {self.losses} losses '
+                f'({self.games_per_second:.0f} games per second)')
+
+    @property
+    def games(self):
+        """
+        :return: number of the simulated games
+        :rtype: int
+        """
+        return self.wins + self.draws + self.losses
+
+    @property
+    def games_per_second(self):
+        """
+        :return: number of games simulated per second
+        :rtype: float
+        """
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def record(self, winner, length):
+        """
+        Add the result of one game.
+
+        :param winner: mark of the winner, or None if the game ended in a tie
+        :type winner: str
+        :param length: number of moves played in the game
+        :type length: int
+        """
+        if winner is None:
+            self.draws += 1
+        elif winner == Game.FIRST_PLAYER_MARK:
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.game_lengths[length] += 1
+
+    def merge(self, other):
+        """
+        Add the results of other simulated games.
+
+        The elapsed time is not merged, since the other games might have been played at the same time.
+
+        :param other: results of other games
+        :type other: SimulationResult
+        """
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        self.game_lengths.update(other.game_lengths)
+
+
+def simulate(player_x_type, player_o_type, n_games, writer=None, seed=None, first_game=0):
+    """
+    Play games between two types of players without any output.
+
+    The same game, board and players are reused for all the games. With a seed, each player of the game numbered g
+    makes its choices with ``random_stream(seed, g, mark)`` (see :func:`players.player.random_stream`), so a game
+    played by players that keep no state between games can be replayed alone with :first_game: g.
+
+    :param player_x_type: type of the first player (player x)
+    :type player_x_type: Player
+    :param player_o_type: type of the second player (player o)
+    :type player_o_type: Player
+    :param n_games: number of games to play
+    :type n_games: int
+    :param writer: writer that stores the moves and the outcome of every game, none are stored by default
+    :type writer: records.RecordWriter
+    :param seed: seed of the random generators of the players, the global generator is used by default
+    :type seed: int or str
+    :param first_game: number of the first game, for the random generators of the players
+    :type first_game: int
+    :return: the aggregated results of the games
+    :rtype: SimulationResult
+    """
+    result = SimulationResult()
+    game = Game(player_x_type, player_o_type)
+    start = perf_counter()
+    for number in range(first_game, first_game + n_games):
+        game.reset()
+        if seed is not None:
+            for player in (game.player_x, game.player_o):
+                player.rng = random_stream(seed, number, player.mark)
+        winner = game.run()
+        result.record(winner, game.board.number_of_moves)
+        if writer is not None:
+            writer.write(game.board.moves, winner)
+    result.elapsed = perf_counter() - start
+    return result
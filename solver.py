@@ -0,0 +1,400 @@
+"""
+An exact solver of single positions of m,n,k boards, which splits the search between processes.
+
+``python solver.py --rows 4 --columns 4 --win-length 3 --moves 6 11`` prints the outcome, with perfect play, of the
+position after the given moves, numbered from 1 row by row and made in turn from player X, and its best moves.
+"""
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import c_uint64
+from multiprocessing.sharedctypes import RawArray
+from os import cpu_count
+
+from board.board import Board, _line_index
+from game import Game
+from players.tablebase_player import WIN, parent_score
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+MAX_CELLS = 27
+PROBES = 4
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_WORD = (1 << 64) - 1
+
+_searcher = None
+
+
+def main(arguments=None):
+    """
+    Solve a position and print its outcome and best moves.
+
+    :param arguments: command line arguments, sys.argv by default
+    :type arguments: list[str]
+    :return: exit code
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Solve a position exactly with a pool of worker processes.')
+    parser.add_argument('--rows', type=int, default=4, help='number of rows of the board (default: 4)')
+    parser.add_argument('--columns', type=int, default=4, help='number of columns of the board (default: 4)')
+    parser.add_argument('--win-length', type=int, default=4, help='number of marks in a row to win (default: 4)')
+    parser.add_argument('--moves', type=int, nargs='*', default=(), help='cells of the moves made, from 1')
+    parser.add_argument('--workers', type=int, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--split-depth', type=_positive, default=1,
+                        help='moves before splitting the work, at least 1 (default: 1)')
+    arguments = parser.parse_args(arguments)
+
+    board = Board(arguments.rows, arguments.columns, arguments.win_length)
+    marks = (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK)
+    for number, cell in enumerate(arguments.moves):
+        board.make_move(marks[number % 2], *divmod(cell - 1, arguments.columns))
+    solution = solve(board, arguments.workers, arguments.split_depth)
+    print(f'{solution}, {solution.nodes} positions searched')
+    return 0
+
+
+def _positive(text):
+    """
+    :param text: a command line argument
+    :type text: str
+    :return: the argument as a positive integer
+    :rtype: int
+    :raise ArgumentTypeError: if the argument is not a positive integer
+    """
+    number = int(text)
+    if number < 1:
+        raise ArgumentTypeError(f'{text} is not a positive integer')
+    return number
+
+
+class Solution:
+    """Class that represents the game-theoretic value of a position and its best moves."""
+
+    def __init__(self, score, move_scores, nodes):
+        """
+        Instantiate a solution.
+
+        :param score: score of the position for the player whose turn it is, see
+                      :class:`players.tablebase_player.Tablebase`
+        :type score: int
+        :param move_scores: score of every move, for the player who makes it, by row and column
+        :type move_scores: dict
+        :param nodes: number of positions searched by all the workers
+        :type nodes: int
+        """
+        self.score = score
+        self.move_scores = move_scores
+        self.nodes = nodes
+
+    def __str__(self):
+        """
+        :return: a string describing the solution
+        :rtype: str
+        """
+        return f'{self.outcome} in {self.distance} moves, best moves: {self.best_moves}'
+
+    @property
+    def outcome(self):
+        """
+        :return: 'win', 'draw' or 'loss', for the player whose turn it is
+        :rtype: str
+        """
+        return 'win' if self.score > 0 else 'loss' if self.score < 0 else 'draw'
+
+    @property
+    def distance(self):
+        """
+        :return: number of moves until the end of the game with perfect play, for a win or a loss
+        :rtype: int
+        """
+        return WIN - abs(self.score) if self.score else None
+
+    @property
+    def best_moves(self):
+        """
+        :return: the row and column of every move with the best score
+        :rtype: list[tuple]
+        """
+        return sorted(move for move, score in self.move_scores.items() if score == self.score)
+
+
+class SharedTable:
+    """
+    Class that represents a fixed-size hash table of solved positions, in memory shared by processes.
+
+    Every entry is one 64 bits word, ``(key + 1) << 10 | flag << 8 | score``, so it is written and read whole and no
+    locks are needed: a worker either sees an entry of another worker or does not, and an entry lost to a concurrent
+    write only costs searching the position again. A position is stored in one of :data:`PROBES` slots from the one
+    its key hashes to, and replaces the first of them when they are all taken.
+    """
+
+    def __init__(self, words):
+        """
+        :param words: the shared words of the table, a power of 2 of them
+        :type words: multiprocessing.sharedctypes.RawArray
+        """
+        self._words = words
+        self._mask = len(words) - 1
+        self._shift = 64 - self._mask.bit_length()
+
+    @staticmethod
+    def allocate(size_bits):
+        """
+        :param size_bits: the table holds 2 ** :size_bits: entries
+        :type size_bits: int
+        :return: zeroed shared words for a table
+        :rtype: multiprocessing.sharedctypes.RawArray
+        """
+        return RawArray(c_uint64, 1 << size_bits)
+
+    def get(self, key):
+        """
+        :param key: key of a position
+        :type key: int
+        :return: the flag and the score of the position, or None if it is not stored
+        :rtype: tuple
+        """
+        words, mask, index = self._words, self._mask, (key * _MULTIPLIER & _WORD) >> self._shift
+        for probe in range(PROBES):
+            word = words[index + probe & mask]
+            if not word:
+                return None
+            if word >> 10 == key + 1:
+                score = word & 0xff
+                return word >> 8 & 0b11, score - 256 if score > 127 else score
+
+    def put(self, key, flag, score):
+        """
+        :param key: key of a position
+        :type key: int
+        :param flag: whether the score is EXACT, a LOWER_BOUND or an UPPER_BOUND
+        :type flag: int
+        :param score: score of the position
+        :type score: int
+        """
+        words, mask, index = self._words, self._mask, (key * _MULTIPLIER & _WORD) >> self._shift
+        slot = index
+        for probe in range(PROBES):
+            word = words[index + probe & mask]
+            if not word or word >> 10 == key + 1:
+                slot = index + probe & mask
+                break
+        words[slot] = (key + 1) << 10 | flag << 8 | score & 0xff
+
+
+class _Searcher:
+    """Class that solves positions of one board shape with an alpha-beta search, sharing a table."""
+
+    def __init__(self, words, number_of_rows, number_of_columns, win_length):
+        """
+        :param words: the shared words of the table
+        :type words: multiprocessing.sharedctypes.RawArray
+        :param number_of_rows: number of rows of the board (m)
+        :type number_of_rows: int
+        :param number_of_columns: number of columns of the board (n)
+        :type number_of_columns: int
+        :param win_length: number of marks in a row needed to win (k)
+        :type win_length: int
+        """
+        self.table = SharedTable(words)
+        self.number_of_cells = number_of_rows * number_of_columns
+        self.full = (1 << self.number_of_cells) - 1
+        lines, cell_lines = _line_index(number_of_rows, number_of_columns, win_length)
+        self.cell_lines = tuple(tuple(lines[line] for line in cell) for cell in cell_lines)
+        center_row, center_column = (number_of_rows - 1) / 2, (number_of_columns - 1) / 2
+        self.cells = tuple(sorted(range(self.number_of_cells), key=lambda cell: (
+            abs(cell // number_of_columns - center_row) + abs(cell % number_of_columns - center_column))))
+        self.nodes = 0
+
+    def negamax(self, own, other, alpha=-WIN, beta=WIN):
+        """
+        :param own: bitboard of the player whose turn it is
+        :type own: int
+        :param other: bitboard of the other player
+        :type other: int
+        :param alpha: lower bound of the score
+        :type alpha: int
+        :param beta: upper bound of the score
+        :type beta: int
+        :return: score of the position for the player whose turn it is
+        :rtype: int
+        """
+        self.nodes += 1
+        key = own | other << self.number_of_cells
+        entry = self.table.get(key)
+        if entry is not None:
+            flag, score = entry
+            if flag == EXACT:
+                return score
+            if flag == LOWER_BOUND:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        # The bounds of the entry are relative to the window searched, after the stored bounds have narrowed it.
+        original_alpha, occupied, best = alpha, own | other, -WIN
+        for cell in self.cells:
+            if occupied >> cell & 1:
+                continue
+            new_own = own | 1 << cell
+            if any(new_own & line == line for line in self.cell_lines[cell]):
+                score = WIN - 1
+            elif occupied | 1 << cell == self.full:
+                score = 0
+            else:
+                # parent_score moves a score one move towards 0, so the window of the child is one wider.
+                score = parent_score(self.negamax(other, new_own, -beta - 1, -alpha + 1))
+            best = max(best, score)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        flag = UPPER_BOUND if best <= original_alpha else LOWER_BOUND if best >= beta else EXACT
+        self.table.put(key, flag, best)
+        return best
+
+
+def solve(board, workers=None, split_depth=1, table_size_bits=22):
+    """
+    Return the game-theoretic value and the best moves of a position.
+
+    The positions :split_depth: moves after the given one are solved exactly by a pool of worker processes, which
+    share the positions they have solved through a :class:`SharedTable`. Their scores are then combined up to the
+    given position, so every move gets its exact score.
+
+    :param board: the position, with player X moving first
+    :type board: Board
+    :param workers: number of worker processes, the number of CPUs by default
+    :type workers: int
+    :param split_depth: number of moves after the position where the work is split between the workers, at least 1
+    :type split_depth: int
+    :param table_size_bits: the shared table holds 2 ** :table_size_bits: entries
+    :type table_size_bits: int
+    :return: the solution of the position
+    :rtype: Solution
+    :raise ValueError: if the board is too large, the game has ended or :split_depth: is less than 1
+    """
+    shape = board.number_of_rows, board.number_of_columns, board.win_length
+    number_of_cells = board.number_of_rows * board.number_of_columns
+    if number_of_cells > MAX_CELLS:
+        raise ValueError(f'the solver solves boards of up to {MAX_CELLS} cells')
+    if board.winner is not None or board.is_full():
+        raise ValueError('the game has ended')
+    if split_depth < 1:
+        raise ValueError('the work is split at least one move after the position')
+    bitboard_x, bitboard_o = board.bitboard(Game.FIRST_PLAYER_MARK), board.bitboard(Game.SECOND_PLAYER_MARK)
+    if bin(bitboard_x).count('1') == bin(bitboard_o).count('1'):
+        own, other = bitboard_x, bitboard_o
+    else:
+        own, other = bitboard_o, bitboard_x
+
+    words = SharedTable.allocate(table_size_bits)
+    searcher = _Searcher(words, *shape)
+    frontier = list()
+    _collect(searcher, own, other, split_depth, frontier)
+    frontier = list(dict.fromkeys(frontier))  # transpositions are solved once
+
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        results = [searcher.negamax(*position) for position in frontier]
+        nodes = searcher.nodes
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(words,) + shape) as executor:
+            results, node_counts = zip(*executor.map(_solve_position, frontier)) if frontier else ((), ())
+        nodes = sum(node_counts)
+
+    move_scores = _move_scores(searcher, own, other, split_depth, dict(zip(frontier, results)))
+    return Solution(max(move_scores.values()),
+                    {divmod(cell, board.number_of_columns): score for cell, score in move_scores.items()}, nodes)
+
+
+def _collect(searcher, own, other, depth, frontier):
+    """
+    Collect the positions that go on :depth: moves after a position.
+
+    :param searcher: searcher of the board's shape
+    :type searcher: _Searcher
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :param depth: number of moves
+    :type depth: int
+    :param frontier: list the positions are added to, as the bitboards of the player whose turn it is and of the other
+    :type frontier: list
+    """
+    if not depth:
+        frontier.append((own, other))
+        return
+    occupied = own | other
+    for cell in searcher.cells:
+        new_own = own | 1 << cell
+        if not (occupied >> cell & 1 or any(new_own & line == line for line in searcher.cell_lines[cell])
+                or occupied | 1 << cell == searcher.full):
+            _collect(searcher, other, new_own, depth - 1, frontier)
+
+
+def _move_scores(searcher, own, other, depth, solved):
+    """
+    :param searcher: searcher of the board's shape
+    :type searcher: _Searcher
+    :param own: bitboard of the player whose turn it is
+    :type own: int
+    :param other: bitboard of the other player
+    :type other: int
+    :param depth: number of moves until the solved positions
+    :type depth: int
+    :param solved: score of every solved position, by the bitboards of the player whose turn it is and of the other
+    :type solved: dict
+    :return: score of every move of the position, for the player who makes it, by cell
+    :rtype: dict
+    """
+    scores, occupied = dict(), own | other
+    for cell in searcher.cells:
+        if occupied >> cell & 1:
+            continue
+        new_own = own | 1 << cell
+        if any(new_own & line == line for line in searcher.cell_lines[cell]):
+            scores[cell] = WIN - 1
+        elif occupied | 1 << cell == searcher.full:
+            scores[cell] = 0
+        elif depth == 1:
+            scores[cell] = parent_score(solved[other, new_own])
+        else:
+            scores[cell] = parent_score(max(_move_scores(searcher, other, new_own, depth - 1, solved).values()))
+    return scores
+
+
+def _init_worker(words, number_of_rows, number_of_columns, win_length):
+    """
+    Prepare a worker to solve positions of a board shape.
+
+    :param words: the shared words of the table
+    :type words: multiprocessing.sharedctypes.RawArray
+    :param number_of_rows: number of rows of the board (m)
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board (n)
+    :type number_of_columns: int
+    :param win_length: number of marks in a row needed to win (k)
+    :type win_length: int
+    """
+    global _searcher
+    _searcher = _Searcher(words, number_of_rows, number_of_columns, win_length)
+
+
+def _solve_position(position):
+    """
+    Solve one position in a worker.
+
+    :param position: bitboards of the player whose turn it is and of the other player
+    :type position: tuple
+    :return: score of the position, and the number of positions searched by the worker so far
+    :rtype: tuple
+    """
+    _searcher.nodes = 0
+    return _searcher.negamax(*position), _searcher.nodes
+
+
+if __name__ == '__main__':
+    sys.exit(main())
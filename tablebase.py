@@ -0,0 +1,277 @@
+import sys
+from argparse import ArgumentParser
+from contextlib import ExitStack
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from board.board import _line_index
+from players.tablebase_player import HEADER_SIZE, MAGIC, UNKNOWN, WIN
+
+MAX_CELLS = 16
+CHUNK_SIZE = 1 << 20
+
+
+def main(arguments=None):
+    """
+    Build a tablebase file.
+
+    :param arguments: command line arguments, sys.argv by default
+    :type arguments: list[str]
+    :return: exit code
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Solve every position of a board and save the scores to a tablebase file.')
+    parser.add_argument('path', help='path of the tablebase file')
+    parser.add_argument('--rows', type=int, default=4, help='number of rows of the board (default: 4)')
+    parser.add_argument('--columns', type=int, default=4, help='number of columns of the board (default: 4)')
+    parser.add_argument('--win-length', type=int, default=4, help='number of marks in a row to win (default: 4)')
+    parser.add_argument('--work-directory',
+                        help='directory of the intermediate files, removed at the end, a temporary one by default')
+    arguments = parser.parse_args(arguments)
+    build_tablebase(arguments.path, arguments.rows, arguments.columns, arguments.win_length, arguments.work_directory)
+    return 0
+
+
+def build_tablebase(path, number_of_rows=4, number_of_columns=4, win_length=4, work_directory=None):
+    """
+    Solve every position that can be reached in a game and save the scores to a tablebase file.
+
+    The positions are handled layer by layer, by their number of marks. A forward pass saves the positions of every
+    layer to a file of the work directory: the children of every chunk of a layer are sorted into a run file, and the
+    runs are merged on disk into the next layer. A backward pass then scores the layers from the last one to the first
+    one, reading the scores of every next layer from the tablebase file itself, which is memory-mapped. Only a chunk of
+    positions and their moves are held in memory at a time. See :class:`players.tablebase_player.Tablebase` for the
+    format of the file.
+
+    :param path: path of the tablebase file
+    :type path: str
+    :param number_of_rows: number of rows of the board (m)
+    :type number_of_rows: int
+    :param number_of_columns: number of columns of the board (n)
+    :type number_of_columns: int
+    :param win_length: number of marks in a row needed to win (k)
+    :type win_length: int
+    :param work_directory: directory of the intermediate files, created if it does not exist, a temporary one by
+                           default. The intermediate files are removed when the build ends.
+    :type work_directory: str
+    """
+    number_of_cells = number_of_rows * number_of_columns
+    if number_of_cells > MAX_CELLS:
+        raise ValueError(f'a tablebase holds boards of up to {MAX_CELLS} cells')
+    lines = np.array(_line_index(number_of_rows, number_of_columns, win_length)[0], dtype=np.int64)
+
+    with ExitStack() as stack:
+        if work_directory is None:
+            directory = Path(stack.enter_context(TemporaryDirectory()))
+        else:
+            directory = Path(work_directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            stack.callback(_remove_layers, directory, number_of_cells)
+        _forward(directory, number_of_cells, lines)
+
+        with open(path, 'wb') as file:
+            file.write(MAGIC + bytes((number_of_rows, number_of_columns, win_length)))
+            file.write(bytes(HEADER_SIZE - len(MAGIC) - 3))
+        table = np.memmap(path, dtype=np.int8, mode='r+', offset=HEADER_SIZE, shape=(3 ** number_of_cells,))
+        table[:] = UNKNOWN
+        for layer in range(number_of_cells, -1, -1):
+            _backward(directory, layer, number_of_cells, lines, table)
+        table.flush()
+        del table
+
+
+def _layer_path(directory, layer):
+    """
+    :param directory: work directory
+    :type directory: pathlib.Path
+    :param layer: number of marks of the positions
+    :type layer: int
+    :return: path of the file of the positions of the layer
+    :rtype: pathlib.Path
+    """
+    return directory / f'layer{layer}.bin'
+
+
+def _run_path(directory, layer, number):
+    """
+    :param directory: work directory
+    :type directory: pathlib.Path
+    :param layer: number of marks of the positions
+    :type layer: int
+    :param number: number of the run
+    :type number: int
+    :return: path of a file of sorted positions of the layer, to be merged into the file of the layer
+    :rtype: pathlib.Path
+    """
+    return directory / f'layer{layer}.run{number}.bin'
+
+
+def _load(path):
+    """
+    :param path: path of a file of positions, raw 8 bytes integers
+    :type path: pathlib.Path
+    :return: the memory-mapped positions
+    :rtype: numpy.ndarray
+    """
+    if not path.stat().st_size:  # an empty file can not be memory-mapped
+        return np.empty(0, dtype=np.int64)
+    return np.memmap(path, dtype=np.int64, mode='r')
+
+
+def _remove_layers(directory, number_of_cells):
+    """
+    Remove the intermediate files of a build from a work directory.
+
+    :param directory: work directory
+    :type directory: pathlib.Path
+    :param number_of_cells: number of cells of the board
+    :type number_of_cells: int
+    """
+    for layer in range(number_of_cells + 1):
+        _layer_path(directory, layer).unlink(missing_ok=True)
+        for path in directory.glob(_run_path(directory, layer, '*').name):
+            path.unlink()
+
+
+def _forward(directory, number_of_cells, lines):
+    """
+    Save the indices of the positions of every layer, in ascending order.
+
+    :param directory: work directory
+    :type directory: pathlib.Path
+    :param number_of_cells: number of cells of the board
+    :type number_of_cells: int
+    :param lines: bitmask of every line
+    :type lines: numpy.ndarray
+    """
+    np.zeros(1, dtype=np.int64).tofile(_layer_path(directory, 0))
+    for layer in range(number_of_cells):
+        positions = _load(_layer_path(directory, layer))
+        content = 1 if layer % 2 == 0 else 2
+        run_paths = list()
+        for start in range(0, len(positions), CHUNK_SIZE):
+            chunk = np.asarray(positions[start:start + CHUNK_SIZE])
+            chunk = chunk[~_finished(chunk, layer, number_of_cells, lines)]
+            children = list()
+            for cell in range(number_of_cells):
+                power = 3 ** cell
+                children.append(chunk[chunk // power % 3 == 0] + content * power)
+            run_paths.append(_run_path(directory, layer + 1, len(run_paths)))
+            np.unique(np.concatenate(children)).tofile(run_paths[-1])
+        del positions
+        _merge(run_paths, _layer_path(directory, layer + 1))
+
+
+def _merge(run_paths, path):
+    """
+    Merge files of sorted positions into one file of sorted positions without duplicates, and remove them.
+
+    The runs are read a block at a time. Every round takes, from every run, the positions up to the smallest last
+    position of the blocks: the runs hold no duplicates, so no position of a later round is lower or equal.
+
+    :param run_paths: paths of the files of sorted positions, without duplicates within a file
+    :type run_paths: list[pathlib.Path]
+    :param path: path of the merged file
+    :type path: pathlib.Path
+    """
+    runs = [_load(run_path) for run_path in run_paths]
+    offsets = [0] * len(runs)
+    block_size = max(1, CHUNK_SIZE // max(1, len(runs)))
+    with open(path, 'wb') as file:
+        while True:
+            blocks = [(index, np.asarray(run[offsets[index]:offsets[index] + block_size]))
+                      for index, run in enumerate(runs) if offsets[index] < len(run)]
+            if not blocks:
+                break
+            bound = min(block[-1] for _, block in blocks)
+            parts = list()
+            for index, block in blocks:
+                taken = int(np.searchsorted(block, bound, side='right'))
+                parts.append(block[:taken])
+                offsets[index] += taken
+            np.unique(np.concatenate(parts)).tofile(file)
+    del runs
+    for run_path in run_paths:
+        run_path.unlink()
+
+
+def _backward(directory, layer, number_of_cells, lines, table):
+    """
+    Score the positions of a layer, from the scores of the next layer.
+
+    :param directory: work directory
+    :type directory: pathlib.Path
+    :param layer: number of marks of the positions
+    :type layer: int
+    :param number_of_cells: number of cells of the board
+    :type number_of_cells: int
+    :param lines: bitmask of every line
+    :type lines: numpy.ndarray
+    :param table: the scores of all the positions, by index
+    :type table: numpy.memmap
+    """
+    positions = _load(_layer_path(directory, layer))
+    content = 1 if layer % 2 == 0 else 2
+    for start in range(0, len(positions), CHUNK_SIZE):
+        chunk = np.asarray(positions[start:start + CHUNK_SIZE])
+        lost = _won_by_last_player(chunk, layer, lines)
+        scores = np.where(lost, -WIN, 0).astype(np.int16)
+        if layer < number_of_cells:
+            best = np.full(len(chunk), -WIN - 1, dtype=np.int16)
+            for cell in range(number_of_cells):
+                power = 3 ** cell
+                empty = (chunk // power % 3 == 0) & ~lost
+                child_scores = table[chunk[empty] + content * power].astype(np.int16)
+                move_scores = np.where(child_scores > 0, 1 - child_scores,
+                                       np.where(child_scores < 0, -1 - child_scores, 0))
+                best[empty] = np.maximum(best[empty], move_scores)
+            scores = np.where(best > -WIN - 1, best, scores)
+        table[chunk] = scores.astype(np.int8)
+    del positions
+
+
+def _finished(positions, layer, number_of_cells, lines):
+    """
+    :param positions: indices of positions of a layer
+    :type positions: numpy.ndarray
+    :param layer: number of marks of the positions
+    :type layer: int
+    :param number_of_cells: number of cells of the board
+    :type number_of_cells: int
+    :param lines: bitmask of every line
+    :type lines: numpy.ndarray
+    :return: whether every position ends the game
+    :rtype: numpy.ndarray
+    """
+    if layer == number_of_cells:
+        return np.ones(len(positions), dtype=bool)
+    return _won_by_last_player(positions, layer, lines)
+
+
+def _won_by_last_player(positions, layer, lines):
+    """
+    :param positions: indices of positions of a layer
+    :type positions: numpy.ndarray
+    :param layer: number of marks of the positions
+    :type layer: int
+    :param lines: bitmask of every line
+    :type lines: numpy.ndarray
+    :return: whether the player who made the last move has completed a line in every position
+    :rtype: numpy.ndarray
+    """
+    if layer == 0:
+        return np.zeros(len(positions), dtype=bool)
+    content = 1 if layer % 2 else 2
+    bitboards = np.zeros(len(positions), dtype=np.int64)
+    remaining, cell = positions.copy(), 0
+    while remaining.any():
+        bitboards |= (remaining % 3 == content).astype(np.int64) << cell
+        remaining //= 3
+        cell += 1
+    return ((bitboards[:, np.newaxis] & lines) == lines).any(axis=1)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
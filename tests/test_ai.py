@@ -1,10 +1,11 @@
-from itertools import product
+from itertools import cycle, product
 
 from pytest import mark
 
 from board.board import Board
 from game import Game
-from players import AI
+from players import AI, RandomComputer
+from players.move_table import best_moves
 
 
 @mark.parametrize('player_mark', (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK))
@@ -19,24 +20,24 @@ def test_second_turn_corner_opening(player_mark):
     other_mark = Game.FIRST_PLAYER_MARK
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', ' ', ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', ' ', ' '],
+                        [' ', ' ', ' ']])
     assert ai._second_turn(board.representation()) == (1, 1)
 
-    board._rows = [[' ', ' ', other_mark],
-                   [' ', ' ', ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[' ', ' ', other_mark],
+                        [' ', ' ', ' '],
+                        [' ', ' ', ' ']])
     assert ai._second_turn(board.representation()) == (1, 1)
 
-    board._rows = [[' ', ' ', ' '],
-                   [' ', ' ', ' '],
-                   [' ', ' ', other_mark]]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', ' ', ' '],
+                        [' ', ' ', other_mark]])
     assert ai._second_turn(board.representation()) == (1, 1)
 
-    board._rows = [[' ', ' ', ' '],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', ' ']]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', ' ']])
     assert ai._second_turn(board.representation()) == (1, 1)
 
 
@@ -45,9 +46,9 @@ def test_second_turn_center_opening(player_mark):
     other_mark = Game.FIRST_PLAYER_MARK
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[' ', ' ', ' '],
-                   [' ', other_mark, ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', other_mark, ' '],
+                        [' ', ' ', ' ']])
     for _ in range(100):
         assert ai._second_turn(board.representation()) in product((0, 2), (0, 2))
 
@@ -56,24 +57,24 @@ def test_second_turn_center_opening(player_mark):
 def test_win(player_mark):
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[player_mark, ' ', player_mark],
-                   [' ', ' ', ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[player_mark, ' ', player_mark],
+                        [' ', ' ', ' '],
+                        [' ', ' ', ' ']])
     assert ai.turn(board.representation()) == (0, 1)
 
-    board._rows = [[' ', player_mark, ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[' ', player_mark, ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', ' ']])
     assert ai.turn(board.representation()) == (2, 1)
 
-    board._rows = [[' ', ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', player_mark]]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', player_mark]])
     assert ai.turn(board.representation()) == (0, 0)
 
-    board._rows = [[' ', ' ', player_mark],
-                   [' ', ' ', ' '],
-                   [player_mark, ' ', ' ']]
+    board.set_position([[' ', ' ', player_mark],
+                        [' ', ' ', ' '],
+                        [player_mark, ' ', ' ']])
     assert ai.turn(board.representation()) == (1, 1)
 
 
@@ -82,29 +83,29 @@ def test_block(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', other_mark],
-                   [' ', ' ', ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[other_mark, ' ', other_mark],
+                        [' ', ' ', ' '],
+                        [' ', ' ', ' ']])
     assert ai.turn(board.representation()) == (0, 1)
 
-    board._rows = [[' ', other_mark, ' '],
-                   [' ', other_mark, ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[' ', other_mark, ' '],
+                        [' ', other_mark, ' '],
+                        [' ', ' ', ' ']])
     assert ai.turn(board.representation()) == (2, 1)
 
-    board._rows = [[' ', ' ', ' '],
-                   [' ', other_mark, ' '],
-                   [' ', ' ', other_mark]]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', other_mark, ' '],
+                        [' ', ' ', other_mark]])
     assert ai.turn(board.representation()) == (0, 0)
 
-    board._rows = [[' ', ' ', other_mark],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', ' ']]
+    board.set_position([[' ', ' ', other_mark],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', ' ']])
     assert ai.turn(board.representation()) == (1, 1)
 
-    board._rows = [[player_mark, ' ', ' '],
-                   [other_mark, other_mark, ' '],
-                   [player_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', ' '],
+                        [other_mark, other_mark, ' '],
+                        [player_mark, ' ', other_mark]])
     assert ai.turn(board.representation()) == (1, 2)
 
 
@@ -113,14 +114,14 @@ def test_create_fork(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[player_mark, ' ', ' '],
-                   [' ', other_mark, ' '],
-                   [' ', ' ', player_mark]]
+    board.set_position([[player_mark, ' ', ' '],
+                        [' ', other_mark, ' '],
+                        [' ', ' ', player_mark]])
     assert ai.turn(board.representation()) in ((2, 0), (0, 2))
 
-    board._rows = [[player_mark, ' ', ' '],
-                   [player_mark, ' ', ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[player_mark, ' ', ' '],
+                        [player_mark, ' ', ' '],
+                        [' ', ' ', ' ']])
     assert ai._fork(board.representation()) == (1, 1)
 
 
@@ -129,14 +130,14 @@ def test_block_fork(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', other_mark]]
-    assert ai.turn(board.representation()) in ((0, 2), (2, 0))
-
-    board._rows = [[player_mark, ' ', ' '],
-                   [' ', other_mark, ' '],
-                   [' ', ' ', other_mark]]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', other_mark]])
+    assert ai.turn(board.representation()) in ((0, 1), (1, 2), (1, 0), (2, 1))
+
+    board.set_position([[player_mark, ' ', ' '],
+                        [' ', other_mark, ' '],
+                        [' ', ' ', other_mark]])
     assert ai.turn(board.representation()) in ((0, 2), (2, 0))
 
 
@@ -145,14 +146,14 @@ def test_center(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', other_mark]]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', other_mark]])
     assert ai._center(board.representation()) is None
 
-    board._rows = [[player_mark, ' ', ' '],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', ' '],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', other_mark]])
     assert ai._center(board.representation()) == (1, 1)
 
 
@@ -161,19 +162,19 @@ def test_opposite_corner(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', ' ']])
     assert ai._opposite_corner(board.representation()) == (2, 2)
 
-    board._rows = [[player_mark, ' ', ' '],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', ' '],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', other_mark]])
     assert ai._opposite_corner(board.representation()) == (0, 2)
 
-    board._rows = [[player_mark, ' ', player_mark],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', player_mark],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', other_mark]])
     assert ai._opposite_corner(board.representation()) is None
 
 
@@ -182,19 +183,19 @@ def test_empty_corner(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', ' ', ' ']]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', ' ', ' ']])
     assert ai._empty_corner(board.representation()) in ((0, 2), (2, 2), (2, 0))
 
-    board._rows = [[player_mark, ' ', ' '],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', ' '],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', other_mark]])
     assert ai._empty_corner(board.representation()) == (0, 2)
 
-    board._rows = [[player_mark, ' ', player_mark],
-                   [' ', ' ', ' '],
-                   [other_mark, ' ', other_mark]]
+    board.set_position([[player_mark, ' ', player_mark],
+                        [' ', ' ', ' '],
+                        [other_mark, ' ', other_mark]])
     assert ai._empty_corner(board.representation()) is None
 
 
@@ -203,22 +204,56 @@ def test_empty_edge(player_mark):
     other_mark = other_player(player_mark)
     ai = AI(player_mark)
     board = Board()
-    board._rows = [[other_mark, ' ', ' '],
-                   [' ', player_mark, ' '],
-                   [' ', player_mark, ' ']]
+    board.set_position([[other_mark, ' ', ' '],
+                        [' ', player_mark, ' '],
+                        [' ', player_mark, ' ']])
     assert ai._empty_edge(board.representation()) in ((0, 1), (1, 2), (1, 0))
 
-    board._rows = [[player_mark, other_mark, ' '],
-                   [' ', ' ', ' '],
-                   [other_mark, player_mark, other_mark]]
+    board.set_position([[player_mark, other_mark, ' '],
+                        [' ', ' ', ' '],
+                        [other_mark, player_mark, other_mark]])
     assert ai._empty_edge(board.representation()) in ((1, 2), (1, 0))
 
-    board._rows = [[player_mark, player_mark, player_mark],
-                   [other_mark, ' ', player_mark],
-                   [other_mark, other_mark, other_mark]]
+    board.set_position([[player_mark, player_mark, player_mark],
+                        [other_mark, ' ', player_mark],
+                        [other_mark, other_mark, other_mark]])
     assert ai._empty_edge(board.representation()) is None
 
 
+@mark.parametrize('player_mark', (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK))
+def test_never_loses(player_mark):
+    other_mark = other_player(player_mark)
+    ai = AI(player_mark)
+    opponent = RandomComputer(other_mark)
+    for _ in range(200):
+        board = Board()
+        players = cycle((ai, opponent) if player_mark == Game.FIRST_PLAYER_MARK else (opponent, ai))
+        for player in players:
+            row, column = player.turn(board.representation())
+            if board.move(player.mark, row, column):
+                assert player is ai
+                break
+            if board.is_full():
+                break
+
+
+@mark.parametrize('player_mark', (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK))
+def test_generic_board(player_mark):
+    other_mark = other_player(player_mark)
+    ai = AI(player_mark)
+    board = Board(5, 5, 4)
+    assert ai.turn(board.representation()) == (2, 2)
+
+    for row in range(1, 4):
+        board.move(other_mark, row, 4 - row)
+    assert ai.turn(board.representation()) in ((0, 4), (4, 0))
+
+    board.move(player_mark, 0, 4)
+    for column in range(3):
+        board.move(player_mark, 4, column)
+    assert ai.turn(board.representation()) == (4, 3)
+
+
 def other_player(player_mark):
     """
     Return the other player's mark, based on the given mark.
@@ -229,3 +264,26 @@ def other_player(player_mark):
     :rtype: str
     """
     return Game.FIRST_PLAYER_MARK if player_mark == Game.SECOND_PLAYER_MARK else Game.SECOND_PLAYER_MARK
+
+
+@mark.parametrize('player_mark', (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK))
+def test_turn_many(player_mark):
+    other_mark = other_player(player_mark)
+    ai = AI(player_mark)
+    boards = [Board() for _ in range(3)]
+    boards[1].move(other_mark, 0, 0)
+    boards[2].set_position([[' ', player_mark, ' '],
+                            [' ', player_mark, ' '],
+                            [' ', ' ', ' ']])  # can not be reached in a game: answered by the rule list
+    if player_mark == Game.FIRST_PLAYER_MARK:
+        boards = boards[:1] + boards[2:]
+    else:
+        boards = boards[1:]
+    positions = [board.bitboard(Game.FIRST_PLAYER_MARK) | board.bitboard(Game.SECOND_PLAYER_MARK) << 9
+                 for board in boards]
+
+    for _ in range(20):
+        cells = ai.turn_many(positions)
+        assert len(cells) == len(boards)
+        assert cells[0] in best_moves(boards[0].bitboard(player_mark), boards[0].bitboard(other_mark))
+        assert divmod(cells[-1], 3) == (2, 1)
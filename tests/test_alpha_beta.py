@@ -0,0 +1,53 @@
+from pytest import mark
+
+from board.board import Board
+from game import Game
+from players import AlphaBeta, RandomComputer
+from players.alpha_beta import TranspositionTable, EXACT, LOWER_BOUND
+from simulation import simulate
+
+
+def test_never_loses():
+    assert simulate(AlphaBeta, RandomComputer, 50).losses == 0
+    assert simulate(RandomComputer, AlphaBeta, 50).wins == 0
+
+
+@mark.parametrize('player_mark', (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK))
+def test_win_and_block(player_mark):
+    other_mark = Game.FIRST_PLAYER_MARK if player_mark == Game.SECOND_PLAYER_MARK else Game.SECOND_PLAYER_MARK
+    player = AlphaBeta(player_mark, max_depth=4)
+    board = Board(5, 5, 4)
+    for column in range(3):
+        board.move(other_mark, 4, column + 1)
+    board.move(player_mark, 4, 0)
+    board.move(player_mark, 0, 0)
+    assert player.turn(board.representation()) == (4, 4)
+
+    for row in range(1, 3):
+        board.move(player_mark, row, row)
+    assert player.turn(board.representation()) == (3, 3)
+
+
+def test_time_limit():
+    player = AlphaBeta(Game.FIRST_PLAYER_MARK, time_limit=0.01)
+    board = Board(5, 5, 4)
+    row, column = player.turn(board.representation())
+    assert board.is_cell_empty(row, column)
+    assert player.depth >= 1
+
+
+def test_transposition_table_replacement():
+    table = TranspositionTable(4)
+    table.put(1, 5, 10, EXACT, 3)
+    table.put(17, 2, 20, LOWER_BOUND, 4)
+    assert table.get(17) is None
+    assert table.get(1)[2:] == (5, 10, EXACT, 3)
+
+    table.generation += 1
+    table.put(17, 2, 20, LOWER_BOUND, 4)
+    assert table.get(1) is None
+    assert table.get(17)[2:] == (2, 20, LOWER_BOUND, 4)
+
+    table.clear()
+    assert table.get(17) is None
+    assert table.generation == 0
@@ -0,0 +1,23 @@
+from pytest import importorskip
+
+np = importorskip('numpy')
+
+from batch import FIRST_PLAYER, SECOND_PLAYER, BatchGames, simulate_random  # noqa: E402
+
+
+def test_games_are_legal():
+    games = BatchGames(1000, np.random.default_rng(3))
+    games.play()
+    marks = (games.cells == FIRST_PLAYER).sum(axis=1), (games.cells == SECOND_PLAYER).sum(axis=1)
+    assert (marks[0] + marks[1] == games.lengths).all()
+    assert ((marks[0] - marks[1] == 0) | (marks[0] - marks[1] == 1)).all()
+    assert (games.lengths >= 5).all()
+    assert (games.winners[games.lengths < 9] != 0).all()
+
+
+def test_simulate_random():
+    result = simulate_random(10000, batch_size=3000, seed=1)
+    assert result.games == 10000
+    assert sum(result.game_lengths.values()) == 10000
+    assert result.wins > result.losses > result.draws
+    assert simulate_random(10000, batch_size=3000, seed=1).game_lengths == result.game_lengths
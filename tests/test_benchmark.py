@@ -0,0 +1,18 @@
+from benchmark import compare, generate_games, group_by_rule, _board_after
+
+
+def test_compare():
+    baseline = {'benchmarks': {'fast': {'seconds_per_call': 1.0}, 'slow': {'seconds_per_call': 1.0}}}
+    results = {'benchmarks': {'fast': {'seconds_per_call': 1.05}, 'slow': {'seconds_per_call': 1.5},
+                              'new': {'seconds_per_call': 9.0}}}
+    assert compare(results, baseline, 0.1) == {'slow': 1.5}
+    assert compare(results, baseline, 0.6) == {}
+
+
+def test_group_by_rule():
+    games = generate_games(20)
+    assert all(5 <= len(moves) <= 9 for moves in games)
+    positions = [(_board_after(moves[:number]), moves[:number]) for moves in games for number in range(len(moves))]
+    groups = group_by_rule(positions)
+    assert len(groups['_first_turn']) == 20
+    assert sum(map(len, groups.values())) <= len(positions)
@@ -3,65 +3,212 @@ from pytest import mark
 from board.board import Board
 
 
+def _play(board, mark, cells):
+    return [board.move(mark, row, column) for row, column in cells]
+
+
 @mark.parametrize('mark', ('X', 'O'))
-def test_row(mark):
+@mark.parametrize('last', range(3))
+def test_row(mark, last):
     board = Board()
-    board._rows = [[' ', ' ', ' '],
-                   [mark, mark, mark],
-                   [' ', ' ', ' ']]
+    cells = [(1, column) for column in range(3)]
+    cells.append(cells.pop(last))
+    assert _play(board, mark, [(2, 0), (2, 2)]) == [False, False]
+    assert _play(board, mark, cells) == [False, False, True]
+    assert board.winner == mark
 
-    for column in range(3):
-        assert board._has_win_occurred(1, column)
-    assert not board._has_win_occurred(2, 0)
-    assert not board._has_win_occurred(2, 1)
-    assert not board._has_win_occurred(2, 2)
+
+@mark.parametrize('mark', ('X', 'O'))
+@mark.parametrize('last', range(3))
+def test_column(mark, last):
+    board = Board()
+    cells = [(row, 1) for row in range(3)]
+    cells.append(cells.pop(last))
+    assert _play(board, mark, [(1, 0), (2, 2)]) == [False, False]
+    assert _play(board, mark, cells) == [False, False, True]
+    assert board.winner == mark
+
+
+@mark.parametrize('mark', ('X', 'O'))
+@mark.parametrize('last', range(3))
+def test_main_diagonal(mark, last):
+    board = Board()
+    cells = [(row, row) for row in range(3)]
+    cells.append(cells.pop(last))
+    assert _play(board, mark, [(0, 2), (2, 1)]) == [False, False]
+    assert _play(board, mark, cells) == [False, False, True]
+    assert board.winner == mark
 
 
 @mark.parametrize('mark', ('X', 'O'))
-def test_column(mark):
+@mark.parametrize('last', range(3))
+def test_secondary_diagonal(mark, last):
     board = Board()
-    board._rows = [[' ', mark, ' '],
-                   [' ', mark, ' '],
-                   [' ', mark, ' ']]
+    cells = [(row, 2 - row) for row in range(3)]
+    cells.append(cells.pop(last))
+    assert _play(board, mark, [(1, 0), (2, 1)]) == [False, False]
+    assert _play(board, mark, cells) == [False, False, True]
+    assert board.winner == mark
 
-    for row in range(3):
-        assert board._has_win_occurred(row, 1)
-    assert not board._has_win_occurred(0, 2)
-    assert not board._has_win_occurred(2, 0)
-    assert not board._has_win_occurred(2, 2)
+
+def test_is_board_full():
+    board = Board()
+    board.set_position([['X', 'O', 'X'],
+                        ['O', 'X', 'O'],
+                        ['X', 'O', 'X']])
+    assert board.is_full()
+
+
+def test_is_board_not_full():
+    board = Board()
+    board.set_position([['X', 'O', 'X'],
+                        ['O', ' ', 'O'],
+                        ['X', 'O', 'X']])
+    assert not board.is_full()
+    assert board.is_cell_empty(1, 1)
+    assert not board.is_cell_empty(0, 0)
 
 
 @mark.parametrize('mark', ('X', 'O'))
-def test_main_diagonal(mark):
+def test_move(mark):
     board = Board()
-    board._rows = [[mark, ' ', ' '],
-                   [' ', mark, ' '],
-                   [' ', ' ', mark]]
+    assert not board.move(mark, 0, 0)
+    assert not board.move(mark, 1, 1)
+    assert board.bitboard(mark) == 0b000010001
+    assert board.move(mark, 2, 2)
+    assert board.occupied == 0b100010001
+    assert board.board == [[mark, ' ', ' '],
+                           [' ', mark, ' '],
+                           [' ', ' ', mark]]
+
 
-    for row in range(3):
-        assert board._has_win_occurred(row, row)
-    assert not board._has_win_occurred(0, 2)
-    assert not board._has_win_occurred(2, 0)
-    assert not board._has_win_occurred(2, 1)
+@mark.parametrize('mark', ('X', 'O'))
+def test_mnk_board(mark):
+    board = Board(6, 7, 4)
+    for column in range(3):
+        assert not board.move(mark, 5, column)
+    assert not board.move(mark, 4, 4)
+    assert board.move(mark, 5, 3)
+    assert board.number_of_moves == 5
+    assert not board.is_full()
 
 
 @mark.parametrize('mark', ('X', 'O'))
-def test_secondary_diagonal(mark):
+def test_mnk_diagonals(mark):
+    board = Board(5, 5, 4)
+    for row in range(1, 4):
+        assert not board.move(mark, row, 4 - row)
+    assert not board.move(mark, 0, 0)
+    assert board.move(mark, 4, 0)
+
+    board = Board(5, 5, 4)
+    for row in (0, 1, 3):
+        assert not board.move(mark, row, row + 1)
+    assert board.move(mark, 2, 3)
+
+
+def test_mnk_board_full():
+    board = Board(2, 4, 3)
+    for cell in range(8):
+        assert not board.move('XO'[cell % 4 in (1, 2)], *divmod(cell, 4))
+    assert board.is_full()
+
+
+def test_threats_and_open_lines():
     board = Board()
-    board._rows = [[' ', ' ', mark],
-                   [' ', mark, ' '],
-                   [mark, ' ', ' ']]
+    assert board.open_lines('X') == 8
+    board.move('X', 0, 0)
+    board.move('X', 0, 1)
+    assert board.threats('X') == [(0, 2)]
+    assert board.threats('O') == []
+    assert board.open_lines('X') == 8
+    assert board.open_lines('O') == 4
 
-    for row in range(3):
-        assert board._has_win_occurred(row, 2 - row)
-    assert not board._has_win_occurred(0, 0)
-    assert not board._has_win_occurred(2, 2)
-    assert not board._has_win_occurred(1, 0)
+    board.move('O', 0, 2)
+    assert board.threats('X') == []
+    assert board.open_lines('X') == 5
+    board.move('O', 1, 1)
+    assert board.threats('O') == [(2, 0)]
 
+    board.clear()
+    assert board.open_lines('O') == 8
+    assert board.threats('O') == []
 
-def test_is_board_full():
+
+def test_mnk_threats():
+    board = Board(19, 19, 5)
+    for column in range(5, 9):
+        board.move('X', 9, column)
+    assert board.threats('X') == [(9, 4), (9, 9)]
+    board.move('O', 9, 9)
+    assert board.threats('X') == [(9, 4)]
+
+
+def test_make_and_unmake_move():
     board = Board()
-    board._rows = [['X', 'O', 'X'],
-                   ['O', 'X', 'O'],
-                   ['X', 'O', 'X']]
+    board.make_move('X', 0, 0)
+    board.make_move('O', 1, 1)
+    board.make_move('X', 0, 1)
+    assert board.threats('X') == [(0, 2)]
+    assert board.make_move('X', 0, 2)
+    assert board.winner == 'X'
+
+    assert board.unmake_move() == ('X', 0, 2)
+    assert board.winner is None
+    assert board.threats('X') == [(0, 2)]
+    assert board.is_cell_empty(0, 2)
+
+    board.make_move('O', 0, 2)
+    assert board.threats('X') == []
+    assert board.open_lines('X') == 2
+    for _ in range(4):
+        board.unmake_move()
+    assert board.number_of_moves == 0
+    assert board.occupied == 0
+    assert board.open_lines('X') == board.open_lines('O') == 8
+
+
+@mark.parametrize('shape', ((3, 3, 3), (4, 5, 3), (5, 5, 4)))
+def test_unmake_move_restores_counters(shape):
+    number_of_rows, number_of_columns, _ = shape
+    cells = [divmod(cell * 7 % (number_of_rows * number_of_columns), number_of_columns)
+             for cell in range(number_of_rows * number_of_columns)]
+    board = Board(*shape)
+    for number, (row, column) in enumerate(cells):
+        board.make_move('XO'[number % 2], row, column)
+        position = Board(*shape)
+        position.set_position(board.board)
+        for mark in 'XO':
+            assert board.threats(mark) == position.threats(mark)
+            assert board.open_lines(mark) == position.open_lines(mark)
     assert board.is_full()
+
+    for number in reversed(range(len(cells))):
+        board.unmake_move()
+        assert not board.is_full()
+        position = Board(*shape)
+        position.set_position(board.board)
+        for mark in 'XO':
+            assert board.threats(mark) == position.threats(mark)
+            assert board.open_lines(mark) == position.open_lines(mark)
+
+
+def test_copy():
+    board = Board()
+    board.make_move('X', 1, 1)
+    copy = board.copy()
+    copy.make_move('O', 0, 0)
+    assert board.is_cell_empty(0, 0)
+    assert board.open_lines('X') == 8
+    assert copy.unmake_move() == ('O', 0, 0)
+    assert copy.unmake_move() == ('X', 1, 1)
+    assert board.number_of_moves == 1
+
+
+def test_legal_moves():
+    board = Board(2, 3, 2)
+    assert board.legal_moves() == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    board.move('X', 0, 1)
+    board.move('O', 1, 2)
+    assert board.legal_moves() == [(0, 0), (0, 2), (1, 0), (1, 1)]
+    assert board.representation().legal_moves() == board.legal_moves()
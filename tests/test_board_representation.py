@@ -0,0 +1,43 @@
+from board.board import Board
+
+
+def test_views_are_cached():
+    board = Board()
+    representation = board.representation()
+    assert representation.rows is representation.rows
+    assert representation.columns is representation.columns
+    assert representation.all_sequences_coordinates() is Board().representation().all_sequences_coordinates()
+
+
+def test_views_follow_the_board():
+    board = Board()
+    representation = board.representation()
+    rows, columns = representation.rows, representation.columns
+    board.move('X', 0, 2)
+    assert representation.rows is not rows
+    assert representation.rows == ((' ', ' ', 'X'), (' ', ' ', ' '), (' ', ' ', ' '))
+    assert representation.columns[2] == ('X', ' ', ' ')
+    assert representation.secondary_diagonal == ('X', ' ', ' ')
+    assert representation.main_diagonal == (' ', ' ', ' ')
+
+    board.clear()
+    assert representation.rows == ((' ', ' ', ' '),) * 3
+
+
+def test_sequences_coordinates():
+    sequences = Board().representation().all_sequences_coordinates()
+    assert len(sequences) == 8
+    assert sequences[0] == ((0, 0), (0, 1), (0, 2))
+    assert sequences[-1] == ((0, 2), (1, 1), (2, 0))
+    assert len(Board(5, 5, 4).representation().all_sequences_coordinates()) == 28
+
+
+def test_copy_board():
+    board = Board()
+    board.move('X', 1, 1)
+    copy = board.representation().copy_board()
+    copy.make_move('O', 0, 0)
+    assert board.is_cell_empty(0, 0)
+    assert copy.board == [['O', ' ', ' '],
+                          [' ', 'X', ' '],
+                          [' ', ' ', ' ']]
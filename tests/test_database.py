@@ -0,0 +1,90 @@
+from collections import Counter
+
+from pytest import fixture
+
+from board.board import Board
+from database import GameDatabase, Outcomes, build_indexes
+from players import AI, RandomComputer
+from records import RecordWriter, read_games
+from simulation import simulate
+
+
+@fixture(scope='module')
+def archive(tmp_path_factory):
+    path = tmp_path_factory.mktemp('database') / 'games.ttr'
+    with RecordWriter(path) as writer:
+        simulate(RandomComputer, RandomComputer, 2000, writer=writer)
+        simulate(AI, RandomComputer, 500, writer=writer)
+    build_indexes(path)
+    return path
+
+
+def _outcomes(games):
+    winners = Counter(winner for _, winner in games)
+    return Outcomes(winners['X'], winners['O'], winners[None])
+
+
+def test_game(archive):
+    games = list(read_games(archive))
+    with GameDatabase(archive) as database:
+        assert len(database) == 2500
+        assert [database.game(number) for number in range(len(database))] == games
+
+
+def test_opening(archive):
+    games = list(read_games(archive))
+    with GameDatabase(archive) as database:
+        assert database.opening(()) == _outcomes(games)
+        for opening in ((4,), (0, 1), (0, 1, 2), (8, 4, 0, 2)):
+            expected = [game for game in games if game[0][:len(opening)] == opening]
+            assert database.opening(opening) == _outcomes(expected)
+            numbers = database.opening_games(opening)
+            assert sorted(numbers) == [number for number, game in enumerate(games) if game in expected]
+        assert database.opening(tuple(range(9))).games == sum(game[0] == tuple(range(9)) for game in games)
+
+
+def test_corner_then_edge(archive):
+    games = list(read_games(archive))
+    with GameDatabase(archive) as database:
+        outcomes = [database.opening((corner, edge)) for corner in (0, 2, 6, 8) for edge in (1, 3, 5, 7)]
+    expected = [game for game in games if game[0][0] in (0, 2, 6, 8) and game[0][1] in (1, 3, 5, 7)]
+    assert sum(outcome.x_wins for outcome in outcomes) == _outcomes(expected).x_wins
+    assert sum(outcome.games for outcome in outcomes) == len(expected)
+
+
+def test_final_position(archive):
+    games = list(read_games(archive))
+    moves, winner = games[0]
+    board, mirrored = Board(), Board()
+    for number, cell in enumerate(moves):
+        row, column = divmod(cell, 3)
+        board.move('XO'[number % 2], row, column)
+        mirrored.move('XO'[number % 2], row, 2 - column)
+
+    with GameDatabase(archive) as database:
+        assert database.final_position(board) == database.final_position(mirrored)
+        outcomes = database.final_position(board)
+        numbers = sorted(database.final_position_games(board))
+    assert 0 in numbers
+    assert outcomes.games == len(numbers)
+    assert outcomes == _outcomes(games[number] for number in numbers)
+
+
+def test_empty_archive(tmp_path):
+    path = tmp_path / 'games.ttr'
+    RecordWriter(path).close()
+    build_indexes(path)
+    with GameDatabase(path) as database:
+        assert len(database) == 0
+        assert database.opening((4,)) == Outcomes(0, 0, 0)
+        assert database.final_position(Board()) == Outcomes(0, 0, 0)
+
+
+def test_games_outlive_database(archive):
+    database = GameDatabase(archive)
+    openings = database.opening_games((4,))
+    positions = database.final_position_games(Board())
+    expected = list(openings)
+    database.close()
+    assert list(openings) == expected
+    assert len(positions) == 0
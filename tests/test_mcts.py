@@ -0,0 +1,53 @@
+import random
+
+from board.board import Board
+from game import Game
+from players import MCTS, RandomComputer
+from simulation import simulate
+
+
+def test_strength():
+    random.seed(0)
+    assert simulate(RandomComputer, MCTS, 30).wins == 0
+
+
+def test_counters():
+    player = MCTS(Game.FIRST_PLAYER_MARK, iterations=200)
+    board = Board()
+    player.turn(board.representation())
+    assert player.reused_visits == 0
+    assert player._root.parent.visits == 200
+    assert player.expansions == 200
+    assert player.playouts <= 200
+    assert player.backpropagations >= 400
+
+
+def test_tree_reuse():
+    player = MCTS(Game.FIRST_PLAYER_MARK, iterations=500)
+    board = Board()
+    board.move(player.mark, *player.turn(board.representation()))
+    board.move(Game.SECOND_PLAYER_MARK, *next((row, column) for row in range(3) for column in range(3)
+                                               if board.is_cell_empty(row, column)))
+    player.turn(board.representation())
+    assert player.reused_visits > 0
+
+    board.clear()
+    player.turn(board.representation())
+    assert player.reused_visits == 0
+
+
+def test_win_on_larger_board():
+    player = MCTS(Game.FIRST_PLAYER_MARK, iterations=300)
+    board = Board(4, 4, 4)
+    for column in range(3):
+        board.move(Game.FIRST_PLAYER_MARK, 3, column)
+        board.move(Game.SECOND_PLAYER_MARK, column, 0 if column else 3)
+    assert player.turn(board.representation()) == (3, 3)
+
+
+def test_time_limit():
+    player = MCTS(Game.FIRST_PLAYER_MARK, iterations=None, time_limit=0.02)
+    board = Board(5, 5, 4)
+    row, column = player.turn(board.representation())
+    assert board.is_cell_empty(row, column)
+    assert player.expansions > 0
@@ -0,0 +1,19 @@
+from board.board import Board
+from players.move_table import best_moves
+
+
+def test_empty_board():
+    assert best_moves(0, 0) == tuple(range(9))
+
+
+def test_win_is_preferred():
+    # own: (0, 0), (0, 1); other: (1, 0), (1, 1)
+    assert best_moves(0b000000011, 0b000011000) == (2,)
+
+
+def test_unreachable_position():
+    assert best_moves(0b000000011, 0) is None
+
+
+def test_finished_position():
+    assert best_moves(0b000011000, Board.LINES[0]) is None
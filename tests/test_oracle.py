@@ -0,0 +1,61 @@
+import sys
+from array import array
+from io import BytesIO
+from pathlib import Path
+from subprocess import run as run_process
+
+from pytest import mark
+
+from oracle import INVALID, run
+from players import AI, RandomComputer
+
+POSITIONS = (b'.........', b'X........', b'XX.OO....', b'XOX.O....', b'XOXOXOOXO', b'XX.......', b'garbage',
+             b'XXXOO....', b'XXXOOO...', b'OOOXX.X..')
+
+
+def test_lines():
+    output = BytesIO()
+    run(BytesIO(b'\n'.join(POSITIONS) + b'\n'), output, AI)
+    answers = output.getvalue().decode().splitlines()
+    assert len(answers) == len(POSITIONS)
+    assert answers[1] == '5'
+    assert answers[2] == '3'
+    assert answers[3] == '8'
+    assert answers[4:] == ['0'] * 6
+
+
+def test_last_line_without_newline():
+    output = BytesIO()
+    run(BytesIO(b'XX.OO....\r\nXX.OO....'), output, AI)
+    assert output.getvalue() == b'3\n3\n'
+
+
+@mark.parametrize('player_type', (AI, RandomComputer))
+def test_frames(player_type):
+    positions = [0, 1, 1 | 1 << 13, 3 | 3 << 9, 0b101010101 | 0b010101010 << 9, 0b000000111 | 0b000011000 << 9]
+    output = BytesIO()
+    run(BytesIO(array('I', positions * 1000).tobytes()), output, player_type, binary=True)
+    answers = output.getvalue()
+    assert len(answers) == len(positions) * 1000
+    for index, cell in enumerate(answers):
+        position = positions[index % len(positions)]
+        if index % len(positions) >= 3:
+            assert cell == INVALID
+        else:
+            assert not (position | position >> 9) >> cell & 1
+
+
+@mark.parametrize('tail', (b'\x07', b'\x20\x20', b'\x09\x0a\x0d'))
+def test_truncated_frame(tail):
+    output = BytesIO()
+    run(BytesIO(array('I', [1]).tobytes() + tail), output, AI, binary=True)
+    answers = output.getvalue()
+    assert len(answers) == 2
+    assert answers[0] != INVALID
+    assert answers[1] == INVALID
+
+
+def test_command_line():
+    process = run_process([sys.executable, 'oracle.py', '--player', 'ai'], input=b'XX.OO....\n' * 3,
+                          capture_output=True, cwd=Path(__file__).parent.parent)
+    assert process.stdout == b'3\n3\n3\n'
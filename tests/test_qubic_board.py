@@ -0,0 +1,70 @@
+import random
+
+from pytest import mark
+
+from board.board import Board
+from board.qubic_board import CELL_LINES, LINES, QubicBoard
+from game import Game
+from players import MCTS, AlphaBeta, RandomComputer
+
+
+def _move(board, mark, layer, row, column):
+    return board.move(mark, layer * 4 + row, column)
+
+
+def test_lines():
+    assert len(LINES) == 76
+    assert len(set(LINES)) == 76
+    assert all(bin(line).count('1') == 4 for line in LINES)
+    assert sorted(len(lines) for lines in CELL_LINES) == [4] * 48 + [7] * 16
+
+
+@mark.parametrize('cells', (((0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 3)),  # space diagonal
+                            ((0, 2, 1), (1, 2, 1), (2, 2, 1), (3, 2, 1)),  # through the layers
+                            ((0, 3, 0), (1, 2, 0), (2, 1, 0), (3, 0, 0)),  # diagonal of a vertical plane
+                            ((2, 0, 3), (2, 1, 2), (2, 2, 1), (2, 3, 0))))  # diagonal of a layer
+def test_win(cells):
+    board = QubicBoard()
+    for cell in cells[:-1]:
+        assert not _move(board, 'X', *cell)
+        assert board.winner is None
+    assert _move(board, 'X', *cells[-1])
+    assert board.winner == 'X'
+
+
+def test_no_win():
+    board = QubicBoard()
+    for cell in ((0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 2)):
+        assert not _move(board, 'X', *cell)
+    assert board.threats('X') == [(15, 3)]
+
+
+def test_make_and_unmake_move():
+    random.seed(2)
+    board = QubicBoard()
+    for _ in range(30):
+        board.make_move(random.choice('XO'), *random.choice(board.legal_moves()))
+    copy = board.copy()
+    assert isinstance(copy, QubicBoard)
+    for _ in range(30):
+        board.unmake_move()
+    assert board.number_of_moves == 0
+    assert board.open_lines('X') == 76
+    assert copy.number_of_moves == 30
+
+
+def test_game():
+    random.seed(6)
+    game = Game(MCTS, RandomComputer, board=QubicBoard())
+    assert game.run() == Game.FIRST_PLAYER_MARK
+    assert len(game.board.representation().all_sequences_coordinates()) == 76
+
+
+def test_players_tell_qubic_from_plain_board():
+    search, tree = AlphaBeta(Game.FIRST_PLAYER_MARK, max_depth=1), MCTS(Game.FIRST_PLAYER_MARK, iterations=10)
+    for board, number_of_lines in ((QubicBoard(), 76), (Board(16, 4, 4), 16 + 4 * 13 + 2 * 13), (QubicBoard(), 76)):
+        representation = board.representation()
+        search.turn(representation)
+        tree.turn(representation)
+        assert len(search._lines) == number_of_lines
+        assert sum(map(len, tree._cell_lines)) == 4 * number_of_lines
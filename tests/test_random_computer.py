@@ -2,16 +2,36 @@ from pytest import mark
 
 from board.board import Board
 from players import RandomComputer
+from players.player import random_stream
 
 
 @mark.parametrize('mark', ('X', 'O'))
 def test_row(mark):
     board = Board()
-    board._rows = [[' ', ' ', ' '],
-                   [' ', mark, mark],
-                   [' ', mark, ' ']]
+    board.set_position([[' ', ' ', ' '],
+                        [' ', mark, mark],
+                        [' ', mark, ' ']])
 
     for _ in range(100):
         player = RandomComputer(mark)
         row, column = player.turn(board)
         assert board.is_cell_empty(row, column)
+
+
+@mark.parametrize('mark', ('X', 'O'))
+def test_turn_many(mark):
+    board = Board()
+    board.set_position([['X', 'O', 'X'],
+                        [' ', 'O', ' '],
+                        ['O', 'X', ' ']])
+    positions = [board.bitboard('X') | board.bitboard('O') << 9] * 100
+    assert set(RandomComputer(mark).turn_many(positions)) == {3, 5, 8}
+
+
+def test_injected_rng():
+    board = Board()
+    players = [RandomComputer('X', random_stream(5, 'X')) for _ in range(2)]
+    assert [players[0].turn(board) for _ in range(20)] == [players[1].turn(board) for _ in range(20)]
+    positions = [0] * 20
+    assert players[0].turn_many(positions) == players[1].turn_many(positions)
+    assert len(set(players[0].turn_many(positions))) > 1
@@ -0,0 +1,67 @@
+from itertools import cycle, permutations
+
+from pytest import mark, raises
+
+from board.board import Board
+from players import AI, RandomComputer
+from records import MAGIC, RECORD_SIZE, RecordWriter, decode, encode, read_games, read_records
+from simulation import simulate
+
+
+@mark.parametrize('moves,winner', (((), None),
+                                   ((4, 0, 8, 2, 1, 7, 6, 3, 5), None),
+                                   ((0, 3, 1, 4, 2), 'X'),
+                                   ((8, 7, 6, 5, 4, 3, 2, 1, 0), 'X'),
+                                   ((0, 4, 1, 2, 6, 3, 5, 8), 'O')))
+def test_encode_decode(moves, winner):
+    record = encode(moves, winner)
+    assert record < 1 << 8 * RECORD_SIZE
+    assert decode(record) == (moves, winner)
+
+
+def test_records_are_unique():
+    records = {encode(moves, None) for moves in permutations(range(9))}
+    assert len(records) == 362880
+
+
+def test_encode_illegal_moves():
+    with raises(ValueError):
+        encode((0, 0), None)
+    with raises(ValueError):
+        encode((9,), None)
+
+
+@mark.parametrize('chunk_size', (1, 7, 1 << 16))
+def test_write_and_read(tmp_path, chunk_size):
+    path = tmp_path / 'games.ttr'
+    with RecordWriter(path, buffer_size=10) as writer:
+        result = simulate(RandomComputer, AI, 100, writer=writer)
+    assert path.stat().st_size == len(MAGIC) + 100 * RECORD_SIZE
+
+    games = list(read_games(path, chunk_size))
+    assert len(games) == 100
+    assert sum(winner is None for _, winner in games) == result.draws
+    for moves, winner in games:
+        board = Board()
+        for mark, cell in zip(cycle('XO'), moves):
+            board.move(mark, *divmod(cell, 3))
+        assert board.winner == winner
+        assert winner is not None or board.is_full()
+
+
+def test_append(tmp_path):
+    path = tmp_path / 'games.ttr'
+    with RecordWriter(path) as writer:
+        writer.write((0, 3, 1, 4, 2), 'X')
+    with RecordWriter(path) as writer:
+        writer.write((4, 0, 8, 2, 1, 7, 6, 3, 5), None)
+    assert list(read_records(path)) == [encode((0, 3, 1, 4, 2), 'X'), encode((4, 0, 8, 2, 1, 7, 6, 3, 5), None)]
+
+
+def test_not_a_record_file(tmp_path):
+    path = tmp_path / 'games.txt'
+    path.write_bytes(b'hello world')
+    with raises(ValueError):
+        list(read_games(path))
+    with raises(ValueError):
+        RecordWriter(path)
@@ -0,0 +1,29 @@
+from board.board import Board
+from game import Game
+from players import AI
+from players.rule_stats import RuleStats
+
+
+def test_stats_disabled_by_default():
+    assert AI(Game.FIRST_PLAYER_MARK).stats is None
+
+
+def test_stats():
+    ai = AI(Game.FIRST_PLAYER_MARK)
+    ai.stats = RuleStats()
+    board = Board()
+    board.set_position([['X', ' ', 'X'],
+                        [' ', ' ', ' '],
+                        [' ', ' ', ' ']])
+    assert ai.turn(board.representation()) == (0, 1)
+    ai.turn(Board().representation())
+
+    snapshot = ai.stats.snapshot()
+    assert (snapshot['_perfect_play']['evaluated'], snapshot['_perfect_play']['fired']) == (2, 1)
+    assert snapshot['_first_turn']['evaluated'] == 1
+    assert snapshot['_win']['fired'] == 1
+    assert '_block' not in snapshot
+    assert all(rule['nanoseconds'] >= 0 for rule in snapshot.values())
+
+    ai.stats.reset()
+    assert ai.stats.snapshot() == {}
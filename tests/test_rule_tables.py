@@ -0,0 +1,20 @@
+from players.rule_tables import block_fork_cells, fork_cell
+
+
+def test_fork_cell():
+    # own: (0, 0), (1, 0)
+    assert fork_cell(0b000001001, 0) == 4
+    assert fork_cell(0, 0) is None
+
+
+def test_block_fork_cells():
+    # own: center; other: opposite corners
+    best, better, combos = block_fork_cells(0b000010000, 0b100000001)
+    assert set(best) == {2, 6}
+    assert better == ()
+    assert set(combos) == {1, 2, 3, 5, 6, 7}
+
+
+def test_block_fork_without_candidates():
+    # own: (0, 0), (0, 2), (1, 1), (2, 1); other: (0, 1), (1, 0), (1, 2), (2, 0), (2, 2)
+    assert block_fork_cells(0b010010101, 0b101101010) == ((), (), ())
@@ -0,0 +1,164 @@
+import asyncio
+
+from pytest import mark
+
+from server import EMPTY_CELL, Connection, serve
+
+
+async def _connect(server):
+    host, port = server.sockets[0].getsockname()[:2]
+    return await asyncio.open_connection(host, port)
+
+
+async def _send(writer, line):
+    writer.write(line.encode() + b'\n')
+    await writer.drain()
+
+
+async def _receive(reader):
+    return (await reader.readline()).decode().split()
+
+
+async def _play(reader, writer):
+    """Play the first empty cell of every turn, and return the lines of the moves and the end of the game."""
+    lines = list()
+    while True:
+        line = await _receive(reader)
+        if line[0] == 'TURN':
+            await _send(writer, f'MOVE {line[1].index(EMPTY_CELL) + 1}')
+        else:
+            lines.append(line)
+            if line[0] in ('END', 'ABORT'):
+                return lines
+
+
+def _run(test):
+    async def run():
+        server = await serve(port=0)
+        async with server:
+            return await test(server)
+    return asyncio.run(run())
+
+
+@mark.parametrize('players,mark', ((('remote', 'ai'), 'X'), (('ai', 'remote'), 'O')))
+def test_against_ai(players, mark):
+    async def test(server):
+        reader, writer = await _connect(server)
+        await _send(writer, f'NEW {players[0]} {players[1]}')
+        assert (await _receive(reader))[2] == mark
+        lines = await _play(reader, writer)
+        writer.close()
+        return lines
+
+    lines = _run(test)
+    assert lines[-1] in (['END', 'TIE'], ['END', 'X' if mark == 'O' else 'O'])
+    assert 5 <= len(lines) - 1 <= 9
+
+
+def test_two_clients():
+    async def test(server):
+        reader_x, writer_x = await _connect(server)
+        await _send(writer_x, 'NEW remote remote')
+        _, game, mark = await _receive(reader_x)
+        assert mark == 'X'
+
+        reader_o, writer_o = await _connect(server)
+        await _send(writer_o, f'JOIN {game}')
+        assert await _receive(reader_o) == ['GAME', game, 'O']
+
+        lines = await asyncio.gather(_play(reader_x, writer_x), _play(reader_o, writer_o))
+        writer_x.close()
+        writer_o.close()
+        return lines
+
+    lines_x, lines_o = _run(test)
+    assert lines_x == lines_o
+    assert lines_x == [['MOVE', 'X', '1'], ['MOVE', 'O', '2'], ['MOVE', 'X', '3'], ['MOVE', 'O', '4'],
+                       ['MOVE', 'X', '5'], ['MOVE', 'O', '6'], ['MOVE', 'X', '7'], ['END', 'X']]
+
+
+def test_invalid_commands():
+    async def test(server):
+        reader, writer = await _connect(server)
+        answers = list()
+        for line in ('MOVE 1', 'MOVE \u00b2', 'JOIN \u00b2', 'NEW remote chess', 'JOIN 1000', 'HELLO', 'NEW remote ai'):
+            await _send(writer, line)
+            answers.append((await _receive(reader))[0])
+        assert (await _receive(reader))[0] == 'TURN'
+        await _send(writer, 'MOVE 1')
+        assert await _receive(reader) == ['MOVE', 'X', '1']
+        writer.close()
+        return answers
+
+    assert _run(test) == ['ERROR', 'ERROR', 'ERROR', 'ERROR', 'ERROR', 'ERROR', 'GAME']
+
+
+def test_send_drains():
+    class Writer:
+        def __init__(self):
+            self.data, self.drains = b'', 0
+
+        def write(self, data):
+            self.data += data
+
+        async def drain(self):
+            self.drains += 1
+
+    writer = Writer()
+    asyncio.run(Connection(writer).send('TURN .........'))
+    assert (writer.data, writer.drains) == (b'TURN .........\n', 1)
+
+
+def test_illegal_move():
+    async def test(server):
+        reader, writer = await _connect(server)
+        await _send(writer, 'NEW remote ai')
+        await _receive(reader)
+        await _receive(reader)
+        await _send(writer, 'MOVE 5')
+        assert await _receive(reader) == ['MOVE', 'X', '5']
+        assert (await _receive(reader))[:2] == ['MOVE', 'O']
+        assert (await _receive(reader))[0] == 'TURN'
+        answers = list()
+        for line in ('MOVE 5', 'MOVE 10'):
+            await _send(writer, line)
+            answers.append(await _receive(reader))
+            assert (await _receive(reader))[0] == 'TURN'
+        writer.close()
+        return answers
+
+    assert _run(test) == [['ERROR', 'cell', '5', 'is', 'not', 'empty'], ['ERROR', 'cell', '10', 'is', 'out', 'of',
+                                                                          'bounds']]
+
+
+def test_disconnect_aborts_game():
+    async def test(server):
+        reader_x, writer_x = await _connect(server)
+        await _send(writer_x, 'NEW remote remote')
+        _, game, _ = await _receive(reader_x)
+        reader_o, writer_o = await _connect(server)
+        await _send(writer_o, f'JOIN {game}')
+        await _receive(reader_o)
+        assert (await _receive(reader_x))[0] == 'TURN'
+        writer_o.close()
+        line = await _receive(reader_x)
+        writer_x.close()
+        return line
+
+    assert _run(test) == ['ABORT']
+
+
+def test_concurrent_sessions():
+    async def session(server):
+        reader, writer = await _connect(server)
+        await _send(writer, 'NEW ai random')
+        lines = list()
+        while not lines or lines[-1][0] != 'END':
+            lines.append(await _receive(reader))
+        writer.close()
+        return lines[-1]
+
+    async def test(server):
+        return await asyncio.gather(*(session(server) for _ in range(200)))
+
+    assert all(end in (['END', 'X'], ['END', 'TIE']) for end in _run(test))
@@ -0,0 +1,33 @@
+from pytest import mark
+
+from players import AI, RandomComputer
+from records import RecordWriter, read_games
+from simulation import simulate
+
+
+@mark.parametrize('player_x_type,player_o_type', ((AI, RandomComputer), (RandomComputer, AI)))
+def test_simulate(player_x_type, player_o_type):
+    result = simulate(player_x_type, player_o_type, 100)
+    assert result.games == 100
+    assert sum(result.game_lengths.values()) == 100
+    assert all(5 <= length <= 9 for length in result.game_lengths)
+    if player_x_type is AI:
+        assert result.losses == 0
+    else:
+        assert result.wins == 0
+
+
+def test_simulate_no_output(capsys):
+    simulate(RandomComputer, RandomComputer, 10)
+    assert capsys.readouterr().out == ''
+
+
+@mark.parametrize('player_x_type,player_o_type', ((AI, RandomComputer), (RandomComputer, RandomComputer)))
+def test_replay_one_game(tmp_path, player_x_type, player_o_type):
+    with RecordWriter(tmp_path / 'all.ttr') as writer:
+        simulate(player_x_type, player_o_type, 50, writer, seed=3)
+    with RecordWriter(tmp_path / 'one.ttr') as writer:
+        simulate(player_x_type, player_o_type, 1, writer, seed=3, first_game=37)
+    games = list(read_games(tmp_path / 'all.ttr'))
+    assert len(set(games)) > 1
+    assert list(read_games(tmp_path / 'one.ttr')) == [games[37]]
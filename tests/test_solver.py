@@ -0,0 +1,88 @@
+from random import Random
+
+from pytest import mark, raises
+
+from board.board import Board
+from game import Game
+from players.move_table import best_moves
+from players.tablebase_player import WIN
+from solver import SharedTable, UPPER_BOUND, main, solve
+
+
+def _random_positions(number, seed):
+    random = Random(seed)
+    positions = list()
+    while len(positions) < number:
+        board, marks = Board(), (Game.FIRST_PLAYER_MARK, Game.SECOND_PLAYER_MARK)
+        for move in range(random.randrange(1, 7)):
+            if board.make_move(marks[move % 2], *random.choice(board.legal_moves())):
+                break
+        if board.winner is None:
+            positions.append(board)
+    return positions
+
+
+def test_classic_empty_board():
+    solution = solve(Board(), workers=1)
+    assert (solution.score, solution.outcome, solution.distance) == (0, 'draw', None)
+    assert solution.best_moves == [(row, column) for row in range(3) for column in range(3)]
+
+
+@mark.parametrize('split_depth', (1, 2))
+def test_classic_matches_move_table(split_depth):
+    for board in _random_positions(30, split_depth):
+        bitboard_x, bitboard_o = board.bitboard(Game.FIRST_PLAYER_MARK), board.bitboard(Game.SECOND_PLAYER_MARK)
+        if board.number_of_moves % 2:
+            expected = best_moves(bitboard_o, bitboard_x)
+        else:
+            expected = best_moves(bitboard_x, bitboard_o)
+        solution = solve(board, workers=1, split_depth=split_depth)
+        assert solution.best_moves == [divmod(cell, 3) for cell in expected]
+
+
+def test_win_distance():
+    board = Board()
+    board.set_position([['X', 'X', ' '],
+                        ['O', 'O', ' '],
+                        [' ', ' ', ' ']])
+    solution = solve(board, workers=1)
+    assert (solution.score, solution.outcome, solution.distance) == (WIN - 1, 'win', 1)
+    assert solution.best_moves == [(0, 2)]
+    assert solution.move_scores[2, 0] == 2 - WIN
+
+
+def test_workers_agree():
+    expected = solve(Board(3, 4, 3), workers=1)
+    solution = solve(Board(3, 4, 3), workers=2, split_depth=2)
+    assert expected.outcome == 'win'
+    assert solution.move_scores == expected.move_scores
+
+
+def test_finished_game():
+    board = Board()
+    board.set_position([['X', 'X', 'X'],
+                        ['O', 'O', ' '],
+                        [' ', ' ', ' ']])
+    with raises(ValueError):
+        solve(board, workers=1)
+    with raises(ValueError):
+        solve(Board(6, 5, 4), workers=1)
+    with raises(ValueError):
+        solve(Board(), workers=1, split_depth=0)
+
+
+def test_shared_table():
+    table = SharedTable(SharedTable.allocate(4))
+    assert table.get(5) is None
+    table.put(5, UPPER_BOUND, -7)
+    assert table.get(5) == (UPPER_BOUND, -7)
+    for key in range(100):
+        table.put(key, UPPER_BOUND, key % 50)
+    assert table.get(99) == (UPPER_BOUND, 49)
+
+
+def test_main(capsys):
+    assert main(['--rows', '3', '--columns', '3', '--win-length', '3', '--moves', '1', '2', '--workers', '1']) == 0
+    assert capsys.readouterr().out.startswith('win in 5 moves')
+    with raises(SystemExit):
+        main(['--rows', '3', '--columns', '3', '--win-length', '3', '--split-depth', '0'])
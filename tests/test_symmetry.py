@@ -0,0 +1,29 @@
+from itertools import product
+
+from pytest import mark
+
+from board.symmetry import TRANSFORMS, canonical, restore_cell, transform_bitboard, transform_cell
+
+
+@mark.parametrize('transform', range(len(TRANSFORMS)))
+def test_transform_is_permutation(transform):
+    assert sorted(TRANSFORMS[transform]) == list(range(9))
+    for cell in range(9):
+        assert restore_cell(transform_cell(cell, transform), transform) == cell
+        assert transform_bitboard(1 << cell, transform) == 1 << transform_cell(cell, transform)
+
+
+def test_corners_are_symmetrical():
+    corners = [canonical(1 << cell, 0) for cell in (0, 2, 6, 8)]
+    assert all(corner[:2] == corners[0][:2] for corner in corners)
+    assert canonical(1 << 4, 0)[:2] != corners[0][:2]
+
+
+@mark.parametrize('own,other', tuple(product((0b000000001, 0b000100010), (0b010000000, 0b100001000))))
+def test_canonical_transform(own, other):
+    canonical_own, canonical_other, transform = canonical(own, other)
+    assert transform_bitboard(own, transform) == canonical_own
+    assert transform_bitboard(other, transform) == canonical_other
+    for symmetrical in range(len(TRANSFORMS)):
+        assert canonical(transform_bitboard(own, symmetrical),
+                         transform_bitboard(other, symmetrical))[:2] == (canonical_own, canonical_other)
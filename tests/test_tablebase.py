@@ -0,0 +1,77 @@
+from itertools import product
+
+from pytest import fixture, importorskip, raises
+
+importorskip('numpy')
+
+import tablebase  # noqa: E402
+from board.board import Board  # noqa: E402
+from game import Game  # noqa: E402
+from players import RandomComputer  # noqa: E402
+from players.move_table import best_moves  # noqa: E402
+from players.tablebase_player import WIN, Tablebase, TablebasePlayer  # noqa: E402
+from tablebase import build_tablebase  # noqa: E402
+
+
+@fixture(scope='module')
+def classic(tmp_path_factory):
+    path = tmp_path_factory.mktemp('tablebase') / '3x3.ttb'
+    build_tablebase(path, 3, 3, 3)
+    with Tablebase(path) as tablebase:
+        yield tablebase
+
+
+def test_classic_matches_move_table(classic):
+    reachable = 0
+    for cells in product((0, 1, 2), repeat=9):
+        bitboard_x = sum(1 << cell for cell, content in enumerate(cells) if content == 1)
+        bitboard_o = sum(1 << cell for cell, content in enumerate(cells) if content == 2)
+        moves = classic.best_moves(bitboard_x, bitboard_o)
+        if cells.count(1) == cells.count(2):
+            expected = best_moves(bitboard_x, bitboard_o)
+        else:
+            expected = best_moves(bitboard_o, bitboard_x)
+        assert (moves or None) == expected
+        reachable += moves is not None
+    assert reachable == 5478
+
+
+def test_scores(classic):
+    assert classic.score(0, 0) == 0
+    assert classic.score(0b000000011, 0b000011000) == WIN - 1
+    assert classic.score(0b000000111, 0b000011000) == -WIN
+    assert classic.best_moves(0b000000111, 0b000011000) == ()
+    assert classic.best_moves(0b000000111, 0b000000000) is None
+
+
+def test_player(tmp_path):
+    path = tmp_path / '3x4.ttb'
+    build_tablebase(path, 3, 4, 3, work_directory=tmp_path)
+    TablebasePlayer.tablebase = Tablebase(path)
+    try:
+        for _ in range(20):
+            game = Game(TablebasePlayer, RandomComputer, board=Board(3, 4, 3))
+            assert game.run() == Game.FIRST_PLAYER_MARK
+        with raises(ValueError):
+            TablebasePlayer(Game.FIRST_PLAYER_MARK).turn(Board().representation())
+    finally:
+        TablebasePlayer.tablebase.close()
+        TablebasePlayer.tablebase = None
+
+
+def test_work_directory(tmp_path, monkeypatch):
+    expected = tmp_path / 'expected.ttb'
+    build_tablebase(expected, 3, 3, 3)
+    monkeypatch.setattr(tablebase, 'CHUNK_SIZE', 100)  # many runs to merge in every layer
+    path, work_directory = tmp_path / '3x3.ttb', tmp_path / 'work' / 'layers'
+    build_tablebase(path, 3, 3, 3, work_directory=work_directory)
+    assert path.read_bytes() == expected.read_bytes()
+    assert work_directory.is_dir()
+    assert not any(work_directory.iterdir())
+
+
+def test_not_a_tablebase(tmp_path):
+    path = tmp_path / 'empty.ttb'
+    path.write_bytes(bytes(16))
+    with raises(ValueError):
+        Tablebase(path)
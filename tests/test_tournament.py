@@ -0,0 +1,18 @@
+from pytest import mark
+
+from players import AI, RandomComputer
+from tournament import run_tournament
+
+
+def test_tournament_games():
+    result = run_tournament(RandomComputer, AI, 2500, workers=2)
+    assert result.games == 2500
+    assert result.wins == 0
+
+
+@mark.parametrize('workers', (1, 3))
+def test_same_seed_same_results(workers):
+    expected = run_tournament(RandomComputer, RandomComputer, 2500, workers=2, seed=7)
+    result = run_tournament(RandomComputer, RandomComputer, 2500, workers=workers, seed=7)
+    assert (result.wins, result.draws, result.losses) == (expected.wins, expected.draws, expected.losses)
+    assert result.game_lengths == expected.game_lengths
@@ -0,0 +1,107 @@
+import random
+from functools import partial
+
+from pytest import raises
+
+from board.ultimate_board import UltimateBoard
+from game import Game
+from players import AI, AlphaBeta, MCTS, RandomComputer
+
+
+def _state(board):
+    return board.board, board.target, board.finished, board.macro_board.board, board.winner, board.number_of_moves
+
+
+def test_send_to_board():
+    board = UltimateBoard()
+    assert len(board.legal_moves()) == 81
+    board.move('X', 0, 4)  # the top edge of the top middle board
+    assert board.target == 1
+    assert sorted(board.legal_moves()) == [(row, column) for row in range(3) for column in range(3, 6) if
+                                           (row, column) != (0, 4)]
+    with raises(ValueError):
+        board.move('O', 4, 4)
+    with raises(ValueError):
+        board.move('O', 0, 4)
+
+
+def test_finished_boards():
+    random.seed(3)
+    sent_anywhere = 0
+    for _ in range(50):
+        board, player = UltimateBoard(), 'X'
+        while not board.is_full():
+            row, column = random.choice(board.legal_moves())
+            board.move(player, row, column)
+            player = 'O' if player == 'X' else 'X'
+
+            for index, small_board in enumerate(board.boards):
+                finished = small_board.winner is not None or small_board.is_full()
+                assert bool(board.finished >> index & 1) == finished
+                assert board.macro_board.board[index // 3][index % 3] == (small_board.winner or ' ')
+            sent_to = row % 3 * 3 + column % 3
+            if board.finished >> sent_to & 1:
+                sent_anywhere += 1
+                assert board.target is None
+                assert {row // 3 * 3 + column // 3 for row, column in board.legal_moves()} == {
+                    index for index in range(9) if not board.finished >> index & 1} or board.winner
+            else:
+                assert board.target == sent_to
+    assert sent_anywhere > 0
+
+
+def test_make_and_unmake_move():
+    random.seed(4)
+    for _ in range(50):
+        board = UltimateBoard()
+        states, player = list(), 'X'
+        while not board.is_full():
+            states.append(_state(board))
+            board.make_move(player, *random.choice(board.legal_moves()))
+            player = 'O' if player == 'X' else 'X'
+        copy = board.copy()
+        while states:
+            board.unmake_move()
+            assert _state(board) == states.pop()
+        assert copy.number_of_moves > 0 and board.number_of_moves == 0
+
+
+def test_game():
+    random.seed(5)
+    game = Game(RandomComputer, RandomComputer, board=UltimateBoard())
+    winners = set()
+    for _ in range(100):
+        game.reset()
+        winner = game.run()
+        assert winner == game.board.winner
+        assert game.board.is_full()
+        winners.add(winner)
+    assert winners == {'X', 'O', None}
+
+
+def test_search_players():
+    random.seed(6)
+    for first, second in ((partial(MCTS, iterations=30), partial(AlphaBeta, max_depth=2)),
+                          (partial(AlphaBeta, max_depth=1), partial(MCTS, iterations=30)),
+                          (AI, RandomComputer)):
+        game = Game(first, second, board=UltimateBoard())
+        winner = game.run()
+        assert winner == game.board.winner
+        assert game.board.is_full()
+
+
+def test_search_players_win():
+    random.seed(7)
+    positions = 0
+    while positions < 10:
+        board, player = UltimateBoard(), 'X'
+        while not board.make_move(player, *random.choice(board.legal_moves())) and not board.is_full():
+            player = 'O' if player == 'X' else 'X'
+        if board.winner is None:
+            continue
+        board.unmake_move()
+        positions += 1
+        for search_player in (AlphaBeta(player, max_depth=1), AI(player)):
+            row, column = search_player.turn(board.representation())
+            assert board.make_move(player, row, column)
+            board.unmake_move()
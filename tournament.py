@@ -0,0 +1,65 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from time import perf_counter
+
+from simulation import SimulationResult, simulate
+
+CHUNK_SIZE = 1000
+
+
+def run_tournament(player_x_type, player_o_type, n_games, workers=None, seed=0):
+    """
+    Play games between two types of players on several processes.
+
+    The games are split into chunks of :data:`CHUNK_SIZE` games, and every player of every game makes its choices with
+    its own random stream, derived from :seed:, the game's number and the player's mark (see :func:`simulate`). Since
+    the streams depend on neither the chunks nor the workers, the same seed always gives the same results, no matter
+    how many workers play them, and any game can be replayed alone.
+
+    :param player_x_type: type of the first player (player x)
+    :type player_x_type: Player
+    :param player_o_type: type of the second player (player o)
+    :type player_o_type: Player
+    :param n_games: number of games to play
+    :type n_games: int
+    :param workers: number of worker processes, the number of CPUs by default
+    :type workers: int
+    :param seed: seed of the random generators of the players
+    :type seed: int
+    :return: the aggregated results of the games
+    :rtype: SimulationResult
+    """
+    chunks = [(player_x_type, player_o_type, min(CHUNK_SIZE, n_games - start), seed, start)
+              for start in range(0, n_games, CHUNK_SIZE)]
+    workers = workers or cpu_count() or 1
+    result = SimulationResult()
+    start = perf_counter()
+    if workers == 1:
+        for chunk in chunks:
+            result.merge(_play_chunk(*chunk))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk_result in executor.map(_play_chunk, *zip(*chunks)):
+                result.merge(chunk_result)
+    result.elapsed = perf_counter() - start
+    return result
+
+
+def _play_chunk(player_x_type, player_o_type, n_games, seed, first_game):
+    """
+    Play one chunk of games in a worker.
+
+    :param player_x_type: type of the first player (player x)
+    :type player_x_type: Player
+    :param player_o_type: type of the second player (player o)
+    :type player_o_type: Player
+    :param n_games: number of games to play
+    :type n_games: int
+    :param seed: seed of the tournament
+    :type seed: int
+    :param first_game: number of the first game of the chunk
+    :type first_game: int
+    :return: results of the chunk
+    :rtype: SimulationResult
+    """
+    return simulate(player_x_type, player_o_type, n_games, seed=seed, first_game=first_game)